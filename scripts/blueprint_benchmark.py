@@ -0,0 +1,353 @@
+"""Measure blueprint generation throughput and failure rates per stage.
+
+Every (stage, seed) job replays the same seeded retry loop gameplay uses
+(`generate_random_blueprint` + `validate_connectivity`, up to
+`BLUEPRINT_MAX_ATTEMPTS` attempts) in a spawn-based process pool, and reports
+blueprints per second, the attempt-count distribution, `MapGenerationError`
+and connectivity rejection rates, and how time splits across the
+`_place_walls_*` algorithms and the BFS validators.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+# Timed validators; nested calls are reported inside their caller's total.
+_VALIDATOR_NAMES = (
+    "validate_car_connectivity",
+    "validate_humanoid_objective_connectivity",
+    "_reachable_mask",
+    "_coreachable_mask",
+)
+_BFS_NAMES = ("_reachable_mask", "_coreachable_mask")
+_GENERATE = "generate_random_blueprint"
+_VALIDATE = "validate_connectivity"
+
+_TIMINGS: dict[str, float] = defaultdict(float)
+_CALLS: Counter[str] = Counter()
+
+
+@dataclass
+class StageReport:
+    stage_id: str
+    wall_algorithm: str
+    seeds: int = 0
+    blueprints: int = 0
+    exhausted: int = 0
+    attempts: int = 0
+    generation_errors: int = 0
+    connectivity_rejections: int = 0
+    elapsed: float = 0.0
+    attempt_histogram: Counter[int] = field(default_factory=Counter)
+    timings: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    calls: Counter[str] = field(default_factory=Counter)
+
+    def merge(self, other: StageReport) -> None:
+        self.seeds += other.seeds
+        self.blueprints += other.blueprints
+        self.exhausted += other.exhausted
+        self.attempts += other.attempts
+        self.generation_errors += other.generation_errors
+        self.connectivity_rejections += other.connectivity_rejections
+        self.elapsed += other.elapsed
+        self.attempt_histogram.update(other.attempt_histogram)
+        for name, seconds in other.timings.items():
+            self.timings[name] += seconds
+        self.calls.update(other.calls)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "stage_id": self.stage_id,
+            "wall_algorithm": self.wall_algorithm,
+            "seeds": self.seeds,
+            "blueprints": self.blueprints,
+            "exhausted": self.exhausted,
+            "attempts": self.attempts,
+            "generation_errors": self.generation_errors,
+            "connectivity_rejections": self.connectivity_rejections,
+            "elapsed_s": self.elapsed,
+            "attempt_histogram": {
+                str(k): v for k, v in sorted(self.attempt_histogram.items())
+            },
+            "timings_s": dict(sorted(self.timings.items())),
+            "calls": dict(sorted(self.calls.items())),
+        }
+
+
+def _timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _TIMINGS[name] += time.perf_counter() - start
+            _CALLS[name] += 1
+
+    return wrapper
+
+
+@contextmanager
+def _instrumented() -> Iterator[None]:
+    """Wrap wall placers and validators with timers for the duration.
+
+    The originals are restored on exit, so an in-process run (`workers=1`)
+    leaves `level_blueprints` exactly as it found it.
+    """
+    from zombie_escape import level_blueprints
+
+    # generate_random_blueprint dispatches through the table, not module globals.
+    algorithms = dict(level_blueprints.WALL_ALGORITHMS)
+    validators = {name: getattr(level_blueprints, name) for name in _VALIDATOR_NAMES}
+    for algo, func in algorithms.items():
+        level_blueprints.WALL_ALGORITHMS[algo] = _timed(func.__name__, func)
+    for name, func in validators.items():
+        setattr(level_blueprints, name, _timed(name, func))
+    try:
+        yield
+    finally:
+        level_blueprints.WALL_ALGORITHMS.update(algorithms)
+        for name, func in validators.items():
+            setattr(level_blueprints, name, func)
+
+
+def _run_stage_seeds(
+    stage_id: str, seeds: list[int], config: dict[str, Any]
+) -> StageReport:
+    """Worker entry: run the seeded retry loop for `seeds` of one stage."""
+    with _instrumented():
+        return _run_instrumented_stage_seeds(stage_id, seeds, config)
+
+
+def _run_instrumented_stage_seeds(
+    stage_id: str, seeds: list[int], config: dict[str, Any]
+) -> StageReport:
+    from zombie_escape import level_blueprints
+    from zombie_escape.gameplay.layout import (
+        BLUEPRINT_MAX_ATTEMPTS,
+        blueprint_generation_kwargs,
+    )
+    from zombie_escape.rng import seed_rng
+    from zombie_escape.stage_constants import STAGES
+
+    stage = STAGES.get(stage_id)
+    generator_kwargs, validation_kwargs = blueprint_generation_kwargs(stage, config)
+    report = StageReport(stage_id=stage_id, wall_algorithm=stage.wall_algorithm)
+    _TIMINGS.clear()
+    _CALLS.clear()
+    start = time.perf_counter()
+    for seed in seeds:
+        report.seeds += 1
+        for attempt in range(BLUEPRINT_MAX_ATTEMPTS):
+            report.attempts += 1
+            seed_rng(seed + attempt, stream="layout")
+            gen_start = time.perf_counter()
+            try:
+                blueprint = level_blueprints.generate_random_blueprint(
+                    **generator_kwargs
+                )
+            except level_blueprints.MapGenerationError:
+                report.generation_errors += 1
+                continue
+            finally:
+                _TIMINGS[_GENERATE] += time.perf_counter() - gen_start
+                _CALLS[_GENERATE] += 1
+            val_start = time.perf_counter()
+            car_reachable = level_blueprints.validate_connectivity(
+                blueprint.grid, **validation_kwargs
+            )
+            _TIMINGS[_VALIDATE] += time.perf_counter() - val_start
+            _CALLS[_VALIDATE] += 1
+            if car_reachable is None:
+                report.connectivity_rejections += 1
+                continue
+            report.blueprints += 1
+            report.attempt_histogram[attempt + 1] += 1
+            break
+        else:
+            report.exhausted += 1
+    report.elapsed = time.perf_counter() - start
+    report.timings.update(_TIMINGS)
+    report.calls.update(_CALLS)
+    return report
+
+
+def _chunks(seeds: list[int], size: int) -> Iterable[list[int]]:
+    for index in range(0, len(seeds), size):
+        yield seeds[index : index + size]
+
+
+def run_benchmark(
+    stage_ids: list[str],
+    *,
+    seeds: int,
+    first_seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = 8,
+    config: dict[str, Any] | None = None,
+) -> tuple[list[StageReport], float]:
+    """Return per-stage reports and the wall-clock time of the whole run."""
+    if config is None:
+        from zombie_escape.config import DEFAULT_CONFIG
+
+        config = DEFAULT_CONFIG
+    seed_list = list(range(first_seed, first_seed + seeds))
+    jobs = [
+        (stage_id, chunk)
+        for stage_id in stage_ids
+        for chunk in _chunks(seed_list, max(1, chunk_size))
+    ]
+    reports: dict[str, StageReport] = {}
+    start = time.perf_counter()
+    if workers <= 1:
+        results = [_run_stage_seeds(stage_id, chunk, config) for stage_id, chunk in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(_run_stage_seeds, stage_id, chunk, config)
+                for stage_id, chunk in jobs
+            ]
+            results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - start
+    for result in results:
+        existing = reports.get(result.stage_id)
+        if existing is None:
+            reports[result.stage_id] = result
+        else:
+            existing.merge(result)
+    return [reports[stage_id] for stage_id in stage_ids if stage_id in reports], wall_time
+
+
+def _percent(part: float, whole: float) -> str:
+    return f"{100.0 * part / whole:5.1f}%" if whole > 0 else "  n/a"
+
+
+def _format_report(report: StageReport) -> list[str]:
+    attempts = max(1, report.attempts)
+    lines = [
+        f"{report.stage_id} ({report.wall_algorithm}): "
+        f"{report.blueprints}/{report.seeds} blueprints, "
+        f"{report.blueprints / report.elapsed if report.elapsed else 0.0:.1f}/s cpu, "
+        f"{report.attempts / max(1, report.seeds):.2f} attempts/seed",
+        f"  MapGenerationError {report.generation_errors} "
+        f"({_percent(report.generation_errors, attempts)} of attempts), "
+        f"connectivity rejected {report.connectivity_rejections} "
+        f"({_percent(report.connectivity_rejections, attempts)}), "
+        f"exhausted {report.exhausted}",
+        "  attempts histogram: "
+        + ", ".join(f"{k}:{v}" for k, v in sorted(report.attempt_histogram.items())),
+    ]
+    total = report.timings.get(_GENERATE, 0.0) + report.timings.get(_VALIDATE, 0.0)
+    for name in (_GENERATE, _VALIDATE):
+        lines.append(
+            f"  {name:<42} {report.timings.get(name, 0.0) * 1000:9.1f} ms "
+            f"{_percent(report.timings.get(name, 0.0), total)}"
+        )
+        children = (
+            sorted(n for n in report.timings if n.startswith("_place_walls_"))
+            if name == _GENERATE
+            else [n for n in _VALIDATOR_NAMES if n in report.timings]
+        )
+        for child in children:
+            # BFS sweeps are nested inside the validators above them.
+            indent = "      " if child in _BFS_NAMES else "    "
+            lines.append(
+                f"{indent}{child:<{44 - len(indent)}} "
+                f"{report.timings[child] * 1000:9.1f} ms "
+                f"{_percent(report.timings[child], total)} "
+                f"({report.calls[child]} calls)"
+            )
+    return lines
+
+
+def _resolve_stage_ids(requested: list[str] | None) -> list[str]:
+    from zombie_escape.stage_constants import STAGES
+
+    if not requested:
+        return STAGES.ids(available_only=True)
+    unknown = [stage_id for stage_id in requested if stage_id not in STAGES]
+    if unknown:
+        raise SystemExit(f"Unknown stage id(s): {', '.join(unknown)}")
+    return requested
+
+
+def _default_workers() -> int:
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("stages", nargs="*", help="Stage ids (default: available stages)")
+    parser.add_argument("--seeds", type=int, default=32, help="Seeds per stage")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_default_workers(),
+        help="Process pool size (1 runs in-process)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=8, help="Seeds per pool job"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    stage_ids = _resolve_stage_ids(args.stages)
+    reports, wall_time = run_benchmark(
+        stage_ids,
+        seeds=max(1, args.seeds),
+        first_seed=args.first_seed,
+        workers=max(1, args.workers),
+        chunk_size=args.chunk_size,
+    )
+    blueprints = sum(report.blueprints for report in reports)
+    attempts = sum(report.attempts for report in reports)
+    failures = sum(
+        report.generation_errors + report.connectivity_rejections for report in reports
+    )
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "wall_time_s": wall_time,
+                    "workers": args.workers,
+                    "blueprints_per_s": blueprints / wall_time if wall_time else 0.0,
+                    "stages": [report.to_json() for report in reports],
+                },
+                indent=2,
+            )
+        )
+        return 0
+    for report in reports:
+        print("\n".join(_format_report(report)))
+    print(
+        f"total: {blueprints} blueprints in {wall_time:.2f}s "
+        f"({blueprints / wall_time if wall_time else 0.0:.1f}/s, "
+        f"{args.workers} workers), failed attempts "
+        f"{failures}/{attempts} ({_percent(failures, max(1, attempts)).strip()})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+
+DEFAULT_TARGET = "zombie_escape.zombie_escape"
+DEFAULT_BUDGET_MS = 400.0
+# Modules that must stay out of the cold-start path (loaded once a screen
+# or stage actually needs them).
+DEFERRED_MODULES = (
+    "numpy",
+    "zombie_escape.entities",
+    "zombie_escape.gameplay",
+    "zombie_escape.localization",
+    "zombie_escape.models",
+    "zombie_escape.render.core",
+    "zombie_escape.screens.gameplay",
+    "zombie_escape.screens.title",
+    "zombie_escape.stage_constants",
+)
+
+
+def measure_imports(target: str = DEFAULT_TARGET) -> dict[str, int]:
+    """Return cumulative import time (microseconds) per module for `target`."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(SRC_ROOT), *filter(None, [env.get("PYTHONPATH")])]
+    )
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        try:
+            timings[name.strip()] = int(cumulative.strip())
+        except ValueError:
+            continue  # header row
+    return timings
+
+
+def deferred_modules_loaded(timings: dict[str, int]) -> list[str]:
+    return sorted(
+        name
+        for name in timings
+        if any(name == mod or name.startswith(f"{mod}.") for mod in DEFERRED_MODULES)
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check the cold-start import cost of zombie_escape."
+    )
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    timings = measure_imports(args.target)
+    total_ms = timings.get(args.target, 0) / 1000.0
+    for name, micros in sorted(timings.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"{micros / 1000.0:8.1f} ms  {name}")
+    print(f"total: {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    loaded = deferred_modules_loaded(timings)
+    if loaded:
+        print("deferred modules imported at startup: " + ", ".join(loaded))
+        failed = True
+    if total_ms > args.budget_ms:
+        print("import time budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
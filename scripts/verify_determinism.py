@@ -0,0 +1,172 @@
+"""Check that a stage simulates identically across runs of the same seed.
+
+`record` plays a stage headless with a scripted input pattern and writes a
+state digest log (the same format as `--digest-every` in the game).
+`compare` reports the first checkpoint where two logs disagree and which
+subsystems changed. With only stage ids, each stage is recorded twice in
+separate processes (so memory addresses and hash seeds differ) and compared.
+
+    python scripts/verify_determinism.py stage1 stage22 --seed 4242
+    python scripts/verify_determinism.py record stage5 -o before.jsonl
+    python scripts/verify_determinism.py compare before.jsonl after.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+class _ScriptedInput:
+    """Input snapshot that steers in a slow circle and never presses buttons."""
+
+    def __init__(self) -> None:
+        self.move_vector = (0.0, 0.0)
+
+    def advance(self, tick: int) -> None:
+        angle = tick / 90.0
+        self.move_vector = (math.cos(angle), math.sin(angle))
+
+    def held(self, action: object) -> bool:
+        return False
+
+    def pressed(self, action: object) -> bool:
+        return False
+
+    def shortcut_pressed(self, action: object) -> bool:
+        return False
+
+
+def record(stage_id: str, seed: int, ticks: int, interval: int, output: Path) -> int:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    from zombie_escape.config import DEFAULT_CONFIG
+    from zombie_escape.gameplay.digest import StateDigestRecorder
+    from zombie_escape.render_constants import build_render_assets
+    from zombie_escape.screen_constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+    from zombie_escape.screens.gameplay import GameplayScreenRunner
+    from zombie_escape.stage_constants import STAGES
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    stage = STAGES.get(stage_id)
+    if stage is None:
+        raise SystemExit(f"Unknown stage: {stage_id}")
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert_alpha()
+    runner = GameplayScreenRunner(
+        screen=screen,
+        clock=pygame.time.Clock(),
+        config=copy.deepcopy(DEFAULT_CONFIG),
+        fps=FPS,
+        stage=stage,
+        show_pause_overlay=False,
+        seed=seed,
+        render_assets=build_render_assets(stage.cell_size),
+    )
+    if runner._setup_game() is not None:
+        raise SystemExit(f"{stage_id}: level setup failed")
+    game_data = runner.game_data
+    state = game_data.state
+    scripted = _ScriptedInput()
+    with output.open("w", encoding="utf-8") as stream:
+        recorder = StateDigestRecorder(stream, interval=interval)
+        recorder.write_header(stage=stage_id, seed=state.seed, interval=interval)
+        for tick in range(1, ticks + 1):
+            scripted.advance(tick)
+            runner._update_world(runner._next_step_ms() / 1000.0, scripted)
+            recorder.record(tick, game_data)
+            if state.game_over or state.game_won:
+                break
+    return tick
+
+
+def compare(expected_path: Path, actual_path: Path, *, label: str = "") -> bool:
+    from zombie_escape.gameplay.digest import find_first_divergence, read_digest_log
+
+    expected_header, expected = read_digest_log(expected_path)
+    actual_header, actual = read_digest_log(actual_path)
+    prefix = f"{label}: " if label else ""
+    if expected_header != actual_header:
+        print(f"{prefix}headers differ: {expected_header} vs {actual_header}")
+    divergence = find_first_divergence(expected, actual)
+    shared = len(expected.keys() & actual.keys())
+    if divergence is None:
+        print(f"{prefix}OK, {shared} checkpoints match")
+        return True
+    subsystems = ", ".join(divergence.subsystems)
+    print(f"{prefix}DIVERGED at frame {divergence.frame}: {subsystems}")
+    return False
+
+
+def _verify_stages(args: argparse.Namespace) -> bool:
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for stage_id in args.stages:
+            paths = [Path(tmp) / f"{stage_id}_{run}.jsonl" for run in (1, 2)]
+            for path in paths:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "record",
+                        stage_id,
+                        "--seed",
+                        str(args.seed),
+                        "--ticks",
+                        str(args.ticks),
+                        "--every",
+                        str(args.every),
+                        "-o",
+                        str(path),
+                    ],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                )
+            ok = compare(*paths, label=stage_id) and ok
+    return ok
+
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seed", type=int, default=4242)
+    parser.add_argument("--ticks", type=int, default=1200)
+    parser.add_argument("--every", type=int, default=10, help="Digest interval")
+
+
+def main(argv: list[str]) -> int:
+    if argv and argv[0] in {"record", "compare"}:
+        parser = argparse.ArgumentParser(description=__doc__)
+        commands = parser.add_subparsers(dest="command", required=True)
+        record_parser = commands.add_parser("record")
+        record_parser.add_argument("stage")
+        record_parser.add_argument("-o", "--output", type=Path, required=True)
+        _add_run_options(record_parser)
+        compare_parser = commands.add_parser("compare")
+        compare_parser.add_argument("expected", type=Path)
+        compare_parser.add_argument("actual", type=Path)
+        args = parser.parse_args(argv)
+        if args.command == "record":
+            record(args.stage, args.seed, args.ticks, args.every, args.output)
+            return 0
+        return 0 if compare(args.expected, args.actual) else 1
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("stages", nargs="+")
+    _add_run_options(parser)
+    return 0 if _verify_stages(parser.parse_args(argv)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
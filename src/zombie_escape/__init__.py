@@ -2,6 +2,32 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .zombie_escape import main as main
+from __future__ import annotations
 
-__all__ = ["main"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from .localization import get_language, set_language, translate
+    from .zombie_escape import main as main
+
+# Defer the game entry point and the locale tables so `import zombie_escape`
+# stays cheap.
+_LAZY_EXPORTS = {
+    "main": ".zombie_escape",
+    "get_language": ".localization",
+    "set_language": ".localization",
+    "translate": ".localization",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["main", "get_language", "set_language", "translate"]
@@ -0,0 +1,173 @@
+"""Content-addressed on-disk cache of validated level blueprints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from enum import Enum
+from importlib import resources
+from pathlib import Path
+from typing import Any, Mapping
+
+from platformdirs import user_data_dir
+
+from .config import APP_NAME
+from .level_blueprints import Blueprint
+
+try:
+    from .__about__ import __version__
+except Exception:  # pragma: no cover - fallback version
+    __version__ = "0.0.0-unknown"
+
+BLUEPRINT_CACHE_FORMAT_VERSION = 1
+BLUEPRINT_CACHE_MAX_ENTRIES = 256
+# Generator sources; editing them changes the key so stale layouts are never reused.
+_GENERATOR_SOURCES = ("level_blueprints.py", "gameplay/layout.py", "rng.py")
+
+_cache_dir: Path | None = None
+_generator_version: str | None = None
+
+RngState = tuple[tuple[int, ...], int, int | None]
+
+
+def default_blueprint_cache_dir() -> Path:
+    override = os.environ.get("ZOMBIE_ESCAPE_BLUEPRINT_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(user_data_dir(APP_NAME, APP_NAME)) / "blueprints"
+
+
+def enable_blueprint_cache(directory: Path | None = None) -> Path:
+    """Turn the cache on for this process (off by default, e.g. in tests)."""
+    global _cache_dir
+    _cache_dir = directory or default_blueprint_cache_dir()
+    return _cache_dir
+
+
+def disable_blueprint_cache() -> None:
+    global _cache_dir
+    _cache_dir = None
+
+
+def _generator_fingerprint() -> str:
+    global _generator_version
+    if _generator_version is None:
+        digest = hashlib.sha1(__version__.encode("utf-8"))
+        package_root = resources.files("zombie_escape")
+        for name in _GENERATOR_SOURCES:
+            digest.update(name.encode("utf-8"))
+            digest.update(package_root.joinpath(name).read_bytes())
+        _generator_version = digest.hexdigest()
+    return _generator_version
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, Mapping):
+        return sorted(
+            ([_canonical(k), _canonical(v)] for k, v in value.items()), key=repr
+        )
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float):
+        return repr(value)
+    return value
+
+
+def blueprint_cache_key(seed: int, params: Mapping[str, Any]) -> str | None:
+    """Return the content address for (generator, seed, params), if enabled."""
+    if _cache_dir is None:
+        return None
+    payload = json.dumps(
+        {
+            "format": BLUEPRINT_CACHE_FORMAT_VERSION,
+            "generator": _generator_fingerprint(),
+            "seed": int(seed),
+            "params": _canonical(dict(params)),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    assert _cache_dir is not None
+    return _cache_dir / f"{key}.json"
+
+
+def load_cached_blueprint(key: str | None) -> tuple[Blueprint, RngState] | None:
+    """Return the cached blueprint and the RNG state right after generating it."""
+    if key is None or _cache_dir is None:
+        return None
+    path = _entry_path(key)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("format") != BLUEPRINT_CACHE_FORMAT_VERSION:
+            return None
+        blueprint = Blueprint(
+            grid=[str(row) for row in data["grid"]],
+            steel_cells={(int(x), int(y)) for x, y in data["steel_cells"]},
+            car_reachable_cells={
+                (int(x), int(y)) for x, y in data["car_reachable_cells"]
+            },
+        )
+        rng_words, rng_index, rng_seed = data["rng_state"]
+        rng_state = (tuple(int(w) for w in rng_words), int(rng_index), rng_seed)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        print(f"Ignoring blueprint cache entry ({path}): {exc}")
+        return None
+    try:
+        os.utime(path)  # keep recently used layouts out of eviction
+    except OSError:
+        pass
+    return blueprint, rng_state
+
+
+def store_cached_blueprint(
+    key: str | None, blueprint: Blueprint, rng_state: RngState
+) -> None:
+    if key is None or _cache_dir is None:
+        return
+    path = _entry_path(key)
+    payload = {
+        "format": BLUEPRINT_CACHE_FORMAT_VERSION,
+        "grid": list(blueprint.grid),
+        "steel_cells": sorted(blueprint.steel_cells),
+        "car_reachable_cells": sorted(blueprint.car_reachable_cells),
+        "rng_state": [list(rng_state[0]), rng_state[1], rng_state[2]],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+        )
+        tmp_path.replace(path)
+        _evict_old_entries(path.parent)
+    except OSError as exc:
+        print(f"Failed to save blueprint cache ({path}): {exc}")
+
+
+def _evict_old_entries(directory: Path) -> None:
+    entries = sorted(directory.glob("*.json"), key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[: max(0, len(entries) - BLUEPRINT_CACHE_MAX_ENTRIES)]:
+        entry.unlink(missing_ok=True)
+
+
+__all__ = [
+    "BLUEPRINT_CACHE_MAX_ENTRIES",
+    "RngState",
+    "blueprint_cache_key",
+    "default_blueprint_cache_dir",
+    "disable_blueprint_cache",
+    "enable_blueprint_cache",
+    "load_cached_blueprint",
+    "store_cached_blueprint",
+]
@@ -35,6 +35,7 @@ from ..rng import get_rng
 from ..screen_constants import SCREEN_HEIGHT, SCREEN_WIDTH
 from .collisions import spritecollideany_walls
 from .walls import SteelBeam, Wall, RubbleWall, ReinforcedWall
+from .wall_grid import WallGrid, WallKind
 from .car import Car
 from .player import Player
 from .survivor import Survivor
@@ -43,9 +44,9 @@ from .zombie_dog import ZombieDog
 from .patrol_bot import PatrolBot
 from .carrier_bot import CarrierBot
 from .spiky_plant import SpikyPlant
-from .material import Material
+from .material import Material, MaterialOccupancy
 
-RNG = get_rng()
+RNG = get_rng("spawn")
 
 
 class Camera:
@@ -107,6 +108,10 @@ class FuelCan(pygame.sprite.Sprite):
         self.image = build_fuel_can_surface(FUEL_CAN_WIDTH, FUEL_CAN_HEIGHT)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = build_fuel_can_surface(FUEL_CAN_WIDTH, FUEL_CAN_HEIGHT)
+
 
 class EmptyFuelCan(pygame.sprite.Sprite):
     """Empty fuel can collectible that must be filled at a station."""
@@ -118,6 +123,12 @@ class EmptyFuelCan(pygame.sprite.Sprite):
         )
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = build_empty_fuel_can_surface(
+            EMPTY_FUEL_CAN_WIDTH, EMPTY_FUEL_CAN_HEIGHT
+        )
+
 
 class FuelStation(pygame.sprite.Sprite):
     """Fuel station interaction point used to fill empty fuel cans."""
@@ -127,6 +138,10 @@ class FuelStation(pygame.sprite.Sprite):
         self.image = build_fuel_station_surface(FUEL_STATION_WIDTH, FUEL_STATION_HEIGHT)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = build_fuel_station_surface(FUEL_STATION_WIDTH, FUEL_STATION_HEIGHT)
+
 
 class Flashlight(pygame.sprite.Sprite):
     """Flashlight pickup that expands the player's visible radius when collected."""
@@ -136,6 +151,10 @@ class Flashlight(pygame.sprite.Sprite):
         self.image = build_flashlight_surface(FLASHLIGHT_WIDTH, FLASHLIGHT_HEIGHT)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = build_flashlight_surface(FLASHLIGHT_WIDTH, FLASHLIGHT_HEIGHT)
+
 
 class Shoes(pygame.sprite.Sprite):
     """Shoes pickup that boosts the player's move speed when collected."""
@@ -145,12 +164,18 @@ class Shoes(pygame.sprite.Sprite):
         self.image = build_shoes_surface(SHOES_WIDTH, SHOES_HEIGHT)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = build_shoes_surface(SHOES_WIDTH, SHOES_HEIGHT)
+
 
 __all__ = [
     "Wall",
     "RubbleWall",
     "ReinforcedWall",
     "SteelBeam",
+    "WallGrid",
+    "WallKind",
     "spritecollideany_walls",
     "Camera",
     "Player",
@@ -161,6 +186,7 @@ __all__ = [
     "PatrolBot",
     "CarrierBot",
     "Material",
+    "MaterialOccupancy",
     "SpikyPlant",
     "Car",
     "FuelCan",
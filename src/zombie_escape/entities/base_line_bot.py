@@ -143,3 +143,6 @@ class BaseLineBot(pygame.sprite.Sprite):
                 entity.x = float(entity.rect.centerx)
             if hasattr(entity, "y"):
                 entity.y = float(entity.rect.centery)
+            on_pushed = getattr(entity, "on_pushed", None)
+            if on_pushed is not None:
+                on_pushed()
@@ -57,6 +57,11 @@ class Car(pygame.sprite.Sprite):
         self.pitfall_eject_pos: tuple[int, int] | None = None
         self._update_color()
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.original_image = build_car_surface(CAR_WIDTH, CAR_HEIGHT)
+        self._update_color()
+
     def _take_damage(self: Self, amount: float) -> None:
         if self.health > 0:
             self.health -= amount
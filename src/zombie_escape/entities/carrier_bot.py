@@ -57,6 +57,10 @@ class CarrierBot(BaseLineBot):
         self.carried_material: Material | None = None
         self._recently_dropped_material: Material | None = None
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._refresh_surface()
+
     def _refresh_surface(self: Self) -> None:
         center = self.rect.center
         self.image = self._build_surface(axis=self.axis)
@@ -125,8 +129,7 @@ class CarrierBot(BaseLineBot):
         material = self.carried_material
         if material is None:
             return
-        material.carried_by = None
-        material.place_at(self.x, self.y)
+        material.put_down(self.x, self.y)
         self.carried_material = None
         self._recently_dropped_material = material
 
@@ -245,8 +248,7 @@ class CarrierBot(BaseLineBot):
             ):
                 continue
             drop_x, drop_y = self._cell_center(cell=cell, cell_size=cell_size)
-            material.carried_by = None
-            material.place_at(drop_x, drop_y)
+            material.put_down(drop_x, drop_y)
             self.carried_material = None
             self._recently_dropped_material = material
             return
@@ -268,7 +270,7 @@ class CarrierBot(BaseLineBot):
             pickup_range = abs(self.collision_radius - material.collision_radius)
             if dx * dx + dy * dy > pickup_range * pickup_range:
                 continue
-            material.carried_by = self
+            material.pick_up(self)
             self.carried_material = material
             self._sync_carried_material()
             return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import pygame
@@ -10,84 +11,163 @@ except ImportError:  # pragma: no cover - Python 3.10 fallback
     from typing_extensions import Self
 
 from ..entities_constants import MATERIAL_SIZE
+from ..hazard_grid import HAZARD_MATERIAL
 
 if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..hazard_grid import HazardGrid
     from .carrier_bot import CarrierBot
 
 
+class MaterialOccupancy:
+    """Cells covered by resting materials, kept current by `Material` events.
+
+    `cells` is the set exposed as `LevelLayout.material_cells` and is updated in
+    place; `version` increments whenever it changes so callers can cache data
+    derived from it between frames. When a `HazardGrid` is given, its material
+    bit follows the same changes.
+    """
+
+    def __init__(
+        self: Self,
+        cells: set[tuple[int, int]] | None = None,
+        *,
+        cell_size: int,
+        grid_cols: int,
+        grid_rows: int,
+        hazards: HazardGrid | None = None,
+    ) -> None:
+        self.cells = set() if cells is None else cells
+        self.hazards = hazards
+        self.cell_size = cell_size
+        self.grid_cols = grid_cols
+        self.grid_rows = grid_rows
+        self.version = 0
+        self._counts: Counter[tuple[int, int]] = Counter()
+        self._material_cells: dict[Material, tuple[int, int]] = {}
+
+    def track(self: Self, material: Material) -> None:
+        material.occupancy = self
+        self.update(material)
+
+    def _cell_for(self: Self, material: Material) -> tuple[int, int] | None:
+        if material.carried_by is not None or self.cell_size <= 0:
+            return None
+        cx = int(material.rect.centerx // self.cell_size)
+        cy = int(material.rect.centery // self.cell_size)
+        if 0 <= cx < self.grid_cols and 0 <= cy < self.grid_rows:
+            return (cx, cy)
+        return None
+
+    def update(self: Self, material: Material) -> None:
+        """Re-register `material` after it moved, was picked up, or put down."""
+        self._move(material, self._cell_for(material))
+
+    def discard(self: Self, material: Material) -> None:
+        self._move(material, None)
+        if material.occupancy is self:
+            material.occupancy = None
+
+    def _move(self: Self, material: Material, cell: tuple[int, int] | None) -> None:
+        previous = self._material_cells.get(material)
+        if previous == cell:
+            return
+        if previous is not None:
+            del self._material_cells[material]
+            self._counts[previous] -= 1
+            if self._counts[previous] <= 0:
+                del self._counts[previous]
+                self.cells.discard(previous)
+                self.version += 1
+                if self.hazards is not None:
+                    self.hazards.set_flag(previous, HAZARD_MATERIAL, False)
+        if cell is not None:
+            self._material_cells[material] = cell
+            self._counts[cell] += 1
+            if cell not in self.cells:
+                self.cells.add(cell)
+                self.version += 1
+                if self.hazards is not None:
+                    self.hazards.set_flag(cell, HAZARD_MATERIAL)
+
+
+def _build_material_surface(safe_size: int) -> pygame.Surface:
+    surface = pygame.Surface((safe_size, safe_size), pygame.SRCALPHA)
+    body_color = (56, 60, 66)
+    frame_color = (24, 27, 32)
+    wire_color = (104, 110, 120)
+    inset = max(1, safe_size // 10)
+    left = inset
+    right = safe_size - 1 - inset
+    top = inset
+    bottom = safe_size - 1 - inset
+    body_rect = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+    # Draw as stacked metal plates: top face + visible front cross-section.
+    front_depth = max(2, body_rect.height // 5)
+    top_rect = pygame.Rect(
+        body_rect.left,
+        body_rect.top,
+        body_rect.width,
+        max(1, body_rect.height - front_depth),
+    )
+    front_rect = pygame.Rect(
+        body_rect.left,
+        top_rect.bottom,
+        body_rect.width,
+        max(1, body_rect.bottom - top_rect.bottom + 1),
+    )
+    pygame.draw.rect(surface, body_color, top_rect)
+    pygame.draw.rect(surface, frame_color, top_rect, width=1)
+
+    front_base_color = (46, 49, 55)
+    pygame.draw.rect(surface, front_base_color, front_rect)
+    pygame.draw.rect(surface, frame_color, front_rect, width=1)
+    plate_line_colors = ((70, 74, 82), (58, 62, 70))
+    plate_lines = max(2, min(4, front_rect.height))
+    for i in range(1, plate_lines):
+        y_pos = front_rect.top + (i * front_rect.height) // plate_lines
+        pygame.draw.line(
+            surface,
+            plate_line_colors[i % 2],
+            (front_rect.left + 1, y_pos),
+            (front_rect.right - 1, y_pos),
+            width=1,
+        )
+
+    pygame.draw.rect(surface, frame_color, body_rect, width=1)
+    # Two vertical and two horizontal wire bands.
+    # Vertical bands continue across the front cross-section.
+    wire_width = max(1, safe_size // 10)
+    x_positions = (safe_size // 3, (safe_size * 2) // 3)
+    y_positions = (
+        top_rect.top + max(1, top_rect.height // 3),
+        top_rect.top + max(1, (top_rect.height * 2) // 3),
+    )
+    for x_pos in x_positions:
+        pygame.draw.line(
+            surface,
+            wire_color,
+            (x_pos, top + 1),
+            (x_pos, bottom - 1),
+            width=wire_width,
+        )
+    for y_pos in y_positions:
+        pygame.draw.line(
+            surface,
+            wire_color,
+            (left + 1, y_pos),
+            (right - 1, y_pos),
+            width=wire_width,
+        )
+    return surface
+
+
 class Material(pygame.sprite.Sprite):
     """Passive carryable object for carrier bots."""
 
     def __init__(self: Self, x: float, y: float, *, size: int = MATERIAL_SIZE) -> None:
         super().__init__()
         safe_size = max(4, int(size))
-        self.image = pygame.Surface((safe_size, safe_size), pygame.SRCALPHA)
-        body_color = (56, 60, 66)
-        frame_color = (24, 27, 32)
-        wire_color = (104, 110, 120)
-        inset = max(1, safe_size // 10)
-        left = inset
-        right = safe_size - 1 - inset
-        top = inset
-        bottom = safe_size - 1 - inset
-        body_rect = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
-        # Draw as stacked metal plates: top face + visible front cross-section.
-        front_depth = max(2, body_rect.height // 5)
-        top_rect = pygame.Rect(
-            body_rect.left,
-            body_rect.top,
-            body_rect.width,
-            max(1, body_rect.height - front_depth),
-        )
-        front_rect = pygame.Rect(
-            body_rect.left,
-            top_rect.bottom,
-            body_rect.width,
-            max(1, body_rect.bottom - top_rect.bottom + 1),
-        )
-        pygame.draw.rect(self.image, body_color, top_rect)
-        pygame.draw.rect(self.image, frame_color, top_rect, width=1)
-
-        front_base_color = (46, 49, 55)
-        pygame.draw.rect(self.image, front_base_color, front_rect)
-        pygame.draw.rect(self.image, frame_color, front_rect, width=1)
-        plate_line_colors = ((70, 74, 82), (58, 62, 70))
-        plate_lines = max(2, min(4, front_rect.height))
-        for i in range(1, plate_lines):
-            y_pos = front_rect.top + (i * front_rect.height) // plate_lines
-            pygame.draw.line(
-                self.image,
-                plate_line_colors[i % 2],
-                (front_rect.left + 1, y_pos),
-                (front_rect.right - 1, y_pos),
-                width=1,
-            )
-
-        pygame.draw.rect(self.image, frame_color, body_rect, width=1)
-        # Two vertical and two horizontal wire bands.
-        # Vertical bands continue across the front cross-section.
-        wire_width = max(1, safe_size // 10)
-        x_positions = (safe_size // 3, (safe_size * 2) // 3)
-        y_positions = (
-            top_rect.top + max(1, top_rect.height // 3),
-            top_rect.top + max(1, (top_rect.height * 2) // 3),
-        )
-        for x_pos in x_positions:
-            pygame.draw.line(
-                self.image,
-                wire_color,
-                (x_pos, top + 1),
-                (x_pos, bottom - 1),
-                width=wire_width,
-            )
-        for y_pos in y_positions:
-            pygame.draw.line(
-                self.image,
-                wire_color,
-                (left + 1, y_pos),
-                (right - 1, y_pos),
-                width=wire_width,
-            )
+        self.image = _build_material_surface(safe_size)
         self.rect = self.image.get_rect(center=(int(x), int(y)))
         self.x = float(self.rect.centerx)
         self.y = float(self.rect.centery)
@@ -101,8 +181,29 @@ class Material(pygame.sprite.Sprite):
         )
         self.shadow_offset_scale = 1.0
         self.carried_by: CarrierBot | None = None
+        self.occupancy: MaterialOccupancy | None = None
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = _build_material_surface(self.rect.width)
 
     def place_at(self: Self, x: float, y: float) -> None:
         self.x = float(x)
         self.y = float(y)
         self.rect.center = (int(self.x), int(self.y))
+        if self.occupancy is not None:
+            self.occupancy.update(self)
+
+    def pick_up(self: Self, carrier: CarrierBot) -> None:
+        self.carried_by = carrier
+        if self.occupancy is not None:
+            self.occupancy.update(self)
+
+    def put_down(self: Self, x: float, y: float) -> None:
+        self.carried_by = None
+        self.place_at(x, y)
+
+    def kill(self: Self) -> None:
+        if self.occupancy is not None:
+            self.occupancy.discard(self)
+        super().kill()
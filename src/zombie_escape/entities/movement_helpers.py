@@ -93,6 +93,17 @@ def update_directional_image_scale(sprite: pygame.sprite.Sprite, scale: float) -
     sprite.rect = sprite.image.get_rect(center=old_center)
 
 
+def restore_directional_image(sprite: pygame.sprite.Sprite) -> None:
+    """Point `image` at the facing frame again after a snapshot restore.
+
+    A frame that was scaled (jumping, bot overlap) is scaled to the saved rect.
+    """
+    image = sprite.directional_images[sprite.facing_bin]  # type: ignore[attr-defined]
+    if image.get_size() != sprite.rect.size:
+        image = pygame.transform.scale(image, sprite.rect.size)
+    sprite.image = image
+
+
 def set_facing_bin(sprite: pygame.sprite.Sprite, new_bin: int) -> None:
     """Update facing bin and image, preserving center."""
     if new_bin == sprite.facing_bin:  # type: ignore[attr-defined]
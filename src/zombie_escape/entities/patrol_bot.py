@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 
 try:
@@ -20,6 +21,7 @@ from ..entities_constants import (
     PATROL_BOT_COLLISION_MARGIN,
     PUDDLE_SPEED_FACTOR,
 )
+from ..hazard_grid import HAZARD_ELECTRIFIED
 from ..render_assets import angle_bin_from_vector, build_patrol_bot_directional_surfaces
 from ..render_constants import ANGLE_BINS
 from ..rng import get_rng
@@ -33,9 +35,83 @@ from .movement import (
 from .walls import Wall
 
 if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..hazard_grid import HazardGrid
     from .spiky_plant import SpikyPlant
 
-RNG = get_rng()
+RNG = get_rng("ai")
+
+
+class ElectrifiedFloor:
+    """Cells under live patrol bots, refcounted and updated as bots change cell.
+
+    `counts` holds how many bots stand on each cell and `cells` is the set
+    exposed as `ProgressState.electrified_cells`. Both change only when a bot
+    is tracked, crosses a cell boundary, or dies; `version` increments then so
+    renderers can skip work while the floor is unchanged.
+    """
+
+    def __init__(
+        self: Self,
+        cells: set[tuple[int, int]] | None = None,
+        *,
+        cell_size: int,
+        grid_cols: int,
+        grid_rows: int,
+        hazards: HazardGrid | None = None,
+    ) -> None:
+        self.cells = set() if cells is None else cells
+        self.cell_size = cell_size
+        self.grid_cols = grid_cols
+        self.grid_rows = grid_rows
+        self.hazards = hazards
+        self.version = 0
+        self.counts = np.zeros((max(0, grid_rows), max(0, grid_cols)), dtype=np.int16)
+        self._bot_cells: dict[PatrolBot, tuple[int, int]] = {}
+
+    def track(self: Self, bot: PatrolBot) -> None:
+        bot.electrified_floor = self
+        self.update(bot)
+
+    def _cell_for(self: Self, bot: PatrolBot) -> tuple[int, int] | None:
+        if self.cell_size <= 0 or not bot.alive():
+            return None
+        cx = int(bot.rect.centerx // self.cell_size)
+        cy = int(bot.rect.centery // self.cell_size)
+        if 0 <= cx < self.grid_cols and 0 <= cy < self.grid_rows:
+            return (cx, cy)
+        return None
+
+    def update(self: Self, bot: PatrolBot) -> None:
+        """Re-register `bot` after it moved; a no-op while it stays in its cell."""
+        self._move(bot, self._cell_for(bot))
+
+    def discard(self: Self, bot: PatrolBot) -> None:
+        self._move(bot, None)
+        if bot.electrified_floor is self:
+            bot.electrified_floor = None
+
+    def _move(self: Self, bot: PatrolBot, cell: tuple[int, int] | None) -> None:
+        previous = self._bot_cells.get(bot)
+        if previous == cell:
+            return
+        if previous is not None:
+            del self._bot_cells[bot]
+            px, py = previous
+            self.counts[py, px] -= 1
+            if self.counts[py, px] <= 0:
+                self.cells.discard(previous)
+                self.version += 1
+                if self.hazards is not None:
+                    self.hazards.set_flag(previous, HAZARD_ELECTRIFIED, False)
+        if cell is not None:
+            self._bot_cells[bot] = cell
+            cx, cy = cell
+            self.counts[cy, cx] += 1
+            if cell not in self.cells:
+                self.cells.add(cell)
+                self.version += 1
+                if self.hazards is not None:
+                    self.hazards.set_flag(cell, HAZARD_ELECTRIFIED)
 
 
 class PatrolBot(pygame.sprite.Sprite):
@@ -49,15 +125,7 @@ class PatrolBot(pygame.sprite.Sprite):
         self.shadow_offset_scale = 1.0 / 3.0
         self.direction_command_radius = float(PATROL_BOT_DIRECTION_COMMAND_RADIUS)
         assert self.direction_command_radius < self.collision_radius
-        self.directional_images_player = build_patrol_bot_directional_surfaces(
-            self.size, arrow_scale=1.0
-        )
-        self.directional_images_auto = build_patrol_bot_directional_surfaces(
-            self.size, arrow_scale=2.0 / 3.0
-        )
-        self.directional_images_waiting = build_patrol_bot_directional_surfaces(
-            self.size, arrow_scale=1.0, marker_mode="diamond"
-        )
+        self._build_directional_images()
         self.indicator_mode = "auto"
         self.directional_images = self.directional_images_auto
         self.image = self.directional_images[self.facing_bin]
@@ -81,6 +149,36 @@ class PatrolBot(pygame.sprite.Sprite):
         self.direction_command_hold_until_ms = 0
         self.awaiting_player_direction_input = False
         self._on_moving_floor_last = False
+        self.electrified_floor: ElectrifiedFloor | None = None
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._build_directional_images()
+        self.directional_images = {
+            "player": self.directional_images_player,
+            "waiting": self.directional_images_waiting,
+        }.get(self.indicator_mode, self.directional_images_auto)
+        self.image = self.directional_images[self.facing_bin]
+
+    def _build_directional_images(self: Self) -> None:
+        self.directional_images_player = build_patrol_bot_directional_surfaces(
+            self.size, arrow_scale=1.0
+        )
+        self.directional_images_auto = build_patrol_bot_directional_surfaces(
+            self.size, arrow_scale=2.0 / 3.0
+        )
+        self.directional_images_waiting = build_patrol_bot_directional_surfaces(
+            self.size, arrow_scale=1.0, marker_mode="diamond"
+        )
+
+    def on_pushed(self: Self) -> None:
+        if self.electrified_floor is not None:
+            self.electrified_floor.update(self)
+
+    def kill(self: Self) -> None:
+        if self.electrified_floor is not None:
+            self.electrified_floor.discard(self)
+        super().kill()
 
     def _set_facing_bin(self: Self, new_bin: int) -> None:
         if new_bin == self.facing_bin:
@@ -526,3 +624,5 @@ class PatrolBot(pygame.sprite.Sprite):
         self.y = final_y
         self.rect.center = (int(self.x), int(self.y))
         self._on_moving_floor_last = on_floor
+        if self.electrified_floor is not None:
+            self.electrified_floor.update(self)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING
 
 try:
@@ -32,17 +31,21 @@ from ..render_assets import (
     build_zombie_directional_surfaces,
 )
 from ..render_constants import ANGLE_BINS, PLAYER_SHADOW_RADIUS_MULT
+from ..rng import get_rng
 from ..world_grid import WallIndex, walls_for_radius
 from .collisions import collide_circle_custom
 from .movement import _can_humanoid_jump, _circle_wall_collision, _get_jump_scale
 from .movement_helpers import (
     move_axis_with_pitfall,
+    restore_directional_image,
     separate_circle_from_blockers,
     set_facing_bin,
     update_directional_image_scale,
 )
 from .walls import Wall, _is_inner_wall
 
+RNG = get_rng("ai")
+
 _PLAYER_CELL_JITTER_DIRS: tuple[tuple[float, float], ...] = (
     (1.0, 0.0),
     (-1.0, 0.0),
@@ -53,15 +56,15 @@ _PLAYER_CELL_JITTER_DIRS: tuple[tuple[float, float], ...] = (
     (-0.7, 0.7),
     (-0.7, -0.7),
 )
-_PLAYER_CELL_JITTER_QUEUE: list[tuple[float, float]] = []
 
 
-def _next_player_cell_jitter() -> tuple[float, float]:
-    if not _PLAYER_CELL_JITTER_QUEUE:
+def _next_player_cell_jitter(queue: list[tuple[float, float]]) -> tuple[float, float]:
+    # The bag lives on the player so it resets with each run and is snapshotted.
+    if not queue:
         refill = list(_PLAYER_CELL_JITTER_DIRS)
-        random.shuffle(refill)
-        _PLAYER_CELL_JITTER_QUEUE.extend(refill)
-    return _PLAYER_CELL_JITTER_QUEUE.pop()
+        RNG.shuffle(refill)
+        queue.extend(refill)
+    return queue.pop()
 
 
 class Player(pygame.sprite.Sprite):
@@ -77,6 +80,7 @@ class Player(pygame.sprite.Sprite):
         self.input_active = False
         self.wall_bump_counter = 0
         self.wall_bump_flip = 1
+        self.cell_jitter_queue: list[tuple[float, float]] = []
         self.wall_bump_hold = 0
         self.inner_wall_hit = False
         self.inner_wall_cell = None
@@ -98,6 +102,17 @@ class Player(pygame.sprite.Sprite):
         self.shadow_offset_scale = 1.0
         self.is_zombified_visual = False
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self.is_zombified_visual:
+            self.directional_images = build_zombie_directional_surfaces(
+                self.radius,
+                draw_hands=False,
+            )
+        else:
+            self.directional_images = build_player_directional_surfaces(self.radius)
+        restore_directional_image(self)
+
     @property
     def in_car(self: Self) -> bool:
         mounted_car = self.mounted_car
@@ -252,7 +267,7 @@ class Player(pygame.sprite.Sprite):
             clamp_range=(0.0, level_height),
         )
 
-        jitter_dx, jitter_dy = _next_player_cell_jitter()
+        jitter_dx, jitter_dy = _next_player_cell_jitter(self.cell_jitter_queue)
         collision_probe_x = self.x + jitter_dx
         collision_probe_y = self.y + jitter_dy
 
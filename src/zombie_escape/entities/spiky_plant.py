@@ -16,6 +16,30 @@ from ..render_constants import (
 )
 
 
+def _build_spiky_plant_surface(radius: int) -> pygame.Surface:
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(
+        surface,
+        SPIKY_PLANT_BODY_COLOR,
+        (radius, radius),
+        radius - 2,
+    )
+    for i in range(8):
+        angle = i * (math.tau / 8)
+        start_dist = radius - 4
+        end_dist = radius
+        start_p = (
+            radius + math.cos(angle) * start_dist,
+            radius + math.sin(angle) * start_dist,
+        )
+        end_p = (
+            radius + math.cos(angle) * end_dist,
+            radius + math.sin(angle) * end_dist,
+        )
+        pygame.draw.line(surface, SPIKY_PLANT_SPIKE_COLOR, start_p, end_p, 2)
+    return surface
+
+
 class SpikyPlant(pygame.sprite.Sprite):
     def __init__(self, x: int, y: int):
         super().__init__()
@@ -28,31 +52,15 @@ class SpikyPlant(pygame.sprite.Sprite):
         self.health = SPIKY_PLANT_HEALTH
         self.max_health = SPIKY_PLANT_HEALTH
 
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image,
-            SPIKY_PLANT_BODY_COLOR,
-            (self.radius, self.radius),
-            self.radius - 2,
-        )
-        for i in range(8):
-            angle = i * (math.tau / 8)
-            start_dist = self.radius - 4
-            end_dist = self.radius
-            start_p = (
-                self.radius + math.cos(angle) * start_dist,
-                self.radius + math.sin(angle) * start_dist,
-            )
-            end_p = (
-                self.radius + math.cos(angle) * end_dist,
-                self.radius + math.sin(angle) * end_dist,
-            )
-            pygame.draw.line(self.image, SPIKY_PLANT_SPIKE_COLOR, start_p, end_p, 2)
-
+        self.image = _build_spiky_plant_surface(self.radius)
         self.rect = self.image.get_rect(center=(x, y))
         self.x = float(x)
         self.y = float(y)
 
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.image = _build_spiky_plant_surface(self.radius)
+
     def _take_damage(self, amount: int = 1) -> None:
         self.health -= amount
         if self.health <= 0:
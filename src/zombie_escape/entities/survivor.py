@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import TYPE_CHECKING, Callable
 
 import pygame
@@ -28,11 +27,13 @@ from ..entities_constants import (
 )
 from ..render_assets import angle_bin_from_vector, build_survivor_directional_surfaces
 from ..render_constants import ANGLE_BINS, ENTITY_SHADOW_RADIUS_MULT
+from ..rng import get_rng
 from ..world_grid import WallIndex, apply_cell_edge_nudge
 from .collisions import collide_circle_custom
 from .movement import _can_humanoid_jump, _circle_wall_collision, _get_jump_scale
 from .movement_helpers import (
     move_axis_with_pitfall,
+    restore_directional_image,
     separate_circle_from_blockers,
     set_facing_bin,
     update_directional_image_scale,
@@ -42,6 +43,7 @@ from .walls import Wall, _is_inner_wall
 if TYPE_CHECKING:
     from ..models import LevelLayout
 
+RNG = get_rng("ai")
 
 _SURVIVOR_WALL_JITTER_DIRS: tuple[tuple[float, float], ...] = (
     (1.0, 0.0),
@@ -53,15 +55,14 @@ _SURVIVOR_WALL_JITTER_DIRS: tuple[tuple[float, float], ...] = (
     (-0.7, 0.7),
     (-0.7, -0.7),
 )
-_SURVIVOR_WALL_JITTER_QUEUE: list[tuple[float, float]] = []
 
 
-def _next_survivor_wall_jitter() -> tuple[float, float]:
-    if not _SURVIVOR_WALL_JITTER_QUEUE:
+def _next_survivor_wall_jitter(queue: list[tuple[float, float]]) -> tuple[float, float]:
+    if not queue:
         refill = list(_SURVIVOR_WALL_JITTER_DIRS)
-        random.shuffle(refill)
-        _SURVIVOR_WALL_JITTER_QUEUE.extend(refill)
-    return _SURVIVOR_WALL_JITTER_QUEUE.pop()
+        RNG.shuffle(refill)
+        queue.extend(refill)
+    return queue.pop()
 
 
 class Survivor(pygame.sprite.Sprite):
@@ -81,6 +82,7 @@ class Survivor(pygame.sprite.Sprite):
         self.input_facing_bin = 0
         self.wall_bump_counter = 0
         self.wall_bump_flip = 1
+        self.wall_jitter_queue: list[tuple[float, float]] = []
         self._inner_wall_hit = False
         self.wall_bump_hold = 0
         self.directional_images = build_survivor_directional_surfaces(
@@ -104,6 +106,15 @@ class Survivor(pygame.sprite.Sprite):
         )
         self.shadow_offset_scale = 1.0
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.directional_images = build_survivor_directional_surfaces(
+            self.radius,
+            is_buddy=self.is_buddy,
+            draw_hands=self.is_buddy,
+        )
+        restore_directional_image(self)
+
     def set_following(self: Self) -> None:
         if self.is_buddy and not self.rescued:
             self.following = True
@@ -356,7 +367,7 @@ class Survivor(pygame.sprite.Sprite):
                 walkable_cells,
             )
         )
-        jitter_dx, jitter_dy = _next_survivor_wall_jitter()
+        jitter_dx, jitter_dy = _next_survivor_wall_jitter(self.wall_jitter_queue)
 
         def _on_buddy_wall_hit(hit_wall: Wall) -> None:
             if not hasattr(hit_wall, "_take_damage"):
@@ -0,0 +1,685 @@
+"""Array-backed wall state for a level, exposed through lightweight sprite views."""
+
+from __future__ import annotations
+
+import weakref
+from collections import Counter, OrderedDict, deque
+from enum import IntEnum
+from typing import Callable, Hashable, Iterable
+
+import numpy as np
+import pygame
+
+try:
+    from typing import Self
+except ImportError:  # pragma: no cover - Python 3.10 fallback
+    from typing_extensions import Self
+
+from ..entities_constants import INTERNAL_WALL_BEVEL_DEPTH
+from ..render_assets import EnvironmentPalette, RUBBLE_ROTATION_DEG
+from .walls import (
+    ReinforcedWall,
+    RubbleWall,
+    SteelBeam,
+    Wall,
+    _damage_overlay_variant_index,
+    _mark_wall_index_dirty,
+)
+
+# Visual damage steps; health itself stays exact in `WallGrid.health`.
+WALL_DAMAGE_LEVELS = 24
+
+# Unreferenced surfaces kept around so the next level with the same look reuses them.
+WALL_SURFACE_POOL_IDLE_LIMIT = 512
+# Surfaces `WallGrid.bake_pending` paints per call when prebaking other palettes.
+WALL_PALETTE_BAKE_PER_FRAME = 4
+
+_FLAG_BOTTOM_SIDE = 1
+_FLAG_RUBBLE_FLIPPED = 2
+_BEAM_KIND = -1
+
+
+class WallKind(IntEnum):
+    NONE = 0
+    OUTER = 1
+    INNER = 2
+    RUBBLE = 3
+    REINFORCED = 4
+
+
+def _bevel_bits(mask: tuple[bool, bool, bool, bool] | None) -> int:
+    if not mask:
+        return 0
+    return sum(1 << index for index, flag in enumerate(mask) if flag)
+
+
+def _bevel_mask(bits: int) -> tuple[bool, bool, bool, bool]:
+    return (bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8))
+
+
+def _damage_level(health: int, max_health: int) -> int:
+    """Quantize health so walls at similar damage share one surface.
+
+    Full health keeps its own level so the first hit is always visible.
+    """
+    if health <= 0:
+        return 0
+    if health >= max_health:
+        return WALL_DAMAGE_LEVELS
+    level = -(-health * (WALL_DAMAGE_LEVELS - 1) // max_health)  # ceil
+    return max(1, min(WALL_DAMAGE_LEVELS - 1, level))
+
+
+class WallSurfacePool:
+    """Reference-counted wall surfaces shared by every `WallGrid`.
+
+    Keys are `(kind, cell size, bevel bits, palette, damage level, flags,
+    overlay variant)`; each view showing a surface holds one reference. When
+    the last reference goes away the surface moves to a bounded idle list
+    instead of being dropped, so reloading a stage paints almost nothing.
+    """
+
+    def __init__(self: Self, *, idle_limit: int = WALL_SURFACE_POOL_IDLE_LIMIT) -> None:
+        self.idle_limit = max(0, idle_limit)
+        self._surfaces: dict[Hashable, pygame.Surface] = {}
+        self._refs: Counter[Hashable] = Counter()
+        self._idle: OrderedDict[Hashable, None] = OrderedDict()
+
+    def acquire(
+        self: Self,
+        key: Hashable,
+        paint: Callable[[], pygame.Surface],
+        count: int = 1,
+    ) -> pygame.Surface:
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = paint()
+        else:
+            self._idle.pop(key, None)
+        self._refs[key] += count
+        return surface
+
+    def release(self: Self, key: Hashable, count: int = 1) -> None:
+        refs = self._refs[key] - count
+        if refs > 0:
+            self._refs[key] = refs
+            return
+        del self._refs[key]
+        if key not in self._surfaces:
+            return
+        self._idle[key] = None
+        while len(self._idle) > self.idle_limit:
+            stale, _ = self._idle.popitem(last=False)
+            del self._surfaces[stale]
+
+    def refcount(self: Self, key: Hashable) -> int:
+        return self._refs.get(key, 0)
+
+    def clear_idle(self: Self) -> None:
+        for key in self._idle:
+            del self._surfaces[key]
+        self._idle.clear()
+
+    def __len__(self: Self) -> int:
+        return len(self._surfaces)
+
+
+WALL_SURFACE_POOL = WallSurfacePool()
+
+
+def _release_held(pool: WallSurfacePool, held: Counter[Hashable]) -> None:
+    for key, count in held.items():
+        pool.release(key, count)
+    held.clear()
+
+
+class WallGrid:
+    """Per-cell wall and steel beam state for one level.
+
+    Kind, health, damage level, bevel corners and draw flags live in NumPy
+    arrays indexed `[y, x]`. Sprites in `wall_group`/`all_sprites` are
+    `GridWall`/`GridSteelBeam` views that hold only a cell and a rect; their
+    `image` comes from a `WallSurfacePool` shared by every cell (and every
+    level) with the same look.
+    """
+
+    def __init__(
+        self: Self,
+        *,
+        cols: int,
+        rows: int,
+        cell_size: int,
+        palette: EnvironmentPalette | None,
+        pool: WallSurfacePool | None = None,
+    ) -> None:
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.palette = palette
+        shape = (rows, cols)
+        self.kind = np.zeros(shape, dtype=np.uint8)
+        self.health = np.zeros(shape, dtype=np.int32)
+        self.max_health = np.ones(shape, dtype=np.int32)
+        self.damage_level = np.zeros(shape, dtype=np.uint8)
+        self.bevel = np.zeros(shape, dtype=np.uint8)
+        self.flags = np.zeros(shape, dtype=np.uint8)
+        # A beam may sit hidden under an inner wall until that wall falls.
+        self.beam_health = np.zeros(shape, dtype=np.int32)
+        self.beam_max_health = np.ones(shape, dtype=np.int32)
+        self.beam_damage_level = np.zeros(shape, dtype=np.uint8)
+        # Bumped whenever a wall or beam is destroyed (layout cell sets change).
+        self.version = 0
+        self.on_wall_destroyed: Callable[[tuple[int, int], bool], None] | None = None
+        self.on_beam_destroyed: Callable[[tuple[int, int]], None] | None = None
+        self._wall_views: dict[tuple[int, int], GridWall] = {}
+        self._beam_views: dict[tuple[int, int], GridSteelBeam] = {}
+        self.pool = WALL_SURFACE_POOL if pool is None else pool
+        # Pool references held by this grid's views, returned when it is collected.
+        self._held: Counter[Hashable] = Counter()
+        weakref.finalize(self, _release_held, self.pool, self._held)
+        self._bake_queue: deque[tuple[Hashable, Callable[[], pygame.Surface]]] = deque()
+        self._baked: set[Hashable] = set()
+        self._wall_group: pygame.sprite.Group | None = None
+        self._all_sprites: pygame.sprite.LayeredUpdates | None = None
+        self._layer = 0
+
+    def __getstate__(self: Self) -> dict:
+        # The pool and bake queue belong to this process; views reacquire lazily.
+        state = self.__dict__.copy()
+        for name in ("pool", "_held", "_bake_queue", "_baked"):
+            del state[name]
+        return state
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.pool = WALL_SURFACE_POOL
+        self._held = Counter()
+        weakref.finalize(self, _release_held, self.pool, self._held)
+        self._bake_queue = deque()
+        self._baked = set()
+
+    def add_wall(
+        self: Self,
+        x: int,
+        y: int,
+        kind: WallKind,
+        *,
+        health: int,
+        bevel_mask: tuple[bool, bool, bool, bool] | None = None,
+        draw_bottom_side: bool = False,
+        rubble_flipped: bool = False,
+    ) -> None:
+        self.kind[y, x] = kind
+        self.health[y, x] = health
+        self.max_health[y, x] = max(1, health)
+        self.damage_level[y, x] = _damage_level(health, max(1, health))
+        self.bevel[y, x] = _bevel_bits(bevel_mask)
+        self.flags[y, x] = (_FLAG_BOTTOM_SIDE if draw_bottom_side else 0) | (
+            _FLAG_RUBBLE_FLIPPED if rubble_flipped else 0
+        )
+
+    def add_beam(self: Self, x: int, y: int, *, health: int) -> None:
+        self.beam_health[y, x] = health
+        self.beam_max_health[y, x] = max(1, health)
+        self.beam_damage_level[y, x] = _damage_level(health, max(1, health))
+
+    def populate(
+        self: Self,
+        wall_group: pygame.sprite.Group,
+        all_sprites: pygame.sprite.LayeredUpdates,
+        *,
+        layer: int,
+    ) -> None:
+        """Create views for every wall and uncovered beam, in row-major order."""
+        self._wall_group = wall_group
+        self._all_sprites = all_sprites
+        self._layer = layer
+        for y, x in zip(*np.nonzero(self.kind | (self.beam_health > 0))):
+            cell = (int(x), int(y))
+            if self.kind[y, x] != WallKind.NONE:
+                self._add_view(GridWall(self, cell))
+            elif self.beam_health[y, x] > 0:
+                self._add_view(GridSteelBeam(self, cell))
+
+    def _add_view(self: Self, view: GridWall | GridSteelBeam) -> None:
+        if isinstance(view, GridWall):
+            self._wall_views[view.cell] = view
+        else:
+            self._beam_views[view.cell] = view
+        if self._wall_group is not None:
+            self._wall_group.add(view)
+        if self._all_sprites is not None:
+            self._all_sprites.add(view, layer=self._layer)
+
+    def wall_at(self: Self, cell: tuple[int, int]) -> GridWall | None:
+        return self._wall_views.get(cell)
+
+    def beam_at(self: Self, cell: tuple[int, int]) -> GridSteelBeam | None:
+        return self._beam_views.get(cell)
+
+    def cell_rect(self: Self, cell: tuple[int, int]) -> pygame.Rect:
+        size = self.cell_size
+        return pygame.Rect(cell[0] * size, cell[1] * size, size, size)
+
+    def damage_wall(self: Self, cell: tuple[int, int], amount: int) -> None:
+        x, y = cell
+        health = int(self.health[y, x])
+        if health <= 0:
+            return
+        health -= amount
+        self.health[y, x] = health
+        level = _damage_level(health, int(self.max_health[y, x]))
+        view = self._wall_views.get(cell)
+        if level != self.damage_level[y, x]:
+            self.damage_level[y, x] = level
+            if view is not None:
+                self._release_view(view)
+        if health > 0:
+            return
+        beam_exposed = bool(self.beam_health[y, x] > 0)
+        if self.on_wall_destroyed is not None:
+            try:
+                self.on_wall_destroyed(cell, beam_exposed)
+            except Exception as exc:
+                print(f"Wall destroy callback failed: {exc}")
+        _mark_wall_index_dirty()
+        self.version += 1
+        self.kind[y, x] = WallKind.NONE
+        if view is not None:
+            del self._wall_views[cell]
+            self._release_view(view)
+            view.kill()
+        if beam_exposed:
+            self._add_view(GridSteelBeam(self, cell))
+
+    def damage_beam(self: Self, cell: tuple[int, int], amount: int) -> None:
+        x, y = cell
+        health = int(self.beam_health[y, x])
+        if health <= 0:
+            return
+        health -= amount
+        self.beam_health[y, x] = health
+        level = _damage_level(health, int(self.beam_max_health[y, x]))
+        view = self._beam_views.get(cell)
+        if level != self.beam_damage_level[y, x]:
+            self.beam_damage_level[y, x] = level
+            if view is not None:
+                self._release_view(view)
+        if health > 0:
+            return
+        if self.on_beam_destroyed is not None:
+            self.on_beam_destroyed(cell)
+        _mark_wall_index_dirty()
+        self.version += 1
+        if view is not None:
+            del self._beam_views[cell]
+            self._release_view(view)
+            view.kill()
+
+    def set_palette(self: Self, palette: EnvironmentPalette | None) -> None:
+        """Re-point every view at the pooled surface for `palette`.
+
+        Views are grouped by look, so this is one pool lookup per distinct look
+        (a paint only if `prepare_palettes`/`bake_pending` has not baked it yet)
+        plus an attribute swap per view.
+        """
+        if palette is self.palette:
+            return
+        self.palette = palette
+        by_key: dict[Hashable, list[GridWall | GridSteelBeam]] = {}
+        for view in (*self._wall_views.values(), *self._beam_views.values()):
+            if view._surface_key is None:
+                view._surface = None
+            else:
+                by_key.setdefault(view._surface_key, []).append(view)
+        for old_key, views in by_key.items():
+            new_key = (*old_key[:3], palette, *old_key[4:])
+            first = views[0]
+            painter = (
+                self._wall_painter(first.cell)
+                if isinstance(first, GridWall)
+                else self._beam_painter(first.cell)
+            )
+            count = len(views)
+            surface = self.pool.acquire(new_key, lambda: painter(palette), count)
+            self._held[new_key] += count
+            self._held[old_key] -= count
+            if self._held[old_key] <= 0:
+                del self._held[old_key]
+            self.pool.release(old_key, count)
+            for view in views:
+                view._surface = surface
+                view._surface_key = new_key
+
+    def prepare_palettes(
+        self: Self, palettes: Iterable[EnvironmentPalette | None]
+    ) -> int:
+        """Queue every current wall/beam look in `palettes` for `bake_pending`.
+
+        Returns the number of surfaces queued. Hidden beams are included so a
+        wall falling after a palette switch still finds its beam prebaked.
+        """
+        looks: dict[Hashable, Callable[..., pygame.Surface]] = {}
+        for cell in self._wall_views:
+            looks.setdefault(self.wall_key(cell), self._wall_painter(cell))
+        for y, x in zip(*np.nonzero(self.beam_health > 0)):
+            cell = (int(x), int(y))
+            looks.setdefault(self.beam_key(cell), self._beam_painter(cell))
+        queued = 0
+        for palette in palettes:
+            for key, painter in looks.items():
+                target = (*key[:3], palette, *key[4:])
+                if target in self._baked:
+                    continue
+                self._baked.add(target)
+                self._bake_queue.append(
+                    (target, lambda painter=painter, palette=palette: painter(palette))
+                )
+                queued += 1
+        return queued
+
+    def bake_pending(self: Self, limit: int = WALL_PALETTE_BAKE_PER_FRAME) -> int:
+        """Paint up to `limit` queued surfaces into the pool; return how many remain.
+
+        Baked surfaces stay referenced by the grid for its lifetime, so a later
+        `set_palette` only looks them up.
+        """
+        for _ in range(min(max(0, limit), len(self._bake_queue))):
+            key, paint = self._bake_queue.popleft()
+            self.pool.acquire(key, paint)
+            self._held[key] += 1
+        return len(self._bake_queue)
+
+    def _wall_painter(
+        self: Self, cell: tuple[int, int]
+    ) -> Callable[[EnvironmentPalette | None], pygame.Surface]:
+        x, y = cell
+        kind = WallKind(int(self.kind[y, x]))
+        level = int(self.damage_level[y, x])
+        flags = int(self.flags[y, x])
+        return lambda palette: self._paint_wall(cell, kind, level, flags, palette)
+
+    def _beam_painter(
+        self: Self, cell: tuple[int, int]
+    ) -> Callable[[EnvironmentPalette | None], pygame.Surface]:
+        level = int(self.beam_damage_level[cell[1], cell[0]])
+        return lambda palette: self._paint_beam(cell, level, palette)
+
+    def _release_view(self: Self, view: GridWall | GridSteelBeam) -> None:
+        view._surface = None
+        key = view._surface_key
+        if key is None:
+            return
+        view._surface_key = None
+        self._held[key] -= 1
+        if self._held[key] <= 0:
+            del self._held[key]
+        self.pool.release(key)
+
+    def _acquire(
+        self: Self,
+        view: GridWall | GridSteelBeam,
+        key: Hashable,
+        paint: Callable[[], pygame.Surface],
+    ) -> pygame.Surface:
+        self._release_view(view)
+        surface = self.pool.acquire(key, paint)
+        self._held[key] += 1
+        view._surface_key = key
+        view._surface = surface
+        return surface
+
+    def wall_key(self: Self, cell: tuple[int, int]) -> tuple[Hashable, ...]:
+        x, y = cell
+        kind = WallKind(int(self.kind[y, x]))
+        level = int(self.damage_level[y, x])
+        flags = int(self.flags[y, x])
+        variant = _damage_overlay_variant_index(
+            x=x * self.cell_size,
+            y=y * self.cell_size,
+            width=self.cell_size,
+            height=self.cell_size,
+        )
+        if kind != WallKind.RUBBLE and level >= WALL_DAMAGE_LEVELS:
+            variant = 0  # undamaged walls only vary through the damage overlay
+        return (
+            int(kind),
+            self.cell_size,
+            int(self.bevel[y, x]),
+            self.palette,
+            level,
+            flags,
+            variant,
+        )
+
+    def beam_key(self: Self, cell: tuple[int, int]) -> tuple[Hashable, ...]:
+        x, y = cell
+        level = int(self.beam_damage_level[y, x])
+        variant = 0
+        if level < WALL_DAMAGE_LEVELS:
+            variant = _damage_overlay_variant_index(
+                x=x * self.cell_size,
+                y=y * self.cell_size,
+                width=self.cell_size,
+                height=self.cell_size,
+            )
+        return (_BEAM_KIND, self.cell_size, 0, self.palette, level, 0, variant)
+
+    def _paint_beam(
+        self: Self,
+        cell: tuple[int, int],
+        level: int,
+        palette: EnvironmentPalette | None,
+    ) -> pygame.Surface:
+        rect = self.cell_rect(cell)
+        template = SteelBeam(
+            rect.x,
+            rect.y,
+            rect.width,
+            health=WALL_DAMAGE_LEVELS,
+            palette=palette,
+        )
+        if level < WALL_DAMAGE_LEVELS:
+            template.health = level
+            template._update_color()
+        return template.image
+
+    def _paint_wall(
+        self: Self,
+        cell: tuple[int, int],
+        kind: WallKind,
+        level: int,
+        flags: int,
+        palette: EnvironmentPalette | None,
+    ) -> pygame.Surface:
+        """Paint one template wall with the standalone classes and keep its image."""
+        rect = self.cell_rect(cell)
+        bevel_mask = _bevel_mask(int(self.bevel[cell[1], cell[0]]))
+        draw_bottom_side = bool(flags & _FLAG_BOTTOM_SIDE)
+        template: Wall
+        if kind == WallKind.OUTER:
+            template = Wall(
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
+                health=WALL_DAMAGE_LEVELS,
+                palette=palette,
+                palette_category="outer_wall",
+                bevel_depth=0,
+                draw_bottom_side=draw_bottom_side,
+            )
+        elif kind == WallKind.REINFORCED:
+            template = ReinforcedWall(
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
+                health=WALL_DAMAGE_LEVELS,
+                palette=palette,
+                bevel_depth=INTERNAL_WALL_BEVEL_DEPTH,
+                bevel_mask=bevel_mask,
+                draw_bottom_side=draw_bottom_side,
+            )
+        elif kind == WallKind.RUBBLE:
+            template = RubbleWall(
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
+                health=WALL_DAMAGE_LEVELS,
+                palette=palette,
+                palette_category="inner_wall",
+                bevel_depth=INTERNAL_WALL_BEVEL_DEPTH,
+                rubble_rotation_deg=(
+                    -RUBBLE_ROTATION_DEG
+                    if flags & _FLAG_RUBBLE_FLIPPED
+                    else RUBBLE_ROTATION_DEG
+                ),
+            )
+        else:
+            template = Wall(
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
+                health=WALL_DAMAGE_LEVELS,
+                palette=palette,
+                palette_category="inner_wall",
+                bevel_mask=bevel_mask,
+                draw_bottom_side=draw_bottom_side,
+            )
+        if level < WALL_DAMAGE_LEVELS:
+            template.health = level
+            template._update_color()
+        return template.image
+
+
+class GridWall(Wall):
+    """`Wall` view of one `WallGrid` cell; owns no surface of its own."""
+
+    _collision_polygon = None
+    on_destroy = None
+
+    def __init__(self: Self, grid: WallGrid, cell: tuple[int, int]) -> None:
+        pygame.sprite.Sprite.__init__(self)
+        self.grid = grid
+        self.cell = cell
+        self.rect = grid.cell_rect(cell)
+        self._surface: pygame.Surface | None = None
+        self._surface_key: Hashable | None = None
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._surface = None
+        self._surface_key = None
+
+    @property
+    def image(self: Self) -> pygame.Surface:
+        surface = self._surface
+        if surface is None:
+            grid = self.grid
+            painter = grid._wall_painter(self.cell)
+            surface = grid._acquire(
+                self, grid.wall_key(self.cell), lambda: painter(grid.palette)
+            )
+        return surface
+
+    @property
+    def kind(self: Self) -> WallKind:
+        return WallKind(int(self.grid.kind[self.cell[1], self.cell[0]]))
+
+    @property
+    def health(self: Self) -> int:
+        return int(self.grid.health[self.cell[1], self.cell[0]])
+
+    @property
+    def max_health(self: Self) -> int:
+        return int(self.grid.max_health[self.cell[1], self.cell[0]])
+
+    @property
+    def palette(self: Self) -> EnvironmentPalette | None:
+        return self.grid.palette
+
+    @property
+    def palette_category(self: Self) -> str:
+        if self.kind in (WallKind.INNER, WallKind.RUBBLE):
+            return "inner_wall"
+        return "outer_wall"
+
+    @property
+    def bevel_mask(self: Self) -> tuple[bool, bool, bool, bool]:
+        return _bevel_mask(int(self.grid.bevel[self.cell[1], self.cell[0]]))
+
+    def _take_damage(self: Self, *, amount: int = 1) -> None:
+        self.grid.damage_wall(self.cell, amount)
+
+    def _update_color(self: Self) -> None:
+        self.grid._release_view(self)
+
+    def set_palette(
+        self: Self, palette: EnvironmentPalette | None, *, force: bool = False
+    ) -> None:
+        # One grid-wide swap; views pick up the new surfaces lazily.
+        self.grid.set_palette(palette)
+
+
+class GridSteelBeam(SteelBeam):
+    """`SteelBeam` view of one `WallGrid` cell; owns no surface of its own."""
+
+    on_destroy = None
+
+    def __init__(self: Self, grid: WallGrid, cell: tuple[int, int]) -> None:
+        pygame.sprite.Sprite.__init__(self)
+        self.grid = grid
+        self.cell = cell
+        self._surface: pygame.Surface | None = None
+        self._surface_key: Hashable | None = None
+        self.rect = self.image.get_rect(center=grid.cell_rect(cell).center)
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._surface = None
+        self._surface_key = None
+
+    @property
+    def image(self: Self) -> pygame.Surface:
+        surface = self._surface
+        if surface is None:
+            grid = self.grid
+            painter = grid._beam_painter(self.cell)
+            surface = grid._acquire(
+                self, grid.beam_key(self.cell), lambda: painter(grid.palette)
+            )
+        return surface
+
+    @property
+    def health(self: Self) -> int:
+        return int(self.grid.beam_health[self.cell[1], self.cell[0]])
+
+    @property
+    def max_health(self: Self) -> int:
+        return int(self.grid.beam_max_health[self.cell[1], self.cell[0]])
+
+    @property
+    def palette(self: Self) -> EnvironmentPalette | None:
+        return self.grid.palette
+
+    def _take_damage(self: Self, *, amount: int = 1) -> None:
+        self.grid.damage_beam(self.cell, amount)
+
+    def _update_color(self: Self) -> None:
+        self.grid._release_view(self)
+
+
+__all__ = [
+    "GridSteelBeam",
+    "GridWall",
+    "WALL_PALETTE_BAKE_PER_FRAME",
+    "WALL_DAMAGE_LEVELS",
+    "WALL_SURFACE_POOL",
+    "WALL_SURFACE_POOL_IDLE_LIMIT",
+    "WallGrid",
+    "WallKind",
+    "WallSurfacePool",
+]
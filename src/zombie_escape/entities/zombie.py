@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import random
 from typing import Any, Iterable, Protocol
 
 import pygame
@@ -51,7 +50,8 @@ from ..render_assets import (
     build_zombie_dog_directional_surfaces,
 )
 from ..rng import get_rng
-from ..surface_effects import SpikyPlantLike, is_in_contaminated_cell, is_in_puddle_cell
+from ..hazard_grid import HAZARD_CONTAMINATED, HAZARD_PUDDLE, surface_flags_at
+from ..surface_effects import SpikyPlantLike
 from ..screen_constants import SCREEN_HEIGHT, SCREEN_WIDTH
 from ..world_grid import apply_cell_edge_nudge
 from .movement import _circle_wall_collision
@@ -68,7 +68,8 @@ from .walls import Wall
 from .zombie_visuals import build_grayscale_image
 from .zombie_vitals import ZombieVitals
 
-RNG = get_rng()
+RNG = get_rng("ai")
+FX_RNG = get_rng("fx")
 
 
 class MovementStrategy(Protocol):
@@ -103,14 +104,7 @@ class Zombie(pygame.sprite.Sprite):
         self.collision_radius = float(self.radius)
         self.facing_bin = 0
         self.kind = kind
-        self.directional_images = build_zombie_directional_surfaces(
-            self.radius,
-            draw_hands=False,
-        )
-        if self.kind in (ZombieKind.TRACKER, ZombieKind.SOLITARY):
-            self.directional_images = self._build_static_variant_directional_images(
-                self.directional_images
-            )
+        self.directional_images = self._build_directional_images()
         self._dynamic_variant_image_cache: dict[tuple[int, int], pygame.Surface] = {}
         self.image = self.directional_images[self.facing_bin]
         self.rect = self.image.get_rect(center=(x, y))
@@ -517,6 +511,20 @@ class Zombie(pygame.sprite.Sprite):
             return
         self._set_facing_bin(new_bin)
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.directional_images = self._build_directional_images()
+        self._dynamic_variant_image_cache = {}
+        self._refresh_variant_image()
+        if self.vitals.carbonized:
+            self._apply_carbonize_visuals()
+
+    def _build_directional_images(self: Self) -> list[pygame.Surface]:
+        images = build_zombie_directional_surfaces(self.radius, draw_hands=False)
+        if self.kind in (ZombieKind.TRACKER, ZombieKind.SOLITARY):
+            images = self._build_static_variant_directional_images(images)
+        return images
+
     def _build_static_variant_directional_images(
         self: Self, base_images: list[pygame.Surface]
     ) -> list[pygame.Surface]:
@@ -724,21 +732,12 @@ class Zombie(pygame.sprite.Sprite):
         move_x += drift_x
         move_y += drift_y
 
-        # Puddle slow-down
-        if is_in_puddle_cell(
-            self.x,
-            self.y,
-            cell_size=cell_size,
-            puddle_cells=layout.puddle_cells,
-        ):
+        # Puddle / contamination slow-down
+        surface = surface_flags_at(layout, self.x, self.y, cell_size=cell_size)
+        if surface & HAZARD_PUDDLE:
             move_x *= PUDDLE_SPEED_FACTOR
             move_y *= PUDDLE_SPEED_FACTOR
-        if is_in_contaminated_cell(
-            self.x,
-            self.y,
-            cell_size=cell_size,
-            contaminated_cells=layout.zombie_contaminated_cells,
-        ):
+        if surface & HAZARD_CONTAMINATED:
             move_x *= ZOMBIE_CONTAMINATED_SPEED_FACTOR
             move_y *= ZOMBIE_CONTAMINATED_SPEED_FACTOR
         move_x, move_y = self._slow_near_trapped_zombies(
@@ -831,18 +830,7 @@ class TrappedZombie(pygame.sprite.Sprite):
         self.shadow_offset_scale = 1.0
         self.is_trapped = True
 
-        if self.kind == ZombieKind.DOG:
-            base_size = ZOMBIE_RADIUS * 2.0
-            long_axis = base_size * ZOMBIE_DOG_LONG_AXIS_RATIO
-            short_axis = base_size * ZOMBIE_DOG_SHORT_AXIS_RATIO
-            self.directional_images = build_zombie_dog_directional_surfaces(
-                long_axis, short_axis, is_trapped=True
-            )
-        else:
-            self.directional_images = build_zombie_directional_surfaces(
-                int(self.radius), draw_hands=False, is_trapped=True
-            )
-
+        self.directional_images = self._build_directional_images()
         self.image = self.directional_images[self.facing_bin]
         self.rect = self.image.get_rect(center=(int(x), int(y)))
 
@@ -851,7 +839,7 @@ class TrappedZombie(pygame.sprite.Sprite):
             decay_duration_frames=decay_duration_frames,
             decay_min_speed_ratio=ZOMBIE_DECAY_MIN_SPEED_RATIO,
             carbonize_decay_frames=ZOMBIE_CARBONIZE_DECAY_FRAMES,
-            on_health_ratio=lambda _r: None,  # No speed change needed
+            on_health_ratio=self._ignore_health_ratio,  # No speed change needed
             on_kill=self.kill,
             on_carbonize=self._apply_carbonize_visuals,
         )
@@ -870,6 +858,28 @@ class TrappedZombie(pygame.sprite.Sprite):
     def carbonized(self: Self) -> bool:
         return self.vitals.carbonized
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.directional_images = self._build_directional_images()
+        self.image = self.directional_images[self.facing_bin]
+        if self.vitals.carbonized:
+            self._apply_carbonize_visuals()
+
+    def _build_directional_images(self: Self) -> list[pygame.Surface]:
+        if self.kind == ZombieKind.DOG:
+            base_size = ZOMBIE_RADIUS * 2.0
+            long_axis = base_size * ZOMBIE_DOG_LONG_AXIS_RATIO
+            short_axis = base_size * ZOMBIE_DOG_SHORT_AXIS_RATIO
+            return build_zombie_dog_directional_surfaces(
+                long_axis, short_axis, is_trapped=True
+            )
+        return build_zombie_directional_surfaces(
+            int(self.radius), draw_hands=False, is_trapped=True
+        )
+
+    def _ignore_health_ratio(self: Self, _ratio: float) -> None:
+        pass
+
     def _apply_carbonize_visuals(self: Self) -> None:
         self.image = build_grayscale_image(self.image)
 
@@ -892,8 +902,8 @@ class TrappedZombie(pygame.sprite.Sprite):
 
         # Jitter visuals at 1/4 speed
         if self.frame_counter % 4 == 0:
-            ox = random.uniform(-1.0, 1.0)
-            oy = random.uniform(-1.0, 1.0)
+            ox = FX_RNG.uniform(-1.0, 1.0)
+            oy = FX_RNG.uniform(-1.0, 1.0)
             self.rect.center = (int(self.x + ox), int(self.y + oy))
         self.frame_counter += 1
 
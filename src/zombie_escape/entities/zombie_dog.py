@@ -50,7 +50,8 @@ from ..entities_constants import (
     ZOMBIE_SEPARATION_DISTANCE,
 )
 from ..rng import get_rng
-from ..surface_effects import SpikyPlantLike, is_in_contaminated_cell, is_in_puddle_cell
+from ..hazard_grid import HAZARD_CONTAMINATED, HAZARD_PUDDLE, surface_flags_at
+from ..surface_effects import SpikyPlantLike
 from ..render.entity_overlays import draw_paralyze_marker_overlay
 from ..render_constants import ENTITY_SHADOW_RADIUS_MULT, ZOMBIE_NOSE_COLOR
 from ..render_assets import (
@@ -66,7 +67,7 @@ from .zombie_visuals import build_grayscale_image
 from .zombie_vitals import ZombieVitals
 
 
-RNG = get_rng()
+RNG = get_rng("ai")
 
 
 class ZombieDogMode(Enum):
@@ -419,18 +420,7 @@ class ZombieDog(pygame.sprite.Sprite):
             self.movement_strategy = movement_strategy or _zombie_dog_default_movement
         self.kind = ZombieKind.DOG
         self.facing_bin = 0
-        self.directional_images = build_zombie_dog_directional_surfaces(
-            self.long_axis,
-            self.short_axis,
-        )
-        if self.variant == ZombieDogVariant.NIMBLE:
-            self.directional_images = self._build_nimble_directional_images(
-                self.directional_images
-            )
-        elif self.variant == ZombieDogVariant.TRACKER:
-            self.directional_images = self._build_tracker_directional_images(
-                self.directional_images
-            )
+        self.directional_images = self._build_directional_images()
         self.image = self.directional_images[self.facing_bin]
         self.rect = self.image.get_rect(center=(x, y))
         self.x = float(self.rect.centerx)
@@ -554,6 +544,21 @@ class ZombieDog(pygame.sprite.Sprite):
     def _apply_carbonize_visuals(self: Self) -> None:
         self.image = build_grayscale_image(self.image)
 
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.directional_images = self._build_directional_images()
+        self._refresh_variant_image()
+        if self.vitals.carbonized:
+            self._apply_carbonize_visuals()
+
+    def _build_directional_images(self: Self) -> list[pygame.Surface]:
+        images = build_zombie_dog_directional_surfaces(self.long_axis, self.short_axis)
+        if self.variant == ZombieDogVariant.NIMBLE:
+            return self._build_nimble_directional_images(images)
+        if self.variant == ZombieDogVariant.TRACKER:
+            return self._build_tracker_directional_images(images)
+        return images
+
     def _set_mode(self: Self, new_mode: ZombieDogMode) -> None:
         if self.mode == new_mode:
             return
@@ -865,21 +870,12 @@ class ZombieDog(pygame.sprite.Sprite):
         move_x += drift_x
         move_y += drift_y
 
-        # Puddle slow-down
-        if is_in_puddle_cell(
-            self.x,
-            self.y,
-            cell_size=cell_size,
-            puddle_cells=layout.puddle_cells,
-        ):
+        # Puddle / contamination slow-down
+        surface = surface_flags_at(layout, self.x, self.y, cell_size=cell_size)
+        if surface & HAZARD_PUDDLE:
             move_x *= PUDDLE_SPEED_FACTOR
             move_y *= PUDDLE_SPEED_FACTOR
-        if is_in_contaminated_cell(
-            self.x,
-            self.y,
-            cell_size=cell_size,
-            contaminated_cells=layout.zombie_contaminated_cells,
-        ):
+        if surface & HAZARD_CONTAMINATED:
             move_x *= ZOMBIE_CONTAMINATED_SPEED_FACTOR
             move_y *= ZOMBIE_CONTAMINATED_SPEED_FACTOR
         if nearby_zombies:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import weakref
 from typing import Iterable, TYPE_CHECKING
 
 import pygame
@@ -29,7 +30,11 @@ if TYPE_CHECKING:
     from ..models import Footprint, LevelLayout
     from . import Zombie
 
-RNG = get_rng()
+RNG = get_rng("ai")
+
+_wall_hug_blocked_cache: (
+    tuple[weakref.ref[LevelLayout], tuple[int, int], set[tuple[int, int]]] | None
+) = None
 
 
 def _set_wander_heading_toward_player_if_close(
@@ -214,11 +219,23 @@ def _zombie_wall_hug_wall_distance(
 
 
 def _wall_hug_blocked_cells(layout: "LevelLayout") -> set[tuple[int, int]]:
+    global _wall_hug_blocked_cache
+    wall_grid = layout.wall_grid
+    occupancy = layout.material_occupancy
+    key = None
+    if wall_grid is not None and occupancy is not None:
+        # Versioned sources: reuse the union until a wall falls or a material moves.
+        key = (wall_grid.version, occupancy.version)
+        cached = _wall_hug_blocked_cache
+        if cached is not None and cached[0]() is layout and cached[1] == key:
+            return cached[2]
     blocked = set(layout.wall_cells)
     blocked.update(layout.outer_wall_cells)
     blocked.update(layout.steel_beam_cells)
     blocked.update(layout.fire_floor_cells)
     blocked.update(layout.material_cells)
+    if key is not None:
+        _wall_hug_blocked_cache = (weakref.ref(layout), key, blocked)
     return blocked
 
 
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from importlib import resources
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Callable, Iterator, TypeVar
 
 import pygame
 
 _FONT_CACHE: dict[tuple[str | None, int], pygame.font.Font] = {}
 _FONT_META: dict[int, tuple[str | None, int]] = {}
 
+TEXT_LAYOUT_CACHE_LIMIT = 256
+# LRU of wrapped line breaks / rendered line surfaces. Entries keep a reference
+# to their font so an id() based key can never be reused by a different font.
+_TEXT_LAYOUT_CACHE: OrderedDict[tuple[Any, ...], tuple[pygame.font.Font, Any]] = (
+    OrderedDict()
+)
+
+_T = TypeVar("_T")
+
 
 @contextmanager
 def _resource_path(resource: str | None) -> Iterator[Path | None]:
@@ -60,6 +70,27 @@ def render_text_surface(
     return padded
 
 
+def cached_text_layout(
+    font: pygame.font.Font,
+    key: tuple[Any, ...],
+    build: Callable[[], _T],
+) -> _T:
+    """Return the cached layout for (font, key), building it on a miss."""
+    font_key = _FONT_META.get(id(font)) or ("font", id(font))
+    cache_key = (font_key, *key)
+    entry = _TEXT_LAYOUT_CACHE.get(cache_key)
+    if entry is not None and entry[0] is font:
+        _TEXT_LAYOUT_CACHE.move_to_end(cache_key)
+        return entry[1]
+    value = build()
+    _TEXT_LAYOUT_CACHE[cache_key] = (font, value)
+    _TEXT_LAYOUT_CACHE.move_to_end(cache_key)
+    while len(_TEXT_LAYOUT_CACHE) > TEXT_LAYOUT_CACHE_LIMIT:
+        _TEXT_LAYOUT_CACHE.popitem(last=False)
+    return value
+
+
 def clear_font_cache() -> None:
     _FONT_CACHE.clear()
     _FONT_META.clear()
+    _TEXT_LAYOUT_CACHE.clear()
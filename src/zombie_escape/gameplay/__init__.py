@@ -2,55 +2,133 @@
 
 # ruff: noqa: F401
 
-from .ambient import sync_ambient_palette_with_flashlights
-from .footprints import get_shrunk_sprite, update_footprints
-from .entity_interactions import check_interactions
-from .layout import MapGenerationError, generate_level_from_blueprint
-from .entity_updates import process_player_input, update_entities
-from .spawn import (
-    maintain_waiting_car_supply,
-    nearest_waiting_car,
-    place_buddies,
-    place_empty_fuel_can,
-    place_flashlights,
-    place_fuel_can,
-    place_fuel_station,
-    place_new_car,
-    place_shoes,
-    setup_player_and_cars,
-    spawn_initial_carrier_bots_and_materials,
-    spawn_initial_patrol_bots,
-    spawn_spiky_plants,
-    spawn_exterior_zombie,
-    spawn_initial_zombies,
-    spawn_survivors,
-    spawn_waiting_car,
-    spawn_weighted_zombie,
-)
-from .state import (
-    carbonize_outdoor_zombies,
-    initialize_game_state,
-    schedule_timed_message,
-    update_endurance_timer,
-)
-from .survivors import (
-    add_survivor_message,
-    apply_passenger_speed_penalty,
-    calculate_car_speed_for_passengers,
-    cleanup_survivor_messages,
-    drop_survivors_from_car,
-    handle_survivor_zombie_collisions,
-    increase_survivor_capacity,
-    random_survivor_conversion_line,
-    respawn_buddies_near_player,
-    update_survivors,
-)
-from .utils import (
-    find_exterior_spawn_position,
-    find_interior_spawn_positions,
-    find_nearby_offscreen_spawn_position,
-    rect_visible_on_screen,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from .ambient import (
+        bake_ambient_wall_palettes,
+        prepare_ambient_wall_palettes,
+        sync_ambient_palette_with_flashlights,
+    )
+    from .footprints import get_shrunk_sprite, update_footprints
+    from .entity_interactions import check_interactions
+    from .layout import MapGenerationError, generate_level_from_blueprint
+    from .entity_updates import process_player_input, update_entities
+    from .spawn import (
+        maintain_waiting_car_supply,
+        nearest_waiting_car,
+        place_buddies,
+        place_empty_fuel_can,
+        place_flashlights,
+        place_fuel_can,
+        place_fuel_station,
+        place_new_car,
+        place_shoes,
+        setup_player_and_cars,
+        spawn_initial_carrier_bots_and_materials,
+        spawn_initial_patrol_bots,
+        spawn_spiky_plants,
+        spawn_exterior_zombie,
+        spawn_initial_zombies,
+        spawn_survivors,
+        spawn_waiting_car,
+        spawn_weighted_zombie,
+    )
+    from .snapshot import restore_game_data, snapshot_game_data
+    from .state import (
+        carbonize_outdoor_zombies,
+        initialize_game_state,
+        schedule_timed_message,
+        update_endurance_timer,
+    )
+    from .survivors import (
+        add_survivor_message,
+        apply_passenger_speed_penalty,
+        calculate_car_speed_for_passengers,
+        cleanup_survivor_messages,
+        drop_survivors_from_car,
+        handle_survivor_zombie_collisions,
+        increase_survivor_capacity,
+        random_survivor_conversion_line,
+        respawn_buddies_near_player,
+        update_survivors,
+    )
+    from .utils import (
+        find_exterior_spawn_position,
+        find_interior_spawn_positions,
+        find_nearby_offscreen_spawn_position,
+        rect_visible_on_screen,
+    )
+
+# Helpers resolve on first access so importing one gameplay module does not
+# load the level generator, spawners, and every entity type up front.
+_LAZY_EXPORTS = {
+    "bake_ambient_wall_palettes": ".ambient",
+    "prepare_ambient_wall_palettes": ".ambient",
+    "sync_ambient_palette_with_flashlights": ".ambient",
+    "get_shrunk_sprite": ".footprints",
+    "update_footprints": ".footprints",
+    "check_interactions": ".entity_interactions",
+    "MapGenerationError": ".layout",
+    "generate_level_from_blueprint": ".layout",
+    "process_player_input": ".entity_updates",
+    "update_entities": ".entity_updates",
+    "maintain_waiting_car_supply": ".spawn",
+    "nearest_waiting_car": ".spawn",
+    "place_buddies": ".spawn",
+    "place_empty_fuel_can": ".spawn",
+    "place_flashlights": ".spawn",
+    "place_fuel_can": ".spawn",
+    "place_fuel_station": ".spawn",
+    "place_new_car": ".spawn",
+    "place_shoes": ".spawn",
+    "setup_player_and_cars": ".spawn",
+    "spawn_initial_carrier_bots_and_materials": ".spawn",
+    "spawn_initial_patrol_bots": ".spawn",
+    "spawn_spiky_plants": ".spawn",
+    "spawn_exterior_zombie": ".spawn",
+    "spawn_initial_zombies": ".spawn",
+    "spawn_survivors": ".spawn",
+    "spawn_waiting_car": ".spawn",
+    "spawn_weighted_zombie": ".spawn",
+    "restore_game_data": ".snapshot",
+    "snapshot_game_data": ".snapshot",
+    "carbonize_outdoor_zombies": ".state",
+    "initialize_game_state": ".state",
+    "schedule_timed_message": ".state",
+    "update_endurance_timer": ".state",
+    "add_survivor_message": ".survivors",
+    "apply_passenger_speed_penalty": ".survivors",
+    "calculate_car_speed_for_passengers": ".survivors",
+    "cleanup_survivor_messages": ".survivors",
+    "drop_survivors_from_car": ".survivors",
+    "handle_survivor_zombie_collisions": ".survivors",
+    "increase_survivor_capacity": ".survivors",
+    "random_survivor_conversion_line": ".survivors",
+    "respawn_buddies_near_player": ".survivors",
+    "update_survivors": ".survivors",
+    "find_exterior_spawn_position": ".utils",
+    "find_interior_spawn_positions": ".utils",
+    "find_nearby_offscreen_spawn_position": ".utils",
+    "rect_visible_on_screen": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "MapGenerationError",
@@ -96,4 +174,8 @@ __all__ = [
     "update_entities",
     "check_interactions",
     "sync_ambient_palette_with_flashlights",
+    "prepare_ambient_wall_palettes",
+    "bake_ambient_wall_palettes",
+    "snapshot_game_data",
+    "restore_game_data",
 ]
@@ -5,6 +5,7 @@ from ..colors import (
     ambient_palette_key_for_flashlights,
     get_environment_palette,
 )
+from ..entities.wall_grid import WALL_PALETTE_BAKE_PER_FRAME, GridSteelBeam, GridWall
 from ..models import GameData
 
 
@@ -33,6 +34,33 @@ def sync_ambient_palette_with_flashlights(
     _set_ambient_palette(game_data, key, force=force)
 
 
+def prepare_ambient_wall_palettes(game_data: GameData) -> int:
+    """Queue wall surfaces for every ambient palette this level can switch to."""
+
+    wall_grid = getattr(getattr(game_data, "layout", None), "wall_grid", None)
+    if wall_grid is None:
+        return 0
+    keys = [
+        ambient_palette_key_for_flashlights(0),
+        ambient_palette_key_for_flashlights(1),
+    ]
+    if game_data.stage.endurance_stage:
+        keys.append(DAWN_AMBIENT_PALETTE_KEY)
+    palettes = {id(palette): palette for palette in map(get_environment_palette, keys)}
+    return wall_grid.prepare_palettes(palettes.values())
+
+
+def bake_ambient_wall_palettes(
+    game_data: GameData, *, limit: int = WALL_PALETTE_BAKE_PER_FRAME
+) -> int:
+    """Paint a few queued wall surfaces; call once per frame after drawing."""
+
+    wall_grid = getattr(getattr(game_data, "layout", None), "wall_grid", None)
+    if wall_grid is None:
+        return 0
+    return wall_grid.bake_pending(limit)
+
+
 def _apply_palette_to_walls(
     game_data: GameData,
     palette,
@@ -41,8 +69,14 @@ def _apply_palette_to_walls(
 ) -> None:
     if not hasattr(game_data, "groups") or not hasattr(game_data.groups, "wall_group"):
         return
+    wall_grid = getattr(getattr(game_data, "layout", None), "wall_grid", None)
+    if wall_grid is not None:
+        # Grid views share surfaces; one swap covers all of them.
+        wall_grid.set_palette(palette)
     wall_group = game_data.groups.wall_group
     for wall in wall_group:
+        if isinstance(wall, (GridWall, GridSteelBeam)) and wall.grid is wall_grid:
+            continue
         if not hasattr(wall, "set_palette"):
             continue
         wall.set_palette(palette, force=force)
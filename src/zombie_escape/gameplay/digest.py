@@ -0,0 +1,166 @@
+"""Rolling state digests for spotting nondeterminism between two runs."""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable
+
+from ..models import GameData
+from ..rng import get_rng_positions
+
+# Positions are hashed in 1/8 px steps: fine enough to catch drift early,
+# coarse enough that the digest never depends on float formatting.
+DIGEST_POSITION_STEPS = 8
+DIGEST_SUBSYSTEMS = (
+    "clock",
+    "player",
+    "zombies",
+    "survivors",
+    "bots",
+    "walls",
+    "rng",
+)
+DIGEST_FORMAT_VERSION = 1
+
+_ENTITY = struct.Struct("<iiii")
+
+
+def _quantize(value: float) -> int:
+    return int(round(float(value) * DIGEST_POSITION_STEPS))
+
+
+def _entity_bytes(entities: Iterable[object]) -> bytes:
+    chunks: list[bytes] = []
+    for entity in entities:
+        rect = entity.rect  # type: ignore[attr-defined]
+        x = getattr(entity, "x", rect.centerx)
+        y = getattr(entity, "y", rect.centery)
+        health = getattr(entity, "health", 0)
+        kind = zlib.crc32(type(entity).__name__.encode())
+        chunks.append(
+            _ENTITY.pack(kind - 2**31, _quantize(x), _quantize(y), _quantize(health))
+        )
+    return b"".join(chunks)
+
+
+def compute_state_digests(game_data: GameData) -> dict[str, int]:
+    """Return a CRC32 per subsystem for the current simulation state.
+
+    Covers quantized positions and health of every mobile entity, wall and
+    hazard grids, the game clock and the position of each RNG stream. Groups
+    are walked in insertion order, which is stable for a given seed and input.
+    """
+    state = game_data.state
+    groups = game_data.groups
+    layout = game_data.layout
+    player_side = [
+        entity for entity in (game_data.player, game_data.car) if entity is not None
+    ]
+    clock = (
+        f"{state.clock.elapsed_ms}:{int(state.game_over)}:{int(state.game_won)}:"
+        f"{state.survivors_onboard}:{state.survivors_rescued}:{state.buddy_onboard}"
+    )
+    walls = b""
+    if layout.wall_grid is not None:
+        walls = layout.wall_grid.health.tobytes()
+    hazards = b"" if layout.hazard_grid is None else layout.hazard_grid.grid.tobytes()
+    rng = repr(sorted(get_rng_positions().items()))
+    return {
+        "clock": zlib.crc32(clock.encode()),
+        "player": zlib.crc32(_entity_bytes(player_side)),
+        "zombies": zlib.crc32(_entity_bytes(groups.zombie_group)),
+        "survivors": zlib.crc32(_entity_bytes(groups.survivor_group)),
+        "bots": zlib.crc32(
+            _entity_bytes(groups.patrol_bot_group)
+            + _entity_bytes(groups.carrier_bot_group)
+            + _entity_bytes(groups.material_group)
+        ),
+        "walls": zlib.crc32(hazards, zlib.crc32(walls)),
+        "rng": zlib.crc32(rng.encode()),
+    }
+
+
+@dataclass
+class StateDigestRecorder:
+    """Write rolling subsystem digests every `interval` simulation ticks.
+
+    Each subsystem's value is chained with its previous checkpoint, so once
+    two runs diverge every later line differs as well and the first
+    mismatching line pinpoints where it started. Lines are JSON objects
+    (`{"frame": n, "digests": {subsystem: hex}}`) after a header line.
+    """
+
+    stream: IO[str]
+    interval: int = 30
+    rolling: dict[str, int] = field(default_factory=dict)
+
+    def write_header(self, **fields: object) -> None:
+        header = {"format": DIGEST_FORMAT_VERSION, **fields}
+        self.stream.write(json.dumps(header, sort_keys=True) + "\n")
+
+    def record(self, frame: int, game_data: GameData) -> bool:
+        """Append a checkpoint if `frame` falls on the interval."""
+        if self.interval <= 0 or frame % self.interval:
+            return False
+        digests = compute_state_digests(game_data)
+        rolling = self.rolling
+        for name in DIGEST_SUBSYSTEMS:
+            seed = rolling.get(name, 0)
+            rolling[name] = zlib.crc32(digests[name].to_bytes(4, "little"), seed)
+        line = {
+            "frame": frame,
+            "digests": {name: f"{rolling[name]:08x}" for name in DIGEST_SUBSYSTEMS},
+        }
+        self.stream.write(json.dumps(line) + "\n")
+        return True
+
+
+@dataclass(frozen=True)
+class DigestDivergence:
+    """First checkpoint where two digest logs disagree."""
+
+    frame: int
+    subsystems: tuple[str, ...]
+
+
+def read_digest_log(path: Path) -> tuple[dict, dict[int, dict[str, str]]]:
+    """Return the header and the `{frame: digests}` checkpoints of a log."""
+    with path.open("r", encoding="utf-8") as handle:
+        lines = [json.loads(line) for line in handle if line.strip()]
+    if not lines or lines[0].get("format") != DIGEST_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a digest log")
+    checkpoints = {int(line["frame"]): line["digests"] for line in lines[1:]}
+    return lines[0], checkpoints
+
+
+def find_first_divergence(
+    expected: dict[int, dict[str, str]],
+    actual: dict[int, dict[str, str]],
+) -> DigestDivergence | None:
+    """Compare checkpoints both logs recorded; return the earliest mismatch.
+
+    Subsystems are listed in `DIGEST_SUBSYSTEMS` order. Frames only one log
+    reached (one run ended earlier) are ignored.
+    """
+    for frame in sorted(expected.keys() & actual.keys()):
+        before, after = expected[frame], actual[frame]
+        changed = tuple(
+            name for name in DIGEST_SUBSYSTEMS if before.get(name) != after.get(name)
+        )
+        if changed:
+            return DigestDivergence(frame, changed)
+    return None
+
+
+__all__ = [
+    "DIGEST_SUBSYSTEMS",
+    "DigestDivergence",
+    "StateDigestRecorder",
+    "compute_state_digests",
+    "find_first_divergence",
+    "read_digest_log",
+]
@@ -72,7 +72,7 @@ def _ms_to_frames(ms: int) -> int:
     return max(1, int(round(ms / (1000 / max(1, FPS)))))
 
 
-RNG = get_rng()
+RNG = get_rng("spawn")
 
 # --- Car vs zombie damage (interaction rules) ---
 CAR_ZOMBIE_RAM_DAMAGE = 6
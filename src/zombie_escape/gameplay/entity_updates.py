@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 from typing import Any, Sequence
 
+import numpy as np
 import pygame
 
 from ..entities import (
@@ -29,18 +30,22 @@ from ..entities_constants import (
     ZOMBIE_SEPARATION_DISTANCE,
     ZOMBIE_WALL_HUG_SENSOR_DISTANCE,
 )
+from ..hazard_grid import (
+    HAZARD_ELECTRIFIED,
+    HAZARD_FIRE_FLOOR,
+    surface_flags_at,
+)
 from ..gameplay_constants import (
     SHOES_SPEED_MULTIPLIER_ONE,
     SHOES_SPEED_MULTIPLIER_TWO,
 )
-from ..models import FallingEntity, GameData
-from ..rng import get_rng
+from ..models import FallingEntity, GameData, LevelLayout
 from ..surface_effects import resolve_surface_speed_factor
 from ..entities.movement_helpers import pitfall_target
 from ..world_grid import WallIndex, apply_cell_edge_nudge, walls_for_radius
 from .moving_floor import get_floor_overlap_rect, get_moving_floor_drift
 from .constants import LAYER_PLAYERS, MAX_ZOMBIES
-from ..render.decay_effects import DecayingEntityEffect, update_decay_effects
+from ..render.decay_effects import spawn_decay_effect, update_decay_effects
 from .spawn import spawn_weighted_zombie, update_falling_zombies
 from .spatial_index import SpatialKind
 from .survivors import update_survivors
@@ -50,29 +55,34 @@ from .utils import (
     rect_visible_on_screen,
 )
 
-RNG = get_rng()
-
 
-def _cell_at_position(
+def _is_on_fire_floor(
     x: float,
     y: float,
     *,
     cell_size: int,
-) -> tuple[int, int] | None:
-    if cell_size <= 0:
-        return None
-    return (int(x // cell_size), int(y // cell_size))
+    layout: LevelLayout,
+) -> bool:
+    flags = surface_flags_at(layout, x, y, cell_size=cell_size)
+    return bool(flags & HAZARD_FIRE_FLOOR)
 
 
-def _is_on_fire_floor(
-    x: float,
-    y: float,
+def _surface_flags_for(
+    entities: Sequence[pygame.sprite.Sprite],
     *,
     cell_size: int,
-    fire_floor_cells: set[tuple[int, int]],
-) -> bool:
-    cell = _cell_at_position(x, y, cell_size=cell_size)
-    return bool(cell is not None and cell in fire_floor_cells)
+    layout: LevelLayout,
+) -> list[int]:
+    """Return the hazard bits under each entity, batched when the grid exists."""
+    hazards = layout.hazard_grid
+    if hazards is None or not entities:
+        return [
+            surface_flags_at(layout, e.x, e.y, cell_size=cell_size)  # type: ignore[attr-defined]
+            for e in entities
+        ]
+    xs = np.fromiter((e.x for e in entities), dtype=np.float64, count=len(entities))  # type: ignore[attr-defined]
+    ys = np.fromiter((e.y for e in entities), dtype=np.float64, count=len(entities))  # type: ignore[attr-defined]
+    return hazards.flags_at_points(xs, ys).tolist()
 
 
 def process_player_input(
@@ -137,6 +147,57 @@ def _shoes_speed_multiplier(shoes_count: int) -> float:
     return 1.0
 
 
+def _refresh_material_cells(game_data: GameData) -> None:
+    """Rebuild `material_cells` for layouts without a `MaterialOccupancy`.
+
+    Generated levels track materials through pickup/drop/move events, so this
+    is a no-op for them.
+    """
+    layout = game_data.layout
+    if layout.material_occupancy is not None:
+        return
+    material_cells: set[tuple[int, int]] = set()
+    cell_size = game_data.cell_size
+    if cell_size > 0:
+        for material in game_data.groups.material_group:
+            if not material.alive() or getattr(material, "carried_by", None) is not None:
+                continue
+            cx = int(material.rect.centerx // cell_size)
+            cy = int(material.rect.centery // cell_size)
+            if 0 <= cx < layout.grid_cols and 0 <= cy < layout.grid_rows:
+                material_cells.add((cx, cy))
+    layout.material_cells = material_cells
+
+
+def _refresh_electrified_cells(
+    game_data: GameData, patrol_bots: Sequence[PatrolBot]
+) -> None:
+    """Rebuild `electrified_cells` for layouts without an `ElectrifiedFloor`.
+
+    Generated levels track patrol bots as they cross cell boundaries, so this
+    only points the state at the tracked set for them.
+    """
+    layout = game_data.layout
+    floor = layout.electrified_floor
+    if floor is not None:
+        game_data.state.electrified_cells = floor.cells
+        return
+    electrified_cells: set[tuple[int, int]] = set()
+    if game_data.cell_size > 0:
+        for bot in patrol_bots:
+            if not bot.alive():
+                continue
+            cell = (
+                int(bot.rect.centerx // game_data.cell_size),
+                int(bot.rect.centery // game_data.cell_size),
+            )
+            if 0 <= cell[0] < layout.grid_cols and 0 <= cell[1] < layout.grid_rows:
+                electrified_cells.add(cell)
+    game_data.state.electrified_cells = electrified_cells
+    if layout.hazard_grid is not None:
+        layout.hazard_grid.replace_cells(electrified_cells, HAZARD_ELECTRIFIED)
+
+
 def update_entities(
     game_data: GameData,
     player_dx: float,
@@ -177,18 +238,7 @@ def update_entities(
     fire_floor_cells = game_data.layout.fire_floor_cells
     field_rect = game_data.layout.field_rect
     current_time = game_data.state.clock.elapsed_ms
-    if game_data.cell_size > 0:
-        material_cells: set[tuple[int, int]] = set()
-        for material in material_group:
-            if not material.alive() or getattr(material, "carried_by", None) is not None:
-                continue
-            cx = int(material.rect.centerx // game_data.cell_size)
-            cy = int(material.rect.centery // game_data.cell_size)
-            if 0 <= cx < game_data.layout.grid_cols and 0 <= cy < game_data.layout.grid_rows:
-                material_cells.add((cx, cy))
-        game_data.layout.material_cells = material_cells
-    else:
-        game_data.layout.material_cells = set()
+    _refresh_material_cells(game_data)
 
     all_walls = list(wall_group) if wall_index is None else None
 
@@ -327,15 +377,14 @@ def update_entities(
                 player.x,
                 player.y,
                 cell_size=game_data.cell_size,
-                fire_floor_cells=fire_floor_cells,
+                layout=game_data.layout,
             )
         ):
-            game_data.state.decay_effects.append(
-                DecayingEntityEffect(
-                    player.image,
-                    player.rect.center,
-                    tone="burned",
-                )
+            spawn_decay_effect(
+                game_data.state.decay_effects,
+                player.image,
+                player.rect.center,
+                tone="burned",
             )
             if player in all_sprites:
                 all_sprites.remove(player)
@@ -409,17 +458,18 @@ def update_entities(
         wall_target_cell=wall_target_cell,
         patrol_bot_group=patrol_bot_group,
     )
-    for survivor in list(survivor_group):
+    survivors = list(survivor_group)
+    survivor_flags = _surface_flags_for(
+        survivors, cell_size=game_data.cell_size, layout=game_data.layout
+    )
+    for survivor, flags in zip(survivors, survivor_flags):
         if not survivor.alive():
             continue
-        if _is_on_fire_floor(
-            survivor.x,
-            survivor.y,
-            cell_size=game_data.cell_size,
-            fire_floor_cells=fire_floor_cells,
-        ) and not getattr(survivor, "is_jumping", False):
-            game_data.state.decay_effects.append(
-                DecayingEntityEffect(survivor.image, survivor.rect.center)
+        if flags & HAZARD_FIRE_FLOOR and not getattr(survivor, "is_jumping", False):
+            spawn_decay_effect(
+                game_data.state.decay_effects,
+                survivor.image,
+                survivor.rect.center,
             )
             survivor.kill()
             if getattr(survivor, "is_buddy", False):
@@ -547,21 +597,8 @@ def update_entities(
     patrol_bots_sorted: list[PatrolBot] = sorted(
         list(patrol_bot_group), key=lambda b: b.x
     )
-    electrified_cells: set[tuple[int, int]] = set()
-    if game_data.cell_size > 0:
-        for bot in patrol_bots_sorted:
-            if not bot.alive():
-                continue
-            cell = (
-                int(bot.rect.centerx // game_data.cell_size),
-                int(bot.rect.centery // game_data.cell_size),
-            )
-            if (
-                0 <= cell[0] < game_data.layout.grid_cols
-                and 0 <= cell[1] < game_data.layout.grid_rows
-            ):
-                electrified_cells.add(cell)
-    game_data.state.electrified_cells = electrified_cells
+    _refresh_electrified_cells(game_data, patrol_bots_sorted)
+    electrified_cells = game_data.state.electrified_cells
 
     zombie_kinds = (
         SpatialKind.ZOMBIE | SpatialKind.ZOMBIE_DOG | SpatialKind.TRAPPED_ZOMBIE
@@ -713,8 +750,10 @@ def update_entities(
                     fov_target=fov_target,
                     flashlight_count=game_data.state.flashlight_count,
                 ):
-                    game_data.state.decay_effects.append(
-                        DecayingEntityEffect(zombie.image, zombie.rect.center)
+                    spawn_decay_effect(
+                        game_data.state.decay_effects,
+                        zombie.image,
+                        zombie.rect.center,
                     )
             continue
 
@@ -722,7 +761,7 @@ def update_entities(
             zombie.x,
             zombie.y,
             cell_size=game_data.cell_size,
-            fire_floor_cells=fire_floor_cells,
+            layout=game_data.layout,
         ):
             zombie.kill()
             fov_target = mounted_vehicle if player_mounted and mounted_vehicle else player
@@ -731,12 +770,11 @@ def update_entities(
                 fov_target=fov_target,
                 flashlight_count=game_data.state.flashlight_count,
             ):
-                game_data.state.decay_effects.append(
-                    DecayingEntityEffect(
-                        zombie.image,
-                        zombie.rect.center,
-                        tone="burned",
-                    )
+                spawn_decay_effect(
+                    game_data.state.decay_effects,
+                    zombie.image,
+                    zombie.rect.center,
+                    tone="burned",
                 )
             continue
 
@@ -828,17 +866,6 @@ def update_entities(
             blockers=blocker_entities,
             push_targets=push_targets,
         )
-    if game_data.cell_size > 0:
-        material_cells: set[tuple[int, int]] = set()
-        for material in material_group:
-            if not material.alive() or getattr(material, "carried_by", None) is not None:
-                continue
-            cx = int(material.rect.centerx // game_data.cell_size)
-            cy = int(material.rect.centery // game_data.cell_size)
-            if 0 <= cx < game_data.layout.grid_cols and 0 <= cy < game_data.layout.grid_rows:
-                material_cells.add((cx, cy))
-        game_data.layout.material_cells = material_cells
-    else:
-        game_data.layout.material_cells = set()
+    _refresh_material_cells(game_data)
 
     update_decay_effects(game_data.state.decay_effects, frames=1)
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+import logging
+import multiprocessing
+import os
 import random
 from typing import Any
 
 import pygame
 
 from ..colors import get_environment_palette
-from ..entities import ReinforcedWall, RubbleWall, SteelBeam, Wall
+from ..entities.material import MaterialOccupancy
+from ..entities.patrol_bot import ElectrifiedFloor
+from ..entities.wall_grid import WallGrid, WallKind
 from ..entities_constants import (
-    INTERNAL_WALL_BEVEL_DEPTH,
     INTERNAL_WALL_HEALTH,
     MovingFloorDirection,
     STEEL_BEAM_HEALTH,
 )
+from ..hazard_grid import HazardGrid
+from ..blueprint_cache import (
+    RngState,
+    blueprint_cache_key,
+    load_cached_blueprint,
+    store_cached_blueprint,
+)
 from ..level_constants import DEFAULT_STEEL_BEAM_CHANCE
-from ..render_assets import RUBBLE_ROTATION_DEG
 from ..render.world_tiles import build_floor_ruin_cells
 from .constants import LAYER_WALLS, OUTER_WALL_HEALTH
 from ..level_blueprints import (
@@ -28,9 +41,23 @@ from ..models import LevelLayout, Stage
 from ..models import FuelMode
 from ..rng import get_rng, seed_rng
 
-__all__ = ["generate_level_from_blueprint", "MapGenerationError"]
+__all__ = [
+    "blueprint_generation_kwargs",
+    "generate_level_from_blueprint",
+    "MapGenerationError",
+    "shutdown_blueprint_pool",
+]
+
+RNG = get_rng("layout")
+logger = logging.getLogger(__name__)
 
-RNG = get_rng()
+BLUEPRINT_MAX_ATTEMPTS = 20
+_BLUEPRINT_WORKERS_ENV = "ZOMBIE_ESCAPE_BLUEPRINT_WORKERS"
+_BLUEPRINT_DEFAULT_MAX_WORKERS = 3
+_blueprint_pool: ProcessPoolExecutor | None = None
+_blueprint_pool_workers = 0
+_blueprint_pool_failed = False
+_blueprint_pool_exit_hook = False
 
 
 @dataclass
@@ -53,15 +80,46 @@ class _WorldBuildResult:
     flashlight_cells: list[tuple[int, int]]
     shoes_cells: list[tuple[int, int]]
     bevel_corners: dict[tuple[int, int], tuple[bool, bool, bool, bool]]
+    wall_grid: WallGrid
 
 
-def _rect_for_cell(x_idx: int, y_idx: int, cell_size: int) -> pygame.Rect:
-    return pygame.Rect(
-        x_idx * cell_size,
-        y_idx * cell_size,
-        cell_size,
-        cell_size,
-    )
+@dataclass
+class _WallCellTracker:
+    """Keeps the build's cell sets in step as walls and beams are destroyed.
+
+    A dataclass rather than closures so `WallGrid` callbacks survive snapshots.
+    """
+
+    wall_cells: set[tuple[int, int]]
+    outer_wall_cells: set[tuple[int, int]]
+    steel_beam_cells: set[tuple[int, int]]
+    pitfall_cells: set[tuple[int, int]]
+    walkable_cells: list[tuple[int, int]]
+
+    def _remove_wall_cell(
+        self, cell: tuple[int, int], *, allow_walkable: bool = True
+    ) -> None:
+        if cell in self.wall_cells:
+            self.wall_cells.discard(cell)
+            if allow_walkable and cell not in self.walkable_cells:
+                self.walkable_cells.append(cell)
+        self.outer_wall_cells.discard(cell)
+
+    def on_wall_destroyed(self, cell: tuple[int, int], beam_exposed: bool) -> None:
+        self._remove_wall_cell(cell, allow_walkable=not beam_exposed)
+        if beam_exposed:
+            self.steel_beam_cells.add(cell)
+
+    def on_beam_destroyed(self, cell: tuple[int, int]) -> None:
+        if cell in self.steel_beam_cells:
+            self.steel_beam_cells.discard(cell)
+        if (
+            cell not in self.wall_cells
+            and cell not in self.outer_wall_cells
+            and cell not in self.pitfall_cells
+            and cell not in self.walkable_cells
+        ):
+            self.walkable_cells.append(cell)
 
 
 def _expand_zone_cells(
@@ -267,68 +325,199 @@ def _finalize_layout_cells(
     return walkable_cells, item_spawn_cells, car_spawn_cells, filtered_car_cells
 
 
+def blueprint_generation_kwargs(
+    stage: Stage, config: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the generator and validator kwargs used to build `stage`."""
+    fuel_count = 0
+    empty_fuel_can_count = 0
+    fuel_station_count = 0
+    if stage.fuel_mode < FuelMode.START_FULL and not stage.endurance_stage:
+        if stage.fuel_mode == FuelMode.REFUEL_CHAIN:
+            empty_fuel_can_count = max(1, int(stage.empty_fuel_can_spawn_count))
+            fuel_station_count = max(1, int(stage.fuel_station_spawn_count))
+        else:
+            fuel_count = max(0, int(stage.fuel_spawn_count))
+
+    steel_conf = config.get("steel_beams", {})
+    try:
+        steel_chance = float(steel_conf.get("chance", DEFAULT_STEEL_BEAM_CHANCE))
+    except (TypeError, ValueError):
+        steel_chance = DEFAULT_STEEL_BEAM_CHANCE
+
+    generator_kwargs: dict[str, Any] = {
+        "steel_chance": steel_chance,
+        "cols": stage.grid_cols,
+        "rows": stage.grid_rows,
+        "exit_sides": stage.exit_sides,
+        "wall_algo": stage.wall_algorithm,
+        "pitfall_density": stage.pitfall_density,
+        "pitfall_zones": stage.pitfall_zones,
+        "fire_floor_density": stage.fire_floor_density,
+        "fire_floor_zones": stage.fire_floor_zones,
+        "metal_floor_density": stage.metal_floor_density,
+        "metal_floor_zones": stage.metal_floor_zones,
+        "reinforced_wall_density": stage.reinforced_wall_density,
+        "reinforced_wall_zones": stage.reinforced_wall_zones,
+        "moving_floor_cells": _expand_moving_floor_cells(stage),
+        "fuel_count": fuel_count,
+        "empty_fuel_can_count": empty_fuel_can_count,
+        "fuel_station_count": fuel_station_count,
+        "flashlight_count": max(0, int(stage.flashlight_spawn_count)),
+        "shoes_count": max(0, int(stage.shoes_spawn_count)),
+        "spiky_plant_density": stage.spiky_plant_density,
+        "spiky_plant_zones": stage.spiky_plant_zones,
+        "puddle_density": stage.puddle_density,
+        "puddle_zones": stage.puddle_zones,
+    }
+    validation_kwargs: dict[str, Any] = {
+        "fuel_mode": (
+            stage.fuel_mode if not stage.endurance_stage else FuelMode.START_FULL
+        ),
+        "require_player_exit_path": stage.endurance_stage,
+        "require_car_spawn": not stage.endurance_stage,
+    }
+    return generator_kwargs, validation_kwargs
+
+
 def _generate_valid_blueprint_with_retries(
     *,
-    stage: Stage,
     seed: int | None,
-    steel_chance: float,
-    moving_floor_cells: dict[tuple[int, int], MovingFloorDirection],
-    fuel_count: int,
-    empty_fuel_can_count: int,
-    fuel_station_count: int,
-    flashlight_count: int,
-    shoes_count: int,
+    generator_kwargs: dict[str, Any],
+    validation_kwargs: dict[str, Any],
 ) -> Blueprint:
-    for attempt in range(20):
-        if seed is not None:
-            seed_rng(seed + attempt)
-        try:
-            blueprint = generate_random_blueprint(
-                steel_chance=steel_chance,
-                cols=stage.grid_cols,
-                rows=stage.grid_rows,
-                exit_sides=stage.exit_sides,
-                wall_algo=stage.wall_algorithm,
-                pitfall_density=stage.pitfall_density,
-                pitfall_zones=stage.pitfall_zones,
-                fire_floor_density=stage.fire_floor_density,
-                fire_floor_zones=stage.fire_floor_zones,
-                metal_floor_density=stage.metal_floor_density,
-                metal_floor_zones=stage.metal_floor_zones,
-                reinforced_wall_density=stage.reinforced_wall_density,
-                reinforced_wall_zones=stage.reinforced_wall_zones,
-                moving_floor_cells=moving_floor_cells,
-                fuel_count=fuel_count,
-                empty_fuel_can_count=empty_fuel_can_count,
-                fuel_station_count=fuel_station_count,
-                flashlight_count=flashlight_count,
-                shoes_count=shoes_count,
-                spiky_plant_density=stage.spiky_plant_density,
-                spiky_plant_zones=stage.spiky_plant_zones,
-                puddle_density=stage.puddle_density,
-                puddle_zones=stage.puddle_zones,
-            )
-        except MapGenerationError:
-            continue
+    cache_key = None
+    if seed is not None:
+        cache_key = blueprint_cache_key(
+            seed, {"generator": generator_kwargs, "validation": validation_kwargs}
+        )
+        cached = load_cached_blueprint(cache_key)
+        if cached is not None:
+            blueprint, rng_state = cached
+            # Leave the RNG exactly where generation would have, so spawns match.
+            RNG.setstate(rng_state)
+            return blueprint
+
+    result = _blueprint_attempt(seed, 0, generator_kwargs, validation_kwargs)
+    if result is None:
+        result = _run_remaining_attempts(seed, generator_kwargs, validation_kwargs)
+    if result is None:
+        raise MapGenerationError(
+            f"Blueprint generation/connectivity validation failed after "
+            f"{BLUEPRINT_MAX_ATTEMPTS} attempts"
+        )
+    blueprint, rng_state = result
+    if seed is not None:
+        # A speculative win ran in a worker; adopt its post-generation state.
+        RNG.setstate(rng_state)
+    store_cached_blueprint(cache_key, blueprint, rng_state)
+    return blueprint
 
-        require_car_spawn = not stage.endurance_stage
-        car_reachable = validate_connectivity(
-            blueprint.grid,
-            fuel_mode=(
-                stage.fuel_mode if not stage.endurance_stage else FuelMode.START_FULL
-            ),
-            require_player_exit_path=stage.endurance_stage,
-            require_car_spawn=require_car_spawn,
+
+def _blueprint_attempt(
+    seed: int | None,
+    attempt: int,
+    generator_kwargs: dict[str, Any],
+    validation_kwargs: dict[str, Any],
+) -> tuple[Blueprint, RngState] | None:
+    """Run one seeded generate+validate attempt (also the pool worker entry)."""
+    if seed is not None:
+        seed_rng(seed + attempt, stream="layout")
+    try:
+        blueprint = generate_random_blueprint(**generator_kwargs)
+    except MapGenerationError:
+        return None
+    car_reachable = validate_connectivity(blueprint.grid, **validation_kwargs)
+    if car_reachable is None:
+        return None
+    blueprint.car_reachable_cells = car_reachable
+    return blueprint, RNG.getstate()
+
+
+def _blueprint_workers() -> int:
+    raw = os.environ.get(_BLUEPRINT_WORKERS_ENV)
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return max(1, min(_BLUEPRINT_DEFAULT_MAX_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def _get_blueprint_pool(workers: int) -> ProcessPoolExecutor:
+    global _blueprint_pool, _blueprint_pool_workers, _blueprint_pool_exit_hook
+    if _blueprint_pool is None or _blueprint_pool_workers != workers:
+        shutdown_blueprint_pool()
+        _blueprint_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
         )
-        if car_reachable is None:
-            continue
+        _blueprint_pool_workers = workers
+        if not _blueprint_pool_exit_hook:
+            atexit.register(shutdown_blueprint_pool)
+            _blueprint_pool_exit_hook = True
+    return _blueprint_pool
 
-        blueprint.car_reachable_cells = car_reachable
-        return blueprint
 
-    raise MapGenerationError(
-        "Blueprint generation/connectivity validation failed after 20 attempts"
-    )
+def shutdown_blueprint_pool() -> None:
+    global _blueprint_pool, _blueprint_pool_workers
+    if _blueprint_pool is not None:
+        _blueprint_pool.shutdown(wait=False, cancel_futures=True)
+    _blueprint_pool = None
+    _blueprint_pool_workers = 0
+
+
+def _run_remaining_attempts(
+    seed: int | None,
+    generator_kwargs: dict[str, Any],
+    validation_kwargs: dict[str, Any],
+) -> tuple[Blueprint, RngState] | None:
+    """Run attempts 1.. and return the lowest-numbered valid one.
+
+    Unseeded runs (each attempt continues the shared RNG) and single-worker
+    setups stay sequential. Otherwise attempts are evaluated speculatively in
+    a process pool, but results are consumed strictly in attempt order, so the
+    winner is the same one the sequential loop would pick.
+    """
+    global _blueprint_pool_failed
+    attempts = range(1, BLUEPRINT_MAX_ATTEMPTS)
+    workers = 1 if _blueprint_pool_failed else _blueprint_workers()
+    if seed is None or workers <= 1:
+        for attempt in attempts:
+            result = _blueprint_attempt(
+                seed, attempt, generator_kwargs, validation_kwargs
+            )
+            if result is not None:
+                return result
+        return None
+
+    try:
+        pool = _get_blueprint_pool(workers)
+        pending: dict[int, Future] = {}
+        next_attempt = attempts.start
+        for attempt in attempts:
+            while next_attempt < attempts.stop and len(pending) < workers * 2:
+                pending[next_attempt] = pool.submit(
+                    _blueprint_attempt,
+                    seed,
+                    next_attempt,
+                    generator_kwargs,
+                    validation_kwargs,
+                )
+                next_attempt += 1
+            result = pending.pop(attempt).result()
+            if result is not None:
+                for future in pending.values():
+                    future.cancel()
+                return result
+        return None
+    except (BrokenProcessPool, OSError) as exc:
+        logger.warning(
+            "Blueprint worker pool unavailable, retrying sequentially: %s", exc
+        )
+        shutdown_blueprint_pool()
+        _blueprint_pool_failed = True
+        return _run_remaining_attempts(seed, generator_kwargs, validation_kwargs)
 
 
 def _build_world_from_blueprint(
@@ -372,37 +561,27 @@ def _build_world_from_blueprint(
     bevel_corners: dict[tuple[int, int], tuple[bool, bool, bool, bool]] = {}
     palette = get_environment_palette(ambient_palette_key)
     rubble_ratio = max(0.0, min(1.0, stage.wall_rubble_ratio))
+    wall_grid = WallGrid(
+        cols=stage.grid_cols,
+        rows=stage.grid_rows,
+        cell_size=cell_size,
+        palette=palette,
+    )
 
     def _has_wall(nx: int, ny: int) -> bool:
         if nx < 0 or ny < 0 or nx >= stage.grid_cols or ny >= stage.grid_rows:
             return True
         return (nx, ny) in wall_cells
 
-    def remove_steel_beam_cell(cell: tuple[int, int]) -> None:
-        if cell in steel_beam_cells:
-            steel_beam_cells.discard(cell)
-        if (
-            cell not in wall_cells
-            and cell not in outer_wall_cells
-            and cell not in pitfall_cells
-            and cell not in walkable_cells
-        ):
-            walkable_cells.append(cell)
-
-    def add_beam_to_groups(beam: SteelBeam, *, cell: tuple[int, int]) -> None:
-        if beam._added_to_groups:
-            return
-        wall_group.add(beam)
-        all_sprites.add(beam, layer=LAYER_WALLS)
-        steel_beam_cells.add(cell)
-        beam._added_to_groups = True
-
-    def remove_wall_cell(cell: tuple[int, int], *, allow_walkable: bool = True) -> None:
-        if cell in wall_cells:
-            wall_cells.discard(cell)
-            if allow_walkable and cell not in walkable_cells:
-                walkable_cells.append(cell)
-        outer_wall_cells.discard(cell)
+    tracker = _WallCellTracker(
+        wall_cells=wall_cells,
+        outer_wall_cells=outer_wall_cells,
+        steel_beam_cells=steel_beam_cells,
+        pitfall_cells=pitfall_cells,
+        walkable_cells=walkable_cells,
+    )
+    wall_grid.on_wall_destroyed = tracker.on_wall_destroyed
+    wall_grid.on_beam_destroyed = tracker.on_beam_destroyed
 
     for y, row in enumerate(blueprint):
         if len(row) != stage.grid_cols:
@@ -410,28 +589,18 @@ def _build_world_from_blueprint(
                 f"Blueprint width mismatch at row {y}: {len(row)} != {stage.grid_cols}"
             )
         for x, ch in enumerate(row):
-            cell_rect = _rect_for_cell(x, y, cell_size)
             cell_has_beam = steel_enabled and (x, y) in steel_cells
             if ch == "O":
                 outside_cells.add((x, y))
                 continue
             if ch == "B":
-                draw_bottom_side = not _has_wall(x, y + 1)
-                wall_cell = (x, y)
-                wall = Wall(
-                    cell_rect.x,
-                    cell_rect.y,
-                    cell_rect.width,
-                    cell_rect.height,
+                wall_grid.add_wall(
+                    x,
+                    y,
+                    WallKind.OUTER,
                     health=OUTER_WALL_HEALTH,
-                    palette=palette,
-                    palette_category="outer_wall",
-                    bevel_depth=0,
-                    draw_bottom_side=draw_bottom_side,
-                    on_destroy=(lambda _w, cell=wall_cell: remove_wall_cell(cell)),
+                    draw_bottom_side=not _has_wall(x, y + 1),
                 )
-                wall_group.add(wall)
-                all_sprites.add(wall, layer=LAYER_WALLS)
                 continue
             if ch == "R":
                 draw_bottom_side = not _has_wall(x, y + 1)
@@ -451,21 +620,14 @@ def _build_world_from_blueprint(
                 )
                 if any(bevel_mask):
                     bevel_corners[(x, y)] = bevel_mask
-                wall_cell = (x, y)
-                wall = ReinforcedWall(
-                    cell_rect.x,
-                    cell_rect.y,
-                    cell_rect.width,
-                    cell_rect.height,
+                wall_grid.add_wall(
+                    x,
+                    y,
+                    WallKind.REINFORCED,
                     health=OUTER_WALL_HEALTH,
-                    palette=palette,
-                    bevel_depth=INTERNAL_WALL_BEVEL_DEPTH,
                     bevel_mask=bevel_mask,
                     draw_bottom_side=draw_bottom_side,
-                    on_destroy=(lambda _w, cell=wall_cell: remove_wall_cell(cell)),
                 )
-                wall_group.add(wall)
-                all_sprites.add(wall, layer=LAYER_WALLS)
                 continue
             if ch == "x":
                 pitfall_cells.add((x, y))
@@ -492,18 +654,9 @@ def _build_world_from_blueprint(
                 if not cell_has_beam:
                     walkable_cells.append((x, y))
             elif ch == "1":
-                beam = None
                 if cell_has_beam:
-                    beam = SteelBeam(
-                        cell_rect.x,
-                        cell_rect.y,
-                        cell_rect.width,
-                        health=STEEL_BEAM_HEALTH,
-                        palette=palette,
-                        on_destroy=(
-                            lambda _b, cell=(x, y): remove_steel_beam_cell(cell)
-                        ),
-                    )
+                    # Hidden under the wall until it is destroyed.
+                    wall_grid.add_beam(x, y, health=STEEL_BEAM_HEALTH)
                 draw_bottom_side = not _has_wall(x, y + 1)
                 bevel_mask = (
                     not _has_wall(x, y - 1)
@@ -521,59 +674,24 @@ def _build_world_from_blueprint(
                 )
                 if any(bevel_mask):
                     bevel_corners[(x, y)] = bevel_mask
-                wall_cell = (x, y)
                 use_rubble = rubble_ratio > 0 and random.random() < rubble_ratio
                 if use_rubble:
-                    rotation_deg = (
-                        RUBBLE_ROTATION_DEG
-                        if random.random() < 0.5
-                        else -RUBBLE_ROTATION_DEG
-                    )
-                    wall = RubbleWall(
-                        cell_rect.x,
-                        cell_rect.y,
-                        cell_rect.width,
-                        cell_rect.height,
+                    wall_grid.add_wall(
+                        x,
+                        y,
+                        WallKind.RUBBLE,
                         health=INTERNAL_WALL_HEALTH,
-                        palette=palette,
-                        palette_category="inner_wall",
-                        bevel_depth=INTERNAL_WALL_BEVEL_DEPTH,
-                        rubble_rotation_deg=rotation_deg,
-                        on_destroy=(
-                            (
-                                lambda _w, b=beam, cell=wall_cell: (
-                                    remove_wall_cell(cell, allow_walkable=False),
-                                    add_beam_to_groups(b, cell=cell),
-                                )
-                            )
-                            if beam
-                            else (lambda _w, cell=wall_cell: remove_wall_cell(cell))
-                        ),
+                        rubble_flipped=random.random() >= 0.5,
                     )
                 else:
-                    wall = Wall(
-                        cell_rect.x,
-                        cell_rect.y,
-                        cell_rect.width,
-                        cell_rect.height,
+                    wall_grid.add_wall(
+                        x,
+                        y,
+                        WallKind.INNER,
                         health=INTERNAL_WALL_HEALTH,
-                        palette=palette,
-                        palette_category="inner_wall",
                         bevel_mask=bevel_mask,
                         draw_bottom_side=draw_bottom_side,
-                        on_destroy=(
-                            (
-                                lambda _w, b=beam, cell=wall_cell: (
-                                    remove_wall_cell(cell, allow_walkable=False),
-                                    add_beam_to_groups(b, cell=cell),
-                                )
-                            )
-                            if beam
-                            else (lambda _w, cell=wall_cell: remove_wall_cell(cell))
-                        ),
                     )
-                wall_group.add(wall)
-                all_sprites.add(wall, layer=LAYER_WALLS)
             else:
                 if not cell_has_beam:
                     walkable_cells.append((x, y))
@@ -603,16 +721,10 @@ def _build_world_from_blueprint(
                 shoes_cells.append((x, y))
 
             if cell_has_beam and ch != "1":
-                beam = SteelBeam(
-                    cell_rect.x,
-                    cell_rect.y,
-                    cell_rect.width,
-                    health=STEEL_BEAM_HEALTH,
-                    palette=palette,
-                    on_destroy=(lambda _b, cell=(x, y): remove_steel_beam_cell(cell)),
-                )
-                add_beam_to_groups(beam, cell=(x, y))
+                wall_grid.add_beam(x, y, health=STEEL_BEAM_HEALTH)
+                steel_beam_cells.add((x, y))
 
+    wall_grid.populate(wall_group, all_sprites, layer=LAYER_WALLS)
     return _WorldBuildResult(
         outer_wall_cells=outer_wall_cells,
         wall_cells=wall_cells,
@@ -632,6 +744,7 @@ def _build_world_from_blueprint(
         flashlight_cells=flashlight_cells,
         shoes_cells=shoes_cells,
         bevel_corners=bevel_corners,
+        wall_grid=wall_grid,
     )
 
 
@@ -655,35 +768,11 @@ def generate_level_from_blueprint(
     steel_conf = config.get("steel_beams", {})
     steel_enabled = steel_conf.get("enabled", False)
 
-    base_moving_floor_cells = _expand_moving_floor_cells(stage)
-    fuel_count = 0
-    empty_fuel_can_count = 0
-    fuel_station_count = 0
-    if stage.fuel_mode < FuelMode.START_FULL and not stage.endurance_stage:
-        if stage.fuel_mode == FuelMode.REFUEL_CHAIN:
-            empty_fuel_can_count = max(1, int(stage.empty_fuel_can_spawn_count))
-            fuel_station_count = max(1, int(stage.fuel_station_spawn_count))
-        else:
-            fuel_count = max(0, int(stage.fuel_spawn_count))
-    flashlight_count = max(0, int(stage.flashlight_spawn_count))
-    shoes_count = max(0, int(stage.shoes_spawn_count))
-
-    steel_conf = config.get("steel_beams", {})
-    try:
-        steel_chance = float(steel_conf.get("chance", DEFAULT_STEEL_BEAM_CHANCE))
-    except (TypeError, ValueError):
-        steel_chance = DEFAULT_STEEL_BEAM_CHANCE
-
+    generator_kwargs, validation_kwargs = blueprint_generation_kwargs(stage, config)
     blueprint_data = _generate_valid_blueprint_with_retries(
-        stage=stage,
         seed=seed,
-        steel_chance=steel_chance,
-        moving_floor_cells=base_moving_floor_cells,
-        fuel_count=fuel_count,
-        empty_fuel_can_count=empty_fuel_can_count,
-        fuel_station_count=fuel_station_count,
-        flashlight_count=flashlight_count,
-        shoes_count=shoes_count,
+        generator_kwargs=generator_kwargs,
+        validation_kwargs=validation_kwargs,
     )
     blueprint = blueprint_data.grid
     steel_cells_raw = blueprint_data.steel_cells
@@ -780,6 +869,21 @@ def generate_level_from_blueprint(
     layout.wall_cells = wall_cells
     layout.steel_beam_cells = steel_beam_cells
     layout.bevel_corners = bevel_corners
+    layout.wall_grid = world.wall_grid
+    layout.hazard_grid = HazardGrid.from_layout(layout, cell_size=cell_size)
+    layout.material_occupancy = MaterialOccupancy(
+        layout.material_cells,
+        cell_size=cell_size,
+        grid_cols=stage.grid_cols,
+        grid_rows=stage.grid_rows,
+        hazards=layout.hazard_grid,
+    )
+    layout.electrified_floor = ElectrifiedFloor(
+        cell_size=cell_size,
+        grid_cols=stage.grid_cols,
+        grid_rows=stage.grid_rows,
+        hazards=layout.hazard_grid,
+    )
 
     layout_data = _build_layout_data(
         layout=layout,
@@ -23,7 +23,7 @@ from ..rng import get_rng
 if TYPE_CHECKING:  # pragma: no cover - typing-only imports
     from ..models import GameData
 
-RNG = get_rng()
+RNG = get_rng("spawn")
 _MARKER_HISTORY_RECORD_DISTANCE = FOOTPRINT_STEP_DISTANCE * 0.6
 _MARKER_TRAIL_SPACING = FOOTPRINT_STEP_DISTANCE * 0.6
 _MERGE_APPROACH_DISTANCE = ZOMBIE_LINEFORMER_JOIN_RADIUS
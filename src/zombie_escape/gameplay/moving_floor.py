@@ -5,6 +5,7 @@ from typing import Protocol
 import pygame
 
 from ..entities_constants import MOVING_FLOOR_SPEED, MovingFloorDirection
+from ..hazard_grid import moving_floor_direction, surface_flags_at
 from ..models import LevelLayout
 
 
@@ -38,13 +39,9 @@ def get_overlapping_moving_floor_direction(
     """Return moving-floor direction for any tile overlapping the rect."""
     if cell_size <= 0 or not layout.moving_floor_cells:
         return None
-    center_x = int(rect.centerx // cell_size)
-    center_y = int(rect.centery // cell_size)
-    direction = layout.moving_floor_cells.get((center_x, center_y))
-    if direction is not None:
-        return direction
-
-    return None
+    return moving_floor_direction(
+        surface_flags_at(layout, rect.centerx, rect.centery, cell_size=cell_size)
+    )
 
 
 def get_moving_floor_drift(
@@ -0,0 +1,140 @@
+"""Binary snapshots of a running game for checkpoints, suspend/resume and forks.
+
+Snapshots are pickles and carry no integrity check: restoring one can run
+arbitrary code. Treat them as trusted data produced by this process (or a
+build of it) and never restore bytes from a user-supplied path or download.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+import random
+import struct
+import zlib
+from typing import Any
+
+import pygame
+
+from ..entities.zombie import Zombie
+from ..models import GameData
+from ..rng import get_rng_states, set_rng_states
+
+try:
+    from ..__about__ import __version__
+except Exception:  # pragma: no cover - fallback version
+    __version__ = "0.0.0-unknown"
+
+# Layout: magic, format version, version string length, version string, then
+# the zlib-compressed pickle of the payload dict.
+SNAPSHOT_MAGIC = b"ZESNAP"
+SNAPSHOT_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHH")
+# Fast enough to snapshot every few seconds; most of the size is NumPy grids.
+_COMPRESS_LEVEL = 1
+
+# Persistent IDs for objects that are never written into a snapshot.
+_SURFACE_ID = "surface"
+_FOG_ID = "fog"
+
+
+class SnapshotError(ValueError):
+    """Raised when snapshot bytes are corrupt or from another build."""
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickler that leaves out surfaces and the shared fog cache.
+
+    Entities rebuild their images from kind and facing in `__setstate__`, so a
+    surface only needs a placeholder here.
+    """
+
+    def __init__(self, file: io.BytesIO, *, fog: dict) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._fog = fog
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if isinstance(obj, pygame.Surface):
+            return _SURFACE_ID
+        if obj is self._fog:
+            return _FOG_ID
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, *, fog: dict) -> None:
+        super().__init__(file)
+        self._fog = fog
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _SURFACE_ID:
+            return None
+        if pid == _FOG_ID:
+            return self._fog
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid!r}")
+
+
+def snapshot_game_data(game_data: GameData) -> bytes:
+    """Serialize `game_data` and every RNG stream into a compact byte string.
+
+    Covers entities, sprite groups, layout mutations, lineformer trains,
+    footprints and timers. Surfaces, the fog cache and the overview image are
+    left out and rebuilt or supplied again by `restore_game_data`.
+    """
+    payload = {
+        "game_data": game_data,
+        "rng": get_rng_states(),
+        # Decay effects still draw from `random`.
+        "py_random": random.getstate(),
+        "next_lineformer_id": Zombie._next_lineformer_id,
+    }
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, fog=game_data.fog).dump(payload)
+    version = __version__.encode("utf-8")
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(version))
+    return header + version + zlib.compress(buffer.getvalue(), _COMPRESS_LEVEL)
+
+
+def restore_game_data(data: bytes, *, fog: dict | None = None) -> GameData:
+    """Rebuild the `GameData` captured by `snapshot_game_data`.
+
+    Restores the RNG streams (and `random`) as a side effect, so simulation
+    continues exactly as it would have from the snapshot frame. `fog` is the
+    shared fog cache to attach (an empty one when omitted, as in headless runs).
+    Only pass bytes from `snapshot_game_data`; see the module docstring.
+    """
+    try:
+        magic, format_version, version_length = _HEADER.unpack_from(data)
+    except struct.error as exc:
+        raise SnapshotError("Snapshot is truncated") from exc
+    if magic != SNAPSHOT_MAGIC or format_version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError("Not a snapshot in a supported format")
+    start = _HEADER.size + version_length
+    version = data[_HEADER.size : start].decode("utf-8", "replace")
+    if version != __version__:
+        raise SnapshotError(f"Snapshot is from version {version}, not {__version__}")
+    if fog is None:
+        fog = {"hatch_patterns": {}, "overlays": {}}
+    try:
+        raw = zlib.decompress(data[start:])
+        # Unpickling trusts `data`; snapshots must never come from user input.
+        payload = _SnapshotUnpickler(io.BytesIO(raw), fog=fog).load()
+    except (zlib.error, pickle.UnpicklingError, EOFError) as exc:
+        raise SnapshotError(f"Snapshot is corrupt: {exc}") from exc
+
+    game_data: GameData = payload["game_data"]
+    set_rng_states(payload["rng"])
+    random.setstate(payload["py_random"])
+    Zombie._next_lineformer_id = payload["next_lineformer_id"]
+    state = game_data.state
+    state.scaled_overview = None
+    state.overview_created = False
+    return game_data
+
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "SnapshotError",
+    "restore_game_data",
+    "snapshot_game_data",
+]
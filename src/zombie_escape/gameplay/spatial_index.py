@@ -68,9 +68,14 @@ class SpatialIndex:
         self._cells: dict[
             tuple[int, int], list[tuple[pygame.sprite.Sprite, SpatialKind]]
         ] = {}
+        self._members: set[pygame.sprite.Sprite] = set()
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._members
 
     def clear(self) -> None:
         self._cells.clear()
+        self._members.clear()
 
     def rebuild(self, entities: Iterable[pygame.sprite.Sprite]) -> None:
         self.clear()
@@ -86,6 +91,7 @@ class SpatialIndex:
         x, y = _entity_center(entity)
         cell = (int(x // self.cell_size), int(y // self.cell_size))
         self._cells.setdefault(cell, []).append((entity, kind))
+        self._members.add(entity)
 
     def query_radius(
         self,
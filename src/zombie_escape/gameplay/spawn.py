@@ -61,7 +61,7 @@ from .utils import (
     rect_visible_on_screen,
 )
 
-RNG = get_rng()
+RNG = get_rng("spawn")
 
 FallScheduleResult = Literal["scheduled", "no_position", "blocked", "no_player"]
 
@@ -1320,6 +1320,8 @@ def spawn_initial_patrol_bots(
             continue
         patrol_group.add(bot)
         all_sprites.add(bot, layer=LAYER_VEHICLES)
+        if game_data.layout.electrified_floor is not None:
+            game_data.layout.electrified_floor.track(bot)
 
 
 def spawn_initial_carrier_bots_and_materials(game_data: GameData) -> None:
@@ -1412,6 +1414,8 @@ def spawn_initial_carrier_bots_and_materials(game_data: GameData) -> None:
             continue
         material_group.add(material)
         all_sprites.add(material, layer=LAYER_ITEMS)
+        if game_data.layout.material_occupancy is not None:
+            game_data.layout.material_occupancy.track(material)
 
     for cell_x, cell_y, axis, direction_sign in carrier_spawn_plans:
         occupied_cells.add((int(cell_x), int(cell_y)))
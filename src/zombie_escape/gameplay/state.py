@@ -26,6 +26,7 @@ from .ambient import _set_ambient_palette
 from .constants import INTRO_MESSAGE_DISPLAY_FRAMES
 from ..render.decay_effects import prepare_decay_mask
 from .spatial_index import SPATIAL_INDEX_CELL_SIZE, SpatialIndex
+from .visibility import FrameVisibility
 
 
 def frames_to_ms(frames: int) -> int:
@@ -87,6 +88,7 @@ def initialize_game_state(stage: Stage) -> GameData:
         footprints=[],
         puddle_splashes=[],
         spatial_index=SpatialIndex(cell_size=SPATIAL_INDEX_CELL_SIZE),
+        visibility=FrameVisibility(),
         decay_effects=[],
         last_footprint_pos=None,
         last_puddle_splash_pos=None,
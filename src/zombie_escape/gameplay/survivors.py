@@ -44,7 +44,9 @@ from .moving_floor import (
     is_entity_on_moving_floor,
 )
 
-RNG = get_rng()
+RNG = get_rng("ai")
+SPAWN_RNG = get_rng("spawn")
+FX_RNG = get_rng("fx")
 
 
 def update_survivors(
@@ -189,6 +191,8 @@ def update_survivors(
             survivor.y = float(cy)
             survivor.rect.center = (int(survivor.x), int(survivor.y))
 
+    # Visit each pair once, in group order; memory addresses differ between runs.
+    survivor_order = {survivor: index for index, survivor in enumerate(survivors)}
     for survivor in survivors:
         if survivor in moving_floor_survivors:
             continue
@@ -202,7 +206,8 @@ def update_survivors(
                 continue
             if is_entity_on_moving_floor(other):
                 continue
-            if id(other) <= id(survivor):
+            other_order = survivor_order.get(other)
+            if other_order is not None and other_order <= survivor_order[survivor]:
                 continue
             dx = other.x - survivor.x
             dy = other.y - survivor.y
@@ -312,7 +317,7 @@ def random_survivor_conversion_line(stage_id: str) -> str:
     lines = _get_survivor_conversion_messages(stage_id)
     if not lines:
         return ""
-    return RNG.choice(lines)
+    return FX_RNG.choice(lines)
 
 
 def cleanup_survivor_messages(state: ProgressState) -> None:
@@ -357,8 +362,8 @@ def drop_survivors_from_car(game_data: GameData, origin: tuple[int, int]) -> Non
     for _ in range(count):
         placed = False
         for _ in range(6):
-            angle = RNG.uniform(0, math.tau)
-            dist = RNG.uniform(16, 40)
+            angle = SPAWN_RNG.uniform(0, math.tau)
+            dist = SPAWN_RNG.uniform(16, 40)
             pos = (
                 safe_origin[0] + math.cos(angle) * dist,
                 safe_origin[1] + math.sin(angle) * dist,
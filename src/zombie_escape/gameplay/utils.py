@@ -14,7 +14,7 @@ from ..render_constants import (
 from ..screen_constants import SCREEN_HEIGHT, SCREEN_WIDTH
 
 _LOGICAL_SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
-RNG = get_rng()
+RNG = get_rng("spawn")
 
 __all__ = [
     "rect_visible_on_screen",
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from ..screen_constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from .spatial_index import SPATIAL_INDEX_CELL_SIZE, SpatialIndex, SpatialKind
+from .utils import fov_radius_for_flashlights, is_entity_in_fov, rect_visible_on_screen
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..entities import Camera
+
+__all__ = ["FrameVisibility"]
+
+# Index buckets are keyed by entity center, so widen the cell window enough to
+# catch sprites whose center is off-screen while their rect still overlaps it.
+_VIEW_QUERY_MARGIN = SPATIAL_INDEX_CELL_SIZE
+
+
+def _entity_rect(entity: pygame.sprite.Sprite) -> pygame.Rect | None:
+    rect = entity.rect
+    if rect is None or isinstance(rect, pygame.Rect):
+        return rect
+    return pygame.Rect(rect)
+
+
+class FrameVisibility:
+    """On-screen and in-FOV entity sets for rendering the current frame.
+
+    The sets are rebuilt once per frame right after the spatial index, from
+    the final positions and camera of the frame. Simulation keeps its live
+    rect tests: entities and the camera move during a step, so a snapshot
+    from the end of the previous frame would change gameplay decisions.
+    Entities that were not indexed (spawned mid-frame, items, walls) fall back
+    to a direct rect test against the captured view.
+    """
+
+    def __init__(self) -> None:
+        self.view_rect: pygame.Rect | None = None
+        self.fov_center: tuple[float, float] | None = None
+        self.fov_radius = 0.0
+        self._index: SpatialIndex | None = None
+        self._on_screen: set[pygame.sprite.Sprite] = set()
+        self._in_fov: set[pygame.sprite.Sprite] = set()
+
+    @property
+    def ready(self) -> bool:
+        return self.view_rect is not None
+
+    def rebuild(
+        self,
+        spatial_index: SpatialIndex,
+        *,
+        camera: Camera,
+        fov_target: pygame.sprite.Sprite | None,
+        flashlight_count: int,
+    ) -> None:
+        view_rect = pygame.Rect(
+            -camera.camera.x,
+            -camera.camera.y,
+            SCREEN_WIDTH,
+            SCREEN_HEIGHT,
+        )
+        query_rect = view_rect.inflate(_VIEW_QUERY_MARGIN * 2, _VIEW_QUERY_MARGIN * 2)
+        index_cell_size = max(1, int(spatial_index.cell_size))
+        candidates = spatial_index.query_cells(
+            min_cell_x=int(query_rect.left // index_cell_size),
+            max_cell_x=int(query_rect.right // index_cell_size),
+            min_cell_y=int(query_rect.top // index_cell_size),
+            max_cell_y=int(query_rect.bottom // index_cell_size),
+            kinds=SpatialKind.ALL,
+        )
+        self._on_screen = {
+            entity
+            for entity in candidates
+            if entity.rect is not None and view_rect.colliderect(entity.rect)
+        }
+        self.view_rect = view_rect
+        self._index = spatial_index
+
+        if fov_target is None or fov_target.rect is None:
+            self.fov_center = None
+            self.fov_radius = 0.0
+            self._in_fov = set()
+            return
+        fov_center = (
+            float(fov_target.rect.centerx),
+            float(fov_target.rect.centery),
+        )
+        self.fov_center = fov_center
+        self.fov_radius = fov_radius_for_flashlights(flashlight_count)
+        self._in_fov = set(
+            spatial_index.query_radius(
+                fov_center,
+                self.fov_radius,
+                kinds=SpatialKind.ALL,
+            )
+        )
+
+    def is_on_screen(
+        self,
+        entity: pygame.sprite.Sprite,
+        camera: Camera | None,
+    ) -> bool:
+        """Return True when the entity was on screen in the current snapshot.
+
+        `camera` is only used before the first rebuild.
+        """
+        rect = _entity_rect(entity)
+        if rect is None:
+            return False
+        if self.view_rect is None:
+            return rect_visible_on_screen(camera, rect)
+        if entity in self._on_screen:
+            return True
+        if self._index is not None and entity in self._index:
+            return False
+        return self.view_rect.colliderect(rect)
+
+    def is_in_fov(
+        self,
+        entity: pygame.sprite.Sprite,
+        *,
+        fov_target: pygame.sprite.Sprite | None,
+        flashlight_count: int,
+    ) -> bool:
+        """Return True when the entity was inside the FOV circle of the snapshot.
+
+        `fov_target` and `flashlight_count` are only used before the first
+        rebuild.
+        """
+        rect = _entity_rect(entity)
+        if rect is None:
+            return False
+        if self.view_rect is None:
+            return is_entity_in_fov(
+                rect,
+                fov_target=fov_target,
+                flashlight_count=flashlight_count,
+            )
+        if self.fov_center is None:
+            return False
+        if entity in self._in_fov:
+            return True
+        if self._index is not None and entity in self._index:
+            return False
+        dx = rect.centerx - self.fov_center[0]
+        dy = rect.centery - self.fov_center[1]
+        return (dx * dx + dy * dy) <= self.fov_radius * self.fov_radius
+
+    def may_be_on_screen(self, entity: pygame.sprite.Sprite) -> bool:
+        """Cheap render-side cull that only rejects indexed off-screen entities."""
+        if self.view_rect is None or entity in self._on_screen:
+            return True
+        return self._index is None or entity not in self._index
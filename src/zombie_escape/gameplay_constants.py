@@ -8,6 +8,11 @@ SURVIVAL_TIME_ACCEL_MAX_SUBSTEP = 1.0 / 30.0
 SURVIVAL_TIME_ACCEL_RAMP_MS = 2000
 SURVIVAL_FAKE_CLOCK_RATIO = 12.0  # 20 min -> 4 hr clock
 
+# --- Simulation stepping ---
+# Fixed ticks run per rendered frame at most; longer stalls slow the game
+# down instead of spiraling into ever larger catch-up batches.
+SIMULATION_MAX_STEPS_PER_FRAME = 4
+
 # --- Survivor settings (Stage 4) ---
 SURVIVOR_SPAWN_RATE = 0.07
 
@@ -33,6 +38,7 @@ __all__ = [
     "SURVIVAL_TIME_ACCEL_MAX_SUBSTEP",
     "SURVIVAL_TIME_ACCEL_RAMP_MS",
     "SURVIVAL_FAKE_CLOCK_RATIO",
+    "SIMULATION_MAX_STEPS_PER_FRAME",
     "SURVIVOR_SPAWN_RATE",
     "DEFAULT_FLASHLIGHT_SPAWN_COUNT",
     "MAX_FLASHLIGHT_EFFECT_LEVEL",
@@ -0,0 +1,211 @@
+"""Per-cell hazard flags for a level, packed into one `uint16` NumPy grid."""
+
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+
+try:
+    from typing import Self
+except ImportError:  # pragma: no cover - Python 3.10 fallback
+    from typing_extensions import Self
+
+from .entities_constants import MovingFloorDirection
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from .models import LevelLayout
+
+HAZARD_PITFALL = 1 << 0
+HAZARD_FIRE_FLOOR = 1 << 1
+HAZARD_METAL_FLOOR = 1 << 2
+HAZARD_PUDDLE = 1 << 3
+HAZARD_SPIKY_PLANT = 1 << 4
+HAZARD_CONTAMINATED = 1 << 5
+HAZARD_ELECTRIFIED = 1 << 6
+HAZARD_MATERIAL = 1 << 7
+
+# Moving-floor direction lives in the top bits: 0 = none, else index + 1.
+MOVING_FLOOR_SHIFT = 12
+MOVING_FLOOR_MASK = 0x7 << MOVING_FLOOR_SHIFT
+MOVING_FLOOR_DIRECTIONS: tuple[MovingFloorDirection | None, ...] = (
+    None,
+    MovingFloorDirection.UP,
+    MovingFloorDirection.DOWN,
+    MovingFloorDirection.LEFT,
+    MovingFloorDirection.RIGHT,
+)
+_MOVING_FLOOR_CODES = {
+    direction: code
+    for code, direction in enumerate(MOVING_FLOOR_DIRECTIONS)
+    if direction is not None
+}
+
+
+def moving_floor_direction(flags: int) -> MovingFloorDirection | None:
+    return MOVING_FLOOR_DIRECTIONS[(flags & MOVING_FLOOR_MASK) >> MOVING_FLOOR_SHIFT]
+
+
+class HazardGrid:
+    """Hazard bits for every cell, addressed by integer cell ID `y * cols + x`.
+
+    `flags` is the flat `uint16` array and `grid` a `(rows, cols)` view of it.
+    Scalar lookups go through a memoryview so they return plain ints; batch
+    lookups take position arrays. `version` increments on every change.
+    """
+
+    def __init__(self: Self, *, cols: int, rows: int, cell_size: int) -> None:
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.flags = np.zeros(cols * rows, dtype=np.uint16)
+        self.grid = self.flags.reshape(rows, cols)
+        self.version = 0
+        self._cells = memoryview(self.flags)
+
+    def __getstate__(self: Self) -> dict:
+        state = self.__dict__.copy()
+        del state["grid"], state["_cells"]
+        return state
+
+    def __setstate__(self: Self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.grid = self.flags.reshape(self.rows, self.cols)
+        self._cells = memoryview(self.flags)
+
+    @classmethod
+    def from_layout(cls, layout: LevelLayout, *, cell_size: int) -> HazardGrid:
+        hazards = cls(cols=layout.grid_cols, rows=layout.grid_rows, cell_size=cell_size)
+        for flag, cells in (
+            (HAZARD_PITFALL, layout.pitfall_cells),
+            (HAZARD_FIRE_FLOOR, layout.fire_floor_cells),
+            (HAZARD_METAL_FLOOR, layout.metal_floor_cells),
+            (HAZARD_PUDDLE, layout.puddle_cells),
+            (HAZARD_SPIKY_PLANT, layout.spiky_plant_cells),
+            (HAZARD_CONTAMINATED, layout.zombie_contaminated_cells),
+            (HAZARD_MATERIAL, layout.material_cells),
+        ):
+            hazards.set_cells(cells, flag)
+        for cell, direction in layout.moving_floor_cells.items():
+            hazards.set_moving_floor(cell, direction)
+        return hazards
+
+    def cell_id(self: Self, cell: tuple[int, int]) -> int:
+        """Return the integer ID of `cell`, or -1 when it is off the grid."""
+        x, y = cell
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return y * self.cols + x
+        return -1
+
+    def _ids(self: Self, cells: Iterable[tuple[int, int]]) -> np.ndarray:
+        coords = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        inside = (xs >= 0) & (xs < self.cols) & (ys >= 0) & (ys < self.rows)
+        return ys[inside] * self.cols + xs[inside]
+
+    def flags_at(self: Self, x: float, y: float) -> int:
+        """Return the flag bits of the cell under world position `(x, y)`."""
+        if self.cell_size <= 0:
+            return 0
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self._cells[cy * self.cols + cx]
+        return 0
+
+    def flags_for_cell(self: Self, cell: tuple[int, int]) -> int:
+        cell_id = self.cell_id(cell)
+        return self._cells[cell_id] if cell_id >= 0 else 0
+
+    def flags_at_points(self: Self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Return the flag bits under each world position; 0 when off the grid."""
+        result = np.zeros(len(xs), dtype=np.uint16)
+        if self.cell_size <= 0 or not len(xs):
+            return result
+        cx = np.floor_divide(np.asarray(xs, dtype=np.float64), self.cell_size)
+        cy = np.floor_divide(np.asarray(ys, dtype=np.float64), self.cell_size)
+        cx = cx.astype(np.int64)
+        cy = cy.astype(np.int64)
+        inside = (cx >= 0) & (cx < self.cols) & (cy >= 0) & (cy < self.rows)
+        result[inside] = self.flags[cy[inside] * self.cols + cx[inside]]
+        return result
+
+    def set_flag(self: Self, cell: tuple[int, int], flag: int, on: bool = True) -> None:
+        cell_id = self.cell_id(cell)
+        if cell_id < 0:
+            return
+        current = self._cells[cell_id]
+        updated = current | flag if on else current & ~flag
+        if updated != current:
+            self._cells[cell_id] = updated
+            self.version += 1
+
+    def set_cells(self: Self, cells: Iterable[tuple[int, int]], flag: int) -> None:
+        ids = self._ids(cells)
+        if len(ids):
+            self.flags[ids] |= np.uint16(flag)
+            self.version += 1
+
+    def replace_cells(self: Self, cells: Iterable[tuple[int, int]], flag: int) -> None:
+        """Make `cells` the only cells carrying `flag`."""
+        ids = self._ids(cells)
+        marked = np.zeros(len(self.flags), dtype=bool)
+        marked[ids] = True
+        if np.array_equal(marked, (self.flags & flag) != 0):
+            return
+        self.flags &= np.uint16(~flag & 0xFFFF)
+        self.flags[marked] |= np.uint16(flag)
+        self.version += 1
+
+    def cells_with(self: Self, flag: int) -> set[tuple[int, int]]:
+        ids = np.flatnonzero(self.flags & flag)
+        return {(int(i % self.cols), int(i // self.cols)) for i in ids}
+
+    def set_moving_floor(
+        self: Self, cell: tuple[int, int], direction: MovingFloorDirection | None
+    ) -> None:
+        cell_id = self.cell_id(cell)
+        if cell_id < 0:
+            return
+        code = _MOVING_FLOOR_CODES.get(direction, 0) if direction is not None else 0
+        current = self._cells[cell_id]
+        updated = (current & ~MOVING_FLOOR_MASK) | (code << MOVING_FLOOR_SHIFT)
+        if updated != current:
+            self._cells[cell_id] = updated
+            self.version += 1
+
+    def moving_floor_at(self: Self, x: float, y: float) -> MovingFloorDirection | None:
+        return moving_floor_direction(self.flags_at(x, y))
+
+
+def surface_flags_at(layout: LevelLayout, x: float, y: float, *, cell_size: int) -> int:
+    """Return the hazard bits under `(x, y)` with one lookup.
+
+    Layouts built without a `HazardGrid` (tests, image export) fall back to the
+    per-hazard cell sets and produce the same bits.
+    """
+    hazards = layout.hazard_grid
+    if hazards is not None:
+        return hazards.flags_at(x, y)
+    if cell_size <= 0:
+        return 0
+    cell = (int(x // cell_size), int(y // cell_size))
+    flags = 0
+    if cell in layout.pitfall_cells:
+        flags |= HAZARD_PITFALL
+    if cell in layout.fire_floor_cells:
+        flags |= HAZARD_FIRE_FLOOR
+    if cell in layout.metal_floor_cells:
+        flags |= HAZARD_METAL_FLOOR
+    if cell in layout.puddle_cells:
+        flags |= HAZARD_PUDDLE
+    if cell in layout.spiky_plant_cells:
+        flags |= HAZARD_SPIKY_PLANT
+    if cell in layout.zombie_contaminated_cells:
+        flags |= HAZARD_CONTAMINATED
+    if cell in layout.material_cells:
+        flags |= HAZARD_MATERIAL
+    direction = layout.moving_floor_cells.get(cell)
+    if direction is not None:
+        flags |= _MOVING_FLOOR_CODES[direction] << MOVING_FLOOR_SHIFT
+    return flags
@@ -1,8 +1,9 @@
 # Blueprint generator for randomized layouts.
 
-from collections import deque
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .level_constants import (
     DEFAULT_CORRIDOR_BREAK_RATIO,
     DEFAULT_GRID_WIRE_WALL_LINES,
@@ -19,7 +20,7 @@ WALL_MIN_LEN = 3
 WALL_MAX_LEN = 10
 SPAWN_MARGIN = 3  # keep spawns away from walls/edges
 
-RNG = get_rng()
+RNG = get_rng("layout")
 
 
 class MapGenerationError(Exception):
@@ -33,127 +34,169 @@ class Blueprint:
     car_reachable_cells: set[tuple[int, int]] = field(default_factory=set)
 
 
-def validate_car_connectivity(grid: list[str]) -> set[tuple[int, int]] | None:
-    """Check if the Car can reach at least one exit (4-way BFS).
-    Returns the set of reachable cells if valid, otherwise None.
+_CAR_BLOCKERS = b"xBRO"
+_HUMANOID_BLOCKERS = b"xBRFO"
+# Diagonal steps are refused when both side cells are solid walls.
+_CORNER_BLOCKERS = b"BR"
+_CAR_STEPS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+_HUMANOID_STEPS = _CAR_STEPS + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+@dataclass(frozen=True)
+class _EncodedGrid:
+    """Blueprint bytes as a flat array padded by one "O" cell on every side.
+
+    Padding keeps every neighbor of an in-grid cell inside the array, so a
+    step in direction (dx, dy) is a constant flat offset `dy * stride + dx`.
     """
+
+    codes: np.ndarray
+    stride: int
+
+    def mask(self, chars: bytes) -> np.ndarray:
+        return np.isin(self.codes, np.frombuffer(chars, dtype=np.uint8))
+
+    def index(self, cell: tuple[int, int]) -> int:
+        return (cell[1] + 1) * self.stride + cell[0] + 1
+
+    def cells(self, mask: np.ndarray) -> set[tuple[int, int]]:
+        ys, xs = np.divmod(np.flatnonzero(mask), self.stride)
+        return set(zip((xs - 1).tolist(), (ys - 1).tolist()))
+
+
+def _encode_grid(grid: list[str]) -> _EncodedGrid:
     rows = len(grid)
     cols = len(grid[0])
+    codes = np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8)
+    padded = np.pad(codes.reshape(rows, cols), 1, constant_values=ord("O"))
+    return _EncodedGrid(codes=padded.ravel(), stride=cols + 2)
+
+
+def _shifted(mask: np.ndarray, offset: int) -> np.ndarray:
+    """Return `out[i] = mask[i + offset]` (False past either end)."""
+    out = np.zeros_like(mask)
+    if offset > 0:
+        out[:-offset] = mask[offset:]
+    elif offset < 0:
+        out[-offset:] = mask[:offset]
+    else:
+        out[:] = mask
+    return out
 
-    start_pos = None
-    passable_cells = set()
-    exit_cells = set()
 
-    for y in range(rows):
-        for x in range(cols):
-            ch = grid[y][x]
-            if ch == "C":
-                start_pos = (x, y)
-            # Car can drive through moving-floor cells; only solid blockers are excluded.
-            if ch not in ("x", "B", "R", "O"):
-                passable_cells.add((x, y))
-                if ch == "E":
-                    exit_cells.add((x, y))
-
-    if start_pos is None:
+def _step_masks(
+    encoded: _EncodedGrid,
+    passable: np.ndarray,
+    steps: tuple[tuple[int, int], ...],
+    *,
+    humanoid: bool,
+) -> list[tuple[int, np.ndarray]]:
+    """Return (flat offset, cells allowed to take that step) per direction."""
+    codes = encoded.codes
+    corners = encoded.mask(_CORNER_BLOCKERS) if humanoid else None
+    result: list[tuple[int, np.ndarray]] = []
+    for dx, dy in steps:
+        offset = dy * encoded.stride + dx
+        allowed = passable & _shifted(passable, offset)
+        if humanoid:
+            # Moving floors refuse any step with a component against their flow.
+            if dy == 1:
+                allowed &= codes != ord("^")
+            elif dy == -1:
+                allowed &= codes != ord("v")
+            if dx == 1:
+                allowed &= codes != ord("<")
+            elif dx == -1:
+                allowed &= codes != ord(">")
+            if dx != 0 and dy != 0:
+                assert corners is not None
+                allowed &= ~(
+                    _shifted(corners, dx) & _shifted(corners, dy * encoded.stride)
+                )
+        result.append((offset, allowed))
+    return result
+
+
+def _reachable_mask(
+    start: np.ndarray, steps: list[tuple[int, np.ndarray]]
+) -> np.ndarray:
+    """Cells reachable from any `start` cell (frontier-array BFS)."""
+    reachable = start.copy()
+    frontier = start
+    while frontier.any():
+        grown = np.zeros_like(reachable)
+        for offset, allowed in steps:
+            moved = frontier & allowed
+            if offset > 0:
+                grown[offset:] |= moved[:-offset]
+            else:
+                grown[:offset] |= moved[-offset:]
+        frontier = grown & ~reachable
+        reachable |= frontier
+    return reachable
+
+
+def _coreachable_mask(
+    targets: np.ndarray, steps: list[tuple[int, np.ndarray]]
+) -> np.ndarray:
+    """Cells from which any `targets` cell is reachable (BFS on reversed steps)."""
+    coreachable = targets.copy()
+    frontier = targets
+    while frontier.any():
+        grown = np.zeros_like(coreachable)
+        for offset, allowed in steps:
+            if offset > 0:
+                grown[:-offset] |= allowed[:-offset] & frontier[offset:]
+            else:
+                grown[-offset:] |= allowed[-offset:] & frontier[:offset]
+        frontier = grown & ~coreachable
+        coreachable |= frontier
+    return coreachable
+
+
+def _single_cell_mask(encoded: _EncodedGrid, index: int) -> np.ndarray:
+    mask = np.zeros(encoded.codes.shape, dtype=bool)
+    mask[index] = True
+    return mask
+
+
+def validate_car_connectivity(grid: list[str]) -> set[tuple[int, int]] | None:
+    """Check if the Car can reach at least one exit (4-way BFS).
+    Returns the set of reachable cells if valid, otherwise None.
+    """
+    encoded = _encode_grid(grid)
+    # Car can drive through moving-floor cells; only solid blockers are excluded.
+    passable = ~encoded.mask(_CAR_BLOCKERS)
+    car_indices = np.flatnonzero(encoded.codes == ord("C"))
+    if car_indices.size == 0:
         # If no car candidate, we can't validate car pathing.
-        return passable_cells
+        return encoded.cells(passable)
 
-    reachable = {start_pos}
-    queue = deque([start_pos])
-    while queue:
-        x, y = queue.popleft()
-        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            nx, ny = x + dx, y + dy
-            if (nx, ny) in passable_cells and (nx, ny) not in reachable:
-                reachable.add((nx, ny))
-                queue.append((nx, ny))
+    reachable = _reachable_mask(
+        _single_cell_mask(encoded, int(car_indices[-1])),
+        _step_masks(encoded, passable, _CAR_STEPS, humanoid=False),
+    )
 
     # Car must reach at least one exit
-    if exit_cells and not any(e in reachable for e in exit_cells):
+    exits = encoded.codes == ord("E")
+    if exits.any() and not (exits & reachable).any():
         return None
-    return reachable
+    return encoded.cells(reachable)
 
 
 def validate_humanoid_connectivity(grid: list[str]) -> bool:
     """Check if all floor cells are reachable by Humans (8-way BFS with jumps)."""
-    rows = len(grid)
-    cols = len(grid[0])
-
-    start_pos = None
-    passable_cells = set()
-    for y in range(rows):
-        for x in range(cols):
-            ch = grid[y][x]
-            if ch == "P":
-                start_pos = (x, y)
-            if ch not in ("x", "B", "R", "F", "O"):
-                passable_cells.add((x, y))
-
-    if start_pos is None:
+    encoded = _encode_grid(grid)
+    passable = ~encoded.mask(_HUMANOID_BLOCKERS)
+    player_indices = np.flatnonzero(encoded.codes == ord("P"))
+    if player_indices.size == 0:
         return False
 
-    reachable = _humanoid_reachable_cells(
-        grid, start_pos, passable_cells=passable_cells
-    )
-    return len(passable_cells) == len(reachable)
-
-
-def _humanoid_reachable_cells(
-    grid: list[str],
-    start_pos: tuple[int, int],
-    *,
-    passable_cells: set[tuple[int, int]] | None = None,
-) -> set[tuple[int, int]]:
-    rows = len(grid)
-    cols = len(grid[0])
-    if passable_cells is None:
-        passable_cells = {
-            (x, y)
-            for y in range(rows)
-            for x in range(cols)
-            if grid[y][x] not in ("x", "B", "R", "F", "O")
-        }
-    if start_pos not in passable_cells:
-        return set()
-
-    floor_blocked_offsets: dict[str, set[tuple[int, int]]] = {
-        "^": {(0, 1), (-1, 1), (1, 1)},
-        "v": {(0, -1), (-1, -1), (1, -1)},
-        "<": {(1, 0), (1, -1), (1, 1)},
-        ">": {(-1, 0), (-1, -1), (-1, 1)},
-    }
-    neighbor_offsets = (
-        (0, 1),
-        (0, -1),
-        (1, 0),
-        (-1, 0),
-        (1, 1),
-        (1, -1),
-        (-1, 1),
-        (-1, -1),
+    reachable = _reachable_mask(
+        _single_cell_mask(encoded, int(player_indices[-1])),
+        _step_masks(encoded, passable, _HUMANOID_STEPS, humanoid=True),
     )
-
-    reachable = {start_pos}
-    queue = deque([start_pos])
-    while queue:
-        x, y = queue.popleft()
-        current_cell = grid[y][x]
-        blocked_offsets = floor_blocked_offsets.get(current_cell, set())
-        for dx, dy in neighbor_offsets:
-            if (dx, dy) in blocked_offsets:
-                continue
-            if dx != 0 and dy != 0:
-                side1 = grid[y][x + dx]
-                side2 = grid[y + dy][x]
-                if side1 in {"B", "R"} and side2 in {"B", "R"}:
-                    continue
-            nx, ny = x + dx, y + dy
-            next_cell = (nx, ny)
-            if next_cell in passable_cells and next_cell not in reachable:
-                reachable.add(next_cell)
-                queue.append(next_cell)
-    return reachable
+    return int(np.count_nonzero(passable)) == int(np.count_nonzero(reachable))
 
 
 def validate_humanoid_objective_connectivity(
@@ -169,85 +212,50 @@ def validate_humanoid_objective_connectivity(
     - fuel_mode=0 (REFUEL_CHAIN): P -> reachable e -> reachable f -> any C
     - fuel_mode=2 (START_FULL): treat P as the fuel start, then P -> any C
     - require_player_exit_path=True: additionally require P -> any E
+
+    Chains are checked backwards: one reverse BFS from the cars marks every
+    cell that can still reach one, instead of a forward BFS per candidate.
     """
-    rows = len(grid)
-    cols = len(grid[0])
-    passable_cells = {
-        (x, y)
-        for y in range(rows)
-        for x in range(cols)
-        if grid[y][x] not in ("x", "B", "R", "F", "O")
-    }
-    player_cells = [
-        (x, y) for y in range(rows) for x in range(cols) if grid[y][x] == "P"
-    ]
-    car_cells = {(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == "C"}
-    empty_can_cells = {
-        (x, y) for y in range(rows) for x in range(cols) if grid[y][x] == "e"
-    }
-    fuel_cells = {(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == "f"}
-    exit_cells = {(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == "E"}
-
-    if len(player_cells) != 1:
+    encoded = _encode_grid(grid)
+    codes = encoded.codes
+    passable = ~encoded.mask(_HUMANOID_BLOCKERS)
+    player_indices = np.flatnonzero(codes == ord("P"))
+    car_cells = codes == ord("C")
+    empty_can_cells = codes == ord("e")
+    fuel_cells = codes == ord("f")
+    exit_cells = codes == ord("E")
+
+    if player_indices.size != 1:
         return False
-    if require_car_spawn and not car_cells:
+    if require_car_spawn and not car_cells.any():
         return False
-    player_start = player_cells[0]
 
-    from_player = _humanoid_reachable_cells(
-        grid,
-        player_start,
-        passable_cells=passable_cells,
+    steps = _step_masks(encoded, passable, _HUMANOID_STEPS, humanoid=True)
+    from_player = _reachable_mask(
+        _single_cell_mask(encoded, int(player_indices[0])), steps
     )
-    if require_player_exit_path and (
-        not exit_cells or not any(exit_cell in from_player for exit_cell in exit_cells)
-    ):
+    if require_player_exit_path and not (exit_cells & from_player).any():
         return False
     if not require_car_spawn:
         # Car-less stages only require on-foot objective reachability.
         return fuel_mode == FuelMode.START_FULL
     if fuel_mode == FuelMode.REFUEL_CHAIN:
-        if not empty_can_cells or not fuel_cells:
+        if not empty_can_cells.any() or not fuel_cells.any():
             return False
-        empty_candidates = [cell for cell in empty_can_cells if cell in from_player]
-        if not empty_candidates:
+        empty_candidates = empty_can_cells & from_player
+        if not empty_candidates.any():
             return False
-        for empty_cell in empty_candidates:
-            from_empty = _humanoid_reachable_cells(
-                grid,
-                empty_cell,
-                passable_cells=passable_cells,
-            )
-            station_candidates = [cell for cell in fuel_cells if cell in from_empty]
-            if not station_candidates:
-                continue
-            for station_cell in station_candidates:
-                from_station = _humanoid_reachable_cells(
-                    grid,
-                    station_cell,
-                    passable_cells=passable_cells,
-                )
-                if any(car_cell in from_station for car_cell in car_cells):
-                    return True
-        return False
+        to_car = _coreachable_mask(car_cells, steps)
+        to_fueled_car = _coreachable_mask(fuel_cells & to_car, steps)
+        return bool((empty_candidates & to_fueled_car).any())
     if fuel_mode == FuelMode.FUEL_CAN:
-        if not fuel_cells:
+        if not fuel_cells.any():
             return False
-        fuel_starts = [cell for cell in fuel_cells if cell in from_player]
-        if not fuel_starts:
+        fuel_starts = fuel_cells & from_player
+        if not fuel_starts.any():
             return False
-    else:
-        fuel_starts = [player_start]
-
-    for fuel_start in fuel_starts:
-        from_fuel = _humanoid_reachable_cells(
-            grid,
-            fuel_start,
-            passable_cells=passable_cells,
-        )
-        if any(car_cell in from_fuel for car_cell in car_cells):
-            return True
-    return False
+        return bool((fuel_starts & _coreachable_mask(car_cells, steps)).any())
+    return bool((car_cells & from_player).any())
 
 
 def validate_connectivity(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 import pygame
@@ -34,10 +35,15 @@ if TYPE_CHECKING:  # pragma: no cover - typing-only imports
         Player,
         Shoes,
     )
+    from .entities.material import MaterialOccupancy
+    from .entities.patrol_bot import ElectrifiedFloor
     from .entities.spiky_plant import SpikyPlant
+    from .entities.wall_grid import WallGrid
+    from .hazard_grid import HazardGrid
     from .render.decay_effects import DecayingEntityEffect
     from .gameplay.lineformer_trains import LineformerTrainManager
     from .gameplay.spatial_index import SpatialIndex
+    from .gameplay.visibility import FrameVisibility
     from .level_blueprints import Blueprint
     from .world_grid import WallIndex
 
@@ -89,6 +95,10 @@ class LevelLayout:
         default_factory=dict
     )
     floor_ruin_cells: dict[tuple[int, int], int] = field(default_factory=dict)
+    wall_grid: "WallGrid | None" = None
+    material_occupancy: "MaterialOccupancy | None" = None
+    hazard_grid: "HazardGrid | None" = None
+    electrified_floor: "ElectrifiedFloor | None" = None
 
 @dataclass
 class FallingEntity:
@@ -159,6 +169,7 @@ class ProgressState:
     footprints: list[Footprint]
     puddle_splashes: list[PuddleSplash]
     spatial_index: "SpatialIndex"
+    visibility: "FrameVisibility"
     decay_effects: list["DecayingEntityEffect"]
     last_footprint_pos: tuple[int, int] | None
     last_puddle_splash_pos: tuple[int, int] | None
@@ -258,6 +269,25 @@ class GameData:
         default_factory=_make_lineformer_manager
     )
 
+
+@lru_cache(maxsize=None)
+def _expand_zone_cells(
+    zones: tuple[tuple[int, int, int, int], ...],
+) -> frozenset[tuple[int, int]]:
+    cells: set[tuple[int, int]] = set()
+    for x, y, w, h in zones:
+        for dy in range(h):
+            for dx in range(w):
+                cells.add((x + dx, y + dy))
+    return frozenset(cells)
+
+
+def _zone_key(
+    zones: list[tuple[int, int, int, int]],
+) -> tuple[tuple[int, int, int, int], ...]:
+    return tuple((int(x), int(y), int(w), int(h)) for x, y, w, h in zones)
+
+
 @dataclass(frozen=True)
 class Stage:
     # Id, name, description
@@ -433,29 +463,35 @@ class Stage:
         # Exclusivity validation for zone-based gimmicks
         self._validate_zone_exclusivity()
 
+    @cached_property
+    def zone_cells(self) -> dict[str, frozenset[tuple[int, int]]]:
+        """Cells covered by each exclusive gimmick, expanded once per stage."""
+        moving_floor_zones: list[tuple[int, int, int, int]] = []
+        for zones in self.moving_floor_zones.values():
+            moving_floor_zones.extend(zones)
+        return {
+            "pitfall": _expand_zone_cells(_zone_key(self.pitfall_zones)),
+            "fire_floor": _expand_zone_cells(_zone_key(self.fire_floor_zones)),
+            "metal_floor": _expand_zone_cells(_zone_key(self.metal_floor_zones)),
+            "reinforced_wall": _expand_zone_cells(
+                _zone_key(self.reinforced_wall_zones)
+            ),
+            "moving_floor": _expand_zone_cells(_zone_key(moving_floor_zones)),
+            "spiky_plant": _expand_zone_cells(_zone_key(self.spiky_plant_zones)),
+            "puddle": _expand_zone_cells(_zone_key(self.puddle_zones)),
+        }
+
     def _validate_zone_exclusivity(self) -> None:
         """Ensure that exclusive gimmicks do not overlap in zones."""
 
-        def _get_cells(zones: list[tuple[int, int, int, int]]) -> set[tuple[int, int]]:
-            cells = set()
-            for x, y, w, h in zones:
-                for dy in range(h):
-                    for dx in range(w):
-                        cells.add((x + dx, y + dy))
-            return cells
-
-        # Collect all cells from different gimmicks
-        pitfall_cells = _get_cells(self.pitfall_zones)
-        fire_floor_cells = _get_cells(self.fire_floor_zones)
-        metal_floor_cells = _get_cells(self.metal_floor_zones)
-        reinforced_cells = _get_cells(self.reinforced_wall_zones)
-
-        floor_cells = set()
-        for zones in self.moving_floor_zones.values():
-            floor_cells.update(_get_cells(zones))
-
-        plant_cells = _get_cells(self.spiky_plant_zones)
-        water_cells = _get_cells(self.puddle_zones)
+        zone_cells = self.zone_cells
+        pitfall_cells = zone_cells["pitfall"]
+        fire_floor_cells = zone_cells["fire_floor"]
+        metal_floor_cells = zone_cells["metal_floor"]
+        reinforced_cells = zone_cells["reinforced_wall"]
+        floor_cells = zone_cells["moving_floor"]
+        plant_cells = zone_cells["spiky_plant"]
+        water_cells = zone_cells["puddle"]
 
         # Check overlaps
         # 1. Pitfall vs others
@@ -1,15 +1,47 @@
 from __future__ import annotations
 
-from ..render_assets import RenderAssets
-from .core import (
-    blit_text_wrapped,
-    draw,
-    draw_pause_overlay,
-    blit_message,
-    blit_message_wrapped,
-    wrap_text,
-)
-from .hud import _draw_status_bar, _get_fog_scale
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..render_constants import RenderAssets
+    from .core import draw
+    from .text_overlay import (
+        blit_message,
+        blit_message_wrapped,
+        blit_text_wrapped,
+        draw_pause_overlay,
+        wrap_text,
+    )
+    from .hud import _draw_status_bar, _get_fog_scale
+
+# Exports resolve on first access so menu screens that only need text helpers
+# do not pull in the gameplay renderer (fog, NumPy, entity drawing).
+_LAZY_EXPORTS = {
+    "RenderAssets": "..render_constants",
+    "blit_text_wrapped": ".text_overlay",
+    "draw": ".core",
+    "draw_pause_overlay": ".text_overlay",
+    "blit_message": ".text_overlay",
+    "blit_message_wrapped": ".text_overlay",
+    "wrap_text": ".text_overlay",
+    "_draw_status_bar": ".hud",
+    "_get_fog_scale": ".hud",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "RenderAssets",
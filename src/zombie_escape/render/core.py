@@ -9,7 +9,7 @@ from ..colors import YELLOW, get_environment_palette
 from ..models import FuelProgress, GameData
 from ..render_assets import RenderAssets
 from .entity_layer import _draw_entities, _draw_lineformer_train_markers
-from .fog import _draw_fog_of_war
+from .fog import _draw_fog_of_war, prefetch_fog_profile
 from .fx import (
     _draw_decay_fx,
     _draw_fade_in_overlay,
@@ -71,6 +71,7 @@ def draw(
     stage = game_data.stage
     outside_cells = game_data.layout.outside_cells
     all_sprites = game_data.groups.all_sprites
+    visibility = state.visibility
     has_fuel = state.fuel_progress == FuelProgress.FULL_CAN
     has_empty_fuel_can = state.fuel_progress == FuelProgress.EMPTY_CAN
     flashlight_count = state.flashlight_count
@@ -170,7 +171,11 @@ def draw(
     )
     _draw_entities(
         screen,
-        [(entity, camera.apply_rect(entity.rect)) for entity in all_sprites],
+        [
+            (entity, camera.apply_rect(entity.rect))
+            for entity in all_sprites
+            if visibility.may_be_on_screen(entity)
+        ],
         player,
         has_fuel=has_fuel,
         has_empty_fuel_can=has_empty_fuel_can,
@@ -222,6 +227,12 @@ def draw(
         hint_color=hint_color,
         flashlight_count=flashlight_count,
     )
+    if any(
+        flashlight.alive() and visibility.is_on_screen(flashlight, camera)
+        for flashlight in game_data.flashlights
+    ):
+        # A pickup is likely soon; build the next fog profile off-thread.
+        prefetch_fog_profile(game_data.fog, flashlight_count + 1)
     fov_center_screen: tuple[int, int] | None = None
     if fov_target is not None:
         fov_center_screen = tuple(map(int, camera.apply(fov_target).center))
@@ -26,13 +26,28 @@ DECAY_EFFECT_DURATION_FRAMES = max(1, int(FPS))
 BURNED_DECAY_EFFECT_DURATION_FRAMES = max(
     1, int(round(DECAY_EFFECT_DURATION_FRAMES * 0.6))
 )
+# Mass deaths (fire floors, dawn, patrol-bot fields) can spawn dozens of effects
+# in a single frame; beyond this many the oldest ones are retired early.
+MAX_DECAY_EFFECTS = 48
+_DECAY_EFFECT_POOL_LIMIT = MAX_DECAY_EFFECTS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class DecayMask:
+    """Erase order for decay effects, stored as a per-pixel rank array.
+
+    `ranks[x, y]` is the step at which pixel (x, y) disappears, so the pixels
+    erased after `k` steps are exactly `ranks < k`. The array uses surfarray
+    (x, y) axis order.
+    """
+
     width: int
     height: int
-    positions: list[tuple[int, int]]
+    ranks: np.ndarray
+
+    @property
+    def pixel_count(self) -> int:
+        return self.width * self.height
 
 
 _DECAY_MASKS: dict[str, list[DecayMask]] | None = None
@@ -51,9 +66,16 @@ def _max_decay_surface_size() -> tuple[int, int]:
 
 def _build_decay_mask() -> DecayMask:
     width, height = _max_decay_surface_size()
-    positions = [(x, y) for y in range(height) for x in range(width)]
-    random.shuffle(positions)
-    return DecayMask(width=width, height=height, positions=positions)
+    order = list(range(width * height))
+    random.shuffle(order)
+    ranks = np.empty(width * height, dtype=np.int32)
+    ranks[np.asarray(order, dtype=np.int64)] = np.arange(width * height, dtype=np.int32)
+    # Flat indices are row-major (y, x); store transposed for surfarray access.
+    return DecayMask(
+        width=width,
+        height=height,
+        ranks=np.ascontiguousarray(ranks.reshape(height, width).T),
+    )
 
 
 def _build_decay_masks() -> dict[str, list[DecayMask]]:
@@ -87,8 +109,31 @@ class DecayingEntityEffect:
         mask: DecayMask | None = None,
         tone: str = "grayscale",
     ) -> None:
-        self.surface = image.copy()
-        self.surface = self.surface.convert_alpha()
+        self.surface: pygame.Surface | None = None
+        self.reset(
+            image,
+            center,
+            duration_frames=duration_frames,
+            mask=mask,
+            tone=tone,
+        )
+
+    def reset(
+        self,
+        image: pygame.Surface,
+        center: tuple[int, int],
+        *,
+        duration_frames: int = DECAY_EFFECT_DURATION_FRAMES,
+        mask: DecayMask | None = None,
+        tone: str = "grayscale",
+    ) -> None:
+        """(Re)initialize the effect, reusing the surface when the size matches."""
+        if self.surface is not None and self.surface.get_size() == image.get_size():
+            self.surface.fill((0, 0, 0, 0))
+            self.surface.blit(image, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            self.surface = image.copy()
+            self.surface = self.surface.convert_alpha()
         self.tone = tone
         self._apply_tone(tone=tone)
         self.rect = self.surface.get_rect(center=center)
@@ -103,7 +148,7 @@ class DecayingEntityEffect:
         self.mask = mask or get_decay_mask(tone=tone)
         self.mask_index = 0
         self.pixel_carry = 0.0
-        self.pixels_per_frame = len(self.mask.positions) / self.duration_frames
+        self.pixels_per_frame = self.mask.pixel_count / self.duration_frames
         self._burn_particles: list[tuple[float, float, float, float, float]] = []
         self._burn_body_circle: tuple[int, int, int] | None = None
         self._burn_body_circle_visible = False
@@ -117,27 +162,32 @@ class DecayingEntityEffect:
     def update(self, *, frames: int = 1) -> bool:
         if frames <= 0:
             return True
+        remove_count = 0
         for _ in range(frames):
             if self.frames_elapsed >= self.duration_frames:
-                return False
+                break
             self.frames_elapsed += 1
             self.pixel_carry += self.pixels_per_frame
-            remove_count = int(self.pixel_carry)
-            if remove_count > 0:
-                self.pixel_carry -= remove_count
-                self._erase_pixels(remove_count)
+            step_count = int(self.pixel_carry)
+            if step_count > 0:
+                self.pixel_carry -= step_count
+                remove_count += step_count
+        if remove_count > 0:
+            self._erase_pixels(remove_count)
         return self.frames_elapsed < self.duration_frames
 
     def _erase_pixels(self, count: int) -> None:
+        total = self.mask.pixel_count
+        if self.mask_index >= total:
+            return
+        self.mask_index = min(total, self.mask_index + count)
         width, height = self.surface.get_size()
-        for _ in range(count):
-            if self.mask_index >= len(self.mask.positions):
-                return
-            x, y = self.mask.positions[self.mask_index]
-            self.mask_index += 1
-            if x >= width or y >= height:
-                continue
-            self.surface.set_at((x, y), (0, 0, 0, 0))
+        width = min(width, self.mask.width)
+        height = min(height, self.mask.height)
+        alpha = pygame.surfarray.pixels_alpha(self.surface)
+        region = alpha[:width, :height]
+        region[self.mask.ranks[:width, :height] < self.mask_index] = 0
+        del region, alpha
 
     def _apply_tone(self, *, tone: str) -> None:
         if tone == "burned":
@@ -291,6 +341,33 @@ class DecayingEntityEffect:
         return draw_surface
 
 
+_DECAY_EFFECT_POOL: list[DecayingEntityEffect] = []
+
+
+def _release_decay_effect(effect: DecayingEntityEffect) -> None:
+    if len(_DECAY_EFFECT_POOL) < _DECAY_EFFECT_POOL_LIMIT:
+        _DECAY_EFFECT_POOL.append(effect)
+
+
+def spawn_decay_effect(
+    effects: list[DecayingEntityEffect],
+    image: pygame.Surface,
+    center: tuple[int, int],
+    *,
+    tone: str = "grayscale",
+) -> DecayingEntityEffect:
+    """Append a pooled decay effect, retiring the oldest ones past the cap."""
+    while len(effects) >= MAX_DECAY_EFFECTS:
+        _release_decay_effect(effects.pop(0))
+    if _DECAY_EFFECT_POOL:
+        effect = _DECAY_EFFECT_POOL.pop()
+        effect.reset(image, center, tone=tone)
+    else:
+        effect = DecayingEntityEffect(image, center, tone=tone)
+    effects.append(effect)
+    return effect
+
+
 def update_decay_effects(
     effects: list[DecayingEntityEffect], *, frames: int = 1
 ) -> None:
@@ -300,4 +377,6 @@ def update_decay_effects(
     for effect in effects:
         if effect.update(frames=frames):
             alive.append(effect)
+        else:
+            _release_decay_effect(effect)
     effects[:] = alive
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import multiprocessing
 import os
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 from importlib import resources
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np  # type: ignore
 import pygame
@@ -19,6 +23,21 @@ from .hud import _get_fog_scale
 _SHARED_FOG_CACHE: dict[str, Any] | None = None
 _FOG_CACHE_FORMAT_VERSION = 1
 _FOG_CACHE_APP_NAME = "ZombieEscape"
+# Raw alpha-plane cache: fixed header followed by height*width uint8 alpha
+# bytes in row-major order, so the plane can be np.memmap-ed without decoding.
+_FOG_RAW_MAGIC = b"ZEFOGA"
+_FOG_RAW_FORMAT_VERSION = 1
+_FOG_RAW_HEADER = struct.Struct("<6sHII")  # magic, version, width, height
+# Resident overlay surfaces beyond this budget are dropped least-recently-used
+# first and rebuilt from their (memory-mapped) alpha plane when needed again.
+_FOG_MEMORY_BUDGET_ENV = "ZOMBIE_ESCAPE_FOG_MEMORY_BUDGET_MB"
+_FOG_MEMORY_BUDGET_DEFAULT_MB = 6.0
+_FOG_RESIDENCY_LOCK = threading.RLock()
+# Offline fog generation: profiles build in separate processes and the NumPy
+# passes inside one profile split the canvas into row tiles across threads.
+_FOG_BUILD_WORKERS_ENV = "ZOMBIE_ESCAPE_FOG_BUILD_WORKERS"
+_FOG_TILE_ROWS = 128
+_fog_tile_workers = 1
 
 
 def _build_bayer_matrix(size: int) -> np.ndarray:
@@ -91,16 +110,24 @@ def _fog_cache_dir() -> Path:
     return Path(user_cache_dir(_FOG_CACHE_APP_NAME, _FOG_CACHE_APP_NAME)) / "fog"
 
 
-def _fog_cache_filename(profile: _FogProfile, layer: str) -> str:
-    return f"fog_{profile.name.lower()}_{layer}.v{_FOG_CACHE_FORMAT_VERSION}.png"
+def _fog_cache_filename(
+    profile: _FogProfile, layer: str, *, extension: str = "png"
+) -> str:
+    return (
+        f"fog_{profile.name.lower()}_{layer}.v{_FOG_CACHE_FORMAT_VERSION}.{extension}"
+    )
 
 
-def _fog_cache_file_path(profile: _FogProfile, layer: str) -> Path:
-    return _fog_cache_dir() / _fog_cache_filename(profile, layer)
+def _fog_cache_file_path(
+    profile: _FogProfile, layer: str, *, extension: str = "png"
+) -> Path:
+    return _fog_cache_dir() / _fog_cache_filename(profile, layer, extension=extension)
 
 
-def _fog_resource_cache_path(profile: _FogProfile, layer: str) -> Path | None:
-    filename = _fog_cache_filename(profile, layer)
+def _fog_resource_cache_path(
+    profile: _FogProfile, layer: str, *, extension: str = "png"
+) -> Path | None:
+    filename = _fog_cache_filename(profile, layer, extension=extension)
     try:
         base = resources.files("zombie_escape").joinpath("assets").joinpath("fog_cache")
         target = base.joinpath(filename)
@@ -153,40 +180,191 @@ def _save_alpha_to_png(
     pygame.image.save(surface_for_save, str(path))
 
 
+def _load_alpha_from_raw(
+    path: Path,
+    *,
+    expected_size: tuple[int, int],
+) -> np.ndarray | None:
+    """Map a raw alpha-plane cache file without reading its pixel data."""
+    try:
+        with path.open("rb") as fh:
+            header = fh.read(_FOG_RAW_HEADER.size)
+        if len(header) != _FOG_RAW_HEADER.size:
+            return None
+        magic, version, width, height = _FOG_RAW_HEADER.unpack(header)
+        if magic != _FOG_RAW_MAGIC or version != _FOG_RAW_FORMAT_VERSION:
+            return None
+        if (width, height) != expected_size:
+            return None
+        if path.stat().st_size != _FOG_RAW_HEADER.size + width * height:
+            return None
+        return np.memmap(
+            path,
+            dtype=np.uint8,
+            mode="r",
+            offset=_FOG_RAW_HEADER.size,
+            shape=(height, width),
+        )
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _save_alpha_to_raw(alpha: np.ndarray, path: Path) -> None:
+    height, width = alpha.shape
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(
+            _FOG_RAW_HEADER.pack(_FOG_RAW_MAGIC, _FOG_RAW_FORMAT_VERSION, width, height)
+        )
+        fh.write(np.ascontiguousarray(alpha, dtype=np.uint8).tobytes())
+    tmp_path.replace(path)
+
+
+def _fog_memory_budget_bytes() -> int:
+    raw = os.environ.get(_FOG_MEMORY_BUDGET_ENV)
+    budget_mb = _FOG_MEMORY_BUDGET_DEFAULT_MB
+    if raw:
+        try:
+            budget_mb = max(0.0, float(raw))
+        except ValueError:
+            pass
+    return int(budget_mb * 1024 * 1024)
+
+
+def _overlay_surface_bytes(entry: dict[str, Any] | None) -> int:
+    combined = entry.get("combined") if entry else None
+    if combined is None:
+        return 0
+    return combined.get_width() * combined.get_height() * combined.get_bytesize()
+
+
+def _touch_resident_overlay(
+    fog_data: dict[str, Any], profile: _FogProfile, *, evict: bool = True
+) -> None:
+    """Mark a profile as most recently used and enforce the memory budget.
+
+    The profile currently being drawn is never evicted. Prefetching passes
+    `evict=False` so a background build cannot push out the overlay on screen;
+    the next foreground draw trims the residency list instead.
+    """
+    with _FOG_RESIDENCY_LOCK:
+        overlays = fog_data.setdefault("overlays", {})
+        resident: list[_FogProfile] = fog_data.setdefault("resident", [])
+        if profile in resident:
+            resident.remove(profile)
+        resident.append(profile)
+        if not evict:
+            return
+        pinned = fog_data.get("drawing")
+        total = sum(_overlay_surface_bytes(overlays.get(p)) for p in resident)
+        budget = _fog_memory_budget_bytes()
+        for victim in list(resident[:-1]):
+            if total <= budget:
+                break
+            if victim is pinned:
+                continue
+            entry = overlays.get(victim)
+            if entry is None or "alpha" not in entry:
+                # Generated overlays have no backing plane to rebuild from.
+                continue
+            total -= _overlay_surface_bytes(entry)
+            entry.pop("combined", None)
+            resident.remove(victim)
+
+
+def _materialize_overlay_entry(
+    fog_data: dict[str, Any],
+    entry: dict[str, Any],
+    profile: _FogProfile,
+    *,
+    evict: bool = True,
+) -> dict[str, Any]:
+    """Wrap a lazily loaded alpha plane into the overlay surface on demand.
+
+    Returns a copy of the entry taken under the residency lock, so callers keep
+    the surface even if another profile's touch evicts it afterwards.
+    """
+    with _FOG_RESIDENCY_LOCK:
+        if "combined" not in entry:
+            entry["combined"] = _surface_with_alpha_from_array(
+                entry["alpha"], profile.color
+            )
+        _touch_resident_overlay(fog_data, profile, evict=evict)
+        return dict(entry)
+
+
+def prefetch_fog_profile(fog_data: dict[str, Any], flashlight_count: int) -> None:
+    """Build the overlay for `flashlight_count` in a background thread.
+
+    Only lazily loaded entries are prefetched; missing or already resident
+    profiles are left alone.
+    """
+    profile = _FogProfile._from_flashlight_count(flashlight_count)
+    with _FOG_RESIDENCY_LOCK:
+        entry = fog_data.get("overlays", {}).get(profile)
+        if entry is None or "combined" in entry or "alpha" not in entry:
+            return
+        pending: set[_FogProfile] = fog_data.setdefault("prefetching", set())
+        if profile in pending:
+            return
+        pending.add(profile)
+
+    def _run() -> None:
+        try:
+            _materialize_overlay_entry(fog_data, entry, profile, evict=False)
+        except pygame.error as e:
+            print(f"Error prefetching fog overlay: {e}")
+        finally:
+            with _FOG_RESIDENCY_LOCK:
+                pending.discard(profile)
+
+    threading.Thread(
+        target=_run, name=f"fog-prefetch-{profile.name.lower()}", daemon=True
+    ).start()
+
+
 def _load_cached_overlay_entry(
     assets: RenderAssets,
     profile: _FogProfile,
     *,
     expected_size: tuple[int, int],
 ) -> dict[str, Any] | None:
-    def _try_load(combined_path: Path) -> dict[str, Any] | None:
+    """Return a lazy overlay entry (`{"alpha": plane}`) from disk caches.
+
+    Raw alpha planes are preferred (bundled, then user cache); PNGs are the
+    fallback, and a PNG hit is converted into a raw user cache file so the
+    next start can map it directly.
+    """
+    del assets
+    for raw_path in (
+        _fog_resource_cache_path(profile, "combined", extension="alpha"),
+        _fog_cache_file_path(profile, "combined", extension="alpha"),
+    ):
+        if raw_path is None or not raw_path.exists():
+            continue
+        alpha = _load_alpha_from_raw(raw_path, expected_size=expected_size)
+        if alpha is not None:
+            return {"alpha": alpha}
+
+    for png_path in (
+        _fog_resource_cache_path(profile, "combined"),
+        _fog_cache_file_path(profile, "combined"),
+    ):
+        if png_path is None or not png_path.exists():
+            continue
         try:
-            combined_alpha = _load_alpha_from_png(
-                combined_path,
-                expected_size=expected_size,
-            )
-            if combined_alpha is None:
-                return None
-            combined_surface = _surface_with_alpha_from_array(
-                combined_alpha, profile.color
-            )
-            return {
-                "combined": combined_surface,
-            }
+            alpha = _load_alpha_from_png(png_path, expected_size=expected_size)
         except Exception:
-            return None
-
-    combined_resource_path = _fog_resource_cache_path(profile, "combined")
-    if combined_resource_path is not None:
-        loaded = _try_load(combined_resource_path)
-        if loaded is not None:
-            return loaded
-
-    combined_cache_path = _fog_cache_file_path(profile, "combined")
-    if combined_cache_path.exists():
-        loaded = _try_load(combined_cache_path)
-        if loaded is not None:
-            return loaded
+            alpha = None
+        if alpha is None:
+            continue
+        try:
+            raw_path = _fog_cache_file_path(profile, "combined", extension="alpha")
+            raw_path.parent.mkdir(parents=True, exist_ok=True)
+            _save_alpha_to_raw(alpha, raw_path)
+        except OSError:
+            pass
+        return {"alpha": alpha}
     return None
 
 
@@ -210,17 +388,79 @@ def save_fog_cache_profile(
     out_base.mkdir(parents=True, exist_ok=True)
     combined_path = out_base / _fog_cache_filename(profile, "combined")
     _save_alpha_to_png(combined_alpha, combined_path, color=profile.color)
-    return [combined_path]
+    raw_path = out_base / _fog_cache_filename(profile, "combined", extension="alpha")
+    _save_alpha_to_raw(combined_alpha, raw_path)
+    return [combined_path, raw_path]
+
+
+def _fog_build_workers() -> int:
+    raw = os.environ.get(_FOG_BUILD_WORKERS_ENV)
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+def _save_fog_cache_profile_worker(
+    assets: RenderAssets,
+    profile_name: str,
+    output_dir: Path | None,
+    tile_workers: int,
+) -> list[Path]:
+    global _fog_tile_workers
+    _fog_tile_workers = tile_workers
+    return save_fog_cache_profile(
+        assets, _FogProfile[profile_name], output_dir=output_dir
+    )
 
 
 def save_all_fog_caches(
     assets: RenderAssets,
     *,
     output_dir: Path | None = None,
+    workers: int | None = None,
 ) -> list[Path]:
+    """Build and save every fog profile, one process per profile.
+
+    `workers` defaults to `ZOMBIE_ESCAPE_FOG_BUILD_WORKERS` or the CPU count.
+    Cores left over after one per profile are used for row tiles.
+    """
+    global _fog_tile_workers
+    profiles = list(_FogProfile)
+    total_workers = workers if workers is not None else _fog_build_workers()
+    process_count = max(1, min(total_workers, len(profiles)))
+    tile_workers = max(1, total_workers // process_count)
     saved_paths: list[Path] = []
-    for profile in _FogProfile:
-        saved_paths.extend(save_fog_cache_profile(assets, profile, output_dir=output_dir))
+    if process_count <= 1:
+        previous_tile_workers = _fog_tile_workers
+        _fog_tile_workers = tile_workers
+        try:
+            for profile in profiles:
+                saved_paths.extend(
+                    save_fog_cache_profile(assets, profile, output_dir=output_dir)
+                )
+        finally:
+            _fog_tile_workers = previous_tile_workers
+        return saved_paths
+
+    with ProcessPoolExecutor(
+        max_workers=process_count,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _save_fog_cache_profile_worker,
+                assets,
+                profile.name,
+                output_dir,
+                tile_workers,
+            )
+            for profile in profiles
+        ]
+        for future in futures:
+            saved_paths.extend(future.result())
     return saved_paths
 
 
@@ -271,6 +511,34 @@ def _soften_surface(
     return pygame.transform.smoothscale(softened, (width, height))
 
 
+def _build_alpha_in_row_tiles(
+    size: tuple[int, int],
+    build_rows: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """Evaluate a per-pixel alpha function over row tiles of a canvas.
+
+    `build_rows(yy, xx)` receives coordinate grids for one band of rows and
+    returns its uint8 alpha. Bands run on threads (NumPy releases the GIL in
+    the heavy ufuncs) and the result matches a single full-canvas pass.
+    """
+    width, height = size
+    alpha = np.empty((height, width), dtype=np.uint8)
+
+    def _fill(top: int) -> None:
+        bottom = min(height, top + _FOG_TILE_ROWS)
+        yy, xx = np.mgrid[top:bottom, 0:width]
+        alpha[top:bottom] = build_rows(yy, xx)
+
+    tops = range(0, height, _FOG_TILE_ROWS)
+    if _fog_tile_workers <= 1 or height <= _FOG_TILE_ROWS:
+        for top in tops:
+            _fill(top)
+    else:
+        with ThreadPoolExecutor(max_workers=_fog_tile_workers) as pool:
+            list(pool.map(_fill, tops))
+    return alpha
+
+
 def _build_continuous_hatch_surface(
     size: tuple[int, int],
     center: tuple[int, int],
@@ -295,30 +563,33 @@ def _build_continuous_hatch_surface(
     cell_center = (spacing - 1) / 2.0
 
     cx, cy = center
+
+    def _rows(yy: np.ndarray, xx: np.ndarray) -> np.ndarray:
+        dx = xx - cx
+        dy = yy - cy
+        radius = np.hypot(dx, dy)
+        density = np.zeros_like(radius)
+        for ramp_max_density, ramp_start, ramp_range in ramps:
+            progress = (radius - ramp_start) / ramp_range
+            progress = np.clip(progress, 0.0, 1.0)
+            density += ramp_max_density * progress
+        density = np.clip(density, 0.0, 1.0)
+        bayer_size = bayer.shape[0]
+        threshold = (density * (bayer_size * bayer_size)).astype(np.int32)
+        grid_x = (xx // spacing) % bayer_size
+        grid_y = (yy // spacing) % bayer_size
+        bayer_vals = bayer[grid_y, grid_x]
+        mask = bayer_vals < threshold
+
+        dot_radius = np.maximum(1.0, density * spacing)
+        local_x = (xx % spacing) - cell_center
+        local_y = (yy % spacing) - cell_center
+        mask &= (local_x * local_x + local_y * local_y) <= (dot_radius * dot_radius)
+        return (mask * base_alpha).astype(np.uint8)
+
+    alpha = _build_alpha_in_row_tiles((width, height), _rows)
     alpha_view = pg_surfarray.pixels_alpha(hatch)
-    yy, xx = np.indices((height, width))
-    dx = xx - cx
-    dy = yy - cy
-    radius = np.hypot(dx, dy)
-    density = np.zeros_like(radius)
-    for ramp_max_density, ramp_start, ramp_range in ramps:
-        progress = (radius - ramp_start) / ramp_range
-        progress = np.clip(progress, 0.0, 1.0)
-        density += ramp_max_density * progress
-    density = np.clip(density, 0.0, 1.0)
-    bayer_size = bayer.shape[0]
-    threshold = (density * (bayer_size * bayer_size)).astype(np.int32)
-    grid_x = (xx // spacing) % bayer_size
-    grid_y = (yy // spacing) % bayer_size
-    bayer_vals = bayer[grid_y, grid_x]
-    mask = bayer_vals < threshold
-
-    dot_radius = np.maximum(1.0, density * spacing)
-    local_x = (xx % spacing) - cell_center
-    local_y = (yy % spacing) - cell_center
-    mask &= (local_x * local_x + local_y * local_y) <= (dot_radius * dot_radius)
-
-    alpha_view[:, :] = (mask.T * base_alpha).astype(np.uint8)
+    alpha_view[:, :] = alpha.T
     del alpha_view
 
     return hatch
@@ -341,13 +612,16 @@ def _build_edge_feather_surface(
     outer_radius = float(max_radius + softness_px)
     transition = max(1.0, outer_radius - inner_radius)
 
+    def _rows(yy: np.ndarray, xx: np.ndarray) -> np.ndarray:
+        dx = xx - center[0]
+        dy = yy - center[1]
+        dist = np.hypot(dx, dy)
+        progress = np.clip((dist - inner_radius) / transition, 0.0, 1.0)
+        return (progress * 255).astype(np.uint8)
+
+    alpha = _build_alpha_in_row_tiles((width, height), _rows)
     alpha_view = pg_surfarray.pixels_alpha(feather)
-    yy, xx = np.indices((height, width))
-    dx = xx - center[0]
-    dy = yy - center[1]
-    dist = np.hypot(dx, dy)
-    progress = np.clip((dist - inner_radius) / transition, 0.0, 1.0)
-    alpha_view[:, :] = (progress.T * 255).astype(np.uint8)
+    alpha_view[:, :] = alpha.T
     del alpha_view
     return feather
 
@@ -360,9 +634,10 @@ def _get_fog_overlay_surfaces(
     use_disk_cache: bool = True,
 ) -> dict[str, Any]:
     overlays = fog_data.setdefault("overlays", {})
+    fog_data["drawing"] = profile
     key = profile
     if key in overlays:
-        return overlays[key]
+        return _materialize_overlay_entry(fog_data, overlays[key], profile)
 
     width, height = _overlay_canvas_size(assets, profile)
     scale = profile._scale(assets)
@@ -376,7 +651,7 @@ def _get_fog_overlay_surfaces(
         )
         if cached is not None:
             overlays[key] = cached
-            return cached
+            return _materialize_overlay_entry(fog_data, cached, profile)
 
     aa_scale = max(1, int(assets.fog_layer_aa_scale))
     render_width = max(1, width * aa_scale)
@@ -430,6 +705,7 @@ def _get_fog_overlay_surfaces(
         "combined": combined_surface,
     }
     overlays[key] = overlay_entry
+    _touch_resident_overlay(fog_data, profile)
     return overlay_entry
 
 
@@ -453,13 +729,16 @@ def _build_flashlight_fade_surface(
     fade_range = max(1.0, end_radius - start_radius)
 
     cx, cy = center
-    yy, xx = np.indices((height, width))
-    dx = xx - cx
-    dy = yy - cy
-    dist = np.hypot(dx, dy)
-    dist = np.minimum(dist, end_radius)
-    progress = np.clip((dist - start_radius) / fade_range, 0.0, 1.0)
-    alpha = (progress * max_alpha).astype(np.uint8)
+
+    def _rows(yy: np.ndarray, xx: np.ndarray) -> np.ndarray:
+        dx = xx - cx
+        dy = yy - cy
+        dist = np.hypot(dx, dy)
+        dist = np.minimum(dist, end_radius)
+        progress = np.clip((dist - start_radius) / fade_range, 0.0, 1.0)
+        return (progress * max_alpha).astype(np.uint8)
+
+    alpha = _build_alpha_in_row_tiles((width, height), _rows)
     alpha_view = pg_surfarray.pixels_alpha(fade_surface)
     alpha_view[:, :] = alpha.T
     del alpha_view
@@ -19,7 +19,7 @@ from ..entities_constants import (
 )
 from ..font_utils import load_font, render_text_surface
 from ..gameplay_constants import SURVIVAL_FAKE_CLOCK_RATIO
-from ..localization import get_font_settings
+from ..localization import get_font_settings, get_language
 from ..localization import translate as tr
 from ..entities_constants import ZombieKind
 from ..models import FuelMode, FuelProgress, Stage, TimedMessage
@@ -44,8 +44,11 @@ from ..render_constants import (
     TIMED_MESSAGE_LEFT_X,
     TIMED_MESSAGE_TOP_Y,
 )
+from .hud_layer import HudBlits, HudCompositor
 
 _HUD_ICON_CACHE: dict[str, surface.Surface] = {}
+_HUD_LAYER = HudCompositor()
+_DEBUG_COUNTS_REFRESH_MS = 250
 _TIME_ACCEL_FRAMES = ("  >>", ">  >", ">>  ", " >> ")
 
 
@@ -207,6 +210,49 @@ def build_zombie_debug_counts_text(
     return f"z:{total} c:{carry} | {details}"
 
 
+def _hud_font(size: int = GAMEPLAY_FONT_SIZE) -> tuple[Any, Any]:
+    font_settings = get_font_settings()
+    font = load_font(font_settings.resource, font_settings.scaled_size(size))
+    return font, font_settings
+
+
+def _build_status_bar_blits(
+    bar_rect: pygame.Rect,
+    status_text: str,
+    seed: int | None,
+) -> HudBlits:
+    overlay = pygame.Surface((bar_rect.width, bar_rect.height), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 140))
+    blits: HudBlits = [(overlay, bar_rect.topleft)]
+    font, font_settings = _hud_font()
+    text_surface = render_text_surface(
+        font, status_text, LIGHT_GRAY, line_height_scale=font_settings.line_height_scale
+    )
+    text_rect = text_surface.get_rect(left=12, centery=bar_rect.centery)
+    blits.append((text_surface, text_rect.topleft))
+    if seed is not None:
+        seed_text = tr("status.seed", value=str(seed))
+        seed_surface = render_text_surface(
+            font,
+            seed_text,
+            LIGHT_GRAY,
+            line_height_scale=font_settings.line_height_scale,
+        )
+        seed_rect = seed_surface.get_rect(
+            right=bar_rect.right - 12, centery=bar_rect.centery
+        )
+        blits.append((seed_surface, seed_rect.topleft))
+    return blits
+
+
+def _build_status_line_blits(text: str, *, left: int, bottom: int) -> HudBlits:
+    font, font_settings = _hud_font()
+    text_surface = render_text_surface(
+        font, text, LIGHT_GRAY, line_height_scale=font_settings.line_height_scale
+    )
+    return [(text_surface, text_surface.get_rect(left=left, bottom=bottom).topleft)]
+
+
 def _draw_status_bar(
     screen: surface.Surface,
     assets: RenderAssets,
@@ -228,9 +274,6 @@ def _draw_status_bar(
         assets.screen_width,
         assets.status_bar_height,
     )
-    overlay = pygame.Surface((bar_rect.width, bar_rect.height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 140))
-    screen.blit(overlay, bar_rect.topleft)
 
     footprints_on = config.get("footprints", {}).get("enabled", True)
     fast_on = config.get("fast_zombies", {}).get("enabled", True)
@@ -255,118 +298,116 @@ def _draw_status_bar(
         parts.append(tr("status.fast"))
     if steel_on:
         parts.append(tr("status.steel"))
-    debug_counts: str | None = None
-    if debug_mode:
-        debug_counts = build_zombie_debug_counts_text(
-            zombie_group=zombie_group,
-            lineformer_marker_count=lineformer_marker_count,
-            falling_spawn_carry=falling_spawn_carry,
-            stage=stage,
-        )
     status_text = " | ".join(parts)
-    color = LIGHT_GRAY
+    language = get_language()
 
     try:
-        font_settings = get_font_settings()
-        font = load_font(
-            font_settings.resource, font_settings.scaled_size(GAMEPLAY_FONT_SIZE)
-        )
-        text_surface = render_text_surface(
-            font, status_text, color, line_height_scale=font_settings.line_height_scale
+        _HUD_LAYER.draw(
+            screen,
+            "status_bar",
+            (language, tuple(bar_rect), status_text, seed),
+            lambda: _build_status_bar_blits(bar_rect, status_text, seed),
         )
-        text_rect = text_surface.get_rect(left=12, centery=bar_rect.centery)
-        screen.blit(text_surface, text_rect)
-        if seed is not None:
-            seed_text = tr("status.seed", value=str(seed))
-            seed_surface = render_text_surface(
-                font,
-                seed_text,
-                LIGHT_GRAY,
-                line_height_scale=font_settings.line_height_scale,
-            )
-            seed_rect = seed_surface.get_rect(
-                right=bar_rect.right - 12, centery=bar_rect.centery
-            )
-            screen.blit(seed_surface, seed_rect)
         overlay_bottom = max(2, bar_rect.top)
         overlay_left = 12
         if show_fps:
             fps_text = f"FPS:{fps:.1f}" if fps is not None else "FPS:-.-"
-            fps_surface = render_text_surface(
-                font,
-                fps_text,
-                LIGHT_GRAY,
-                line_height_scale=font_settings.line_height_scale,
+            _HUD_LAYER.draw(
+                screen,
+                "status_fps",
+                (language, overlay_left, overlay_bottom, fps_text),
+                lambda: _build_status_line_blits(
+                    fps_text, left=overlay_left, bottom=overlay_bottom
+                ),
             )
-            fps_rect = fps_surface.get_rect(left=overlay_left, bottom=overlay_bottom)
-            screen.blit(fps_surface, fps_rect)
+            font, _ = _hud_font()
             fps_max_width = font.size("FPS:999.9")[0]
             overlay_left += fps_max_width + 8
-        if debug_counts:
-            debug_surface = render_text_surface(
-                font,
-                debug_counts,
-                LIGHT_GRAY,
-                line_height_scale=font_settings.line_height_scale,
+        if debug_mode and zombie_group is not None:
+            # Counting zombies by kind walks the whole group; only redo it when
+            # the population changes or the refresh window rolls over.
+            debug_key = (
+                language,
+                overlay_left,
+                overlay_bottom,
+                stage.id if stage else None,
+                len(zombie_group),
+                lineformer_marker_count,
+                falling_spawn_carry,
+                pygame.time.get_ticks() // _DEBUG_COUNTS_REFRESH_MS,
             )
-            debug_rect = debug_surface.get_rect(
-                left=overlay_left, bottom=overlay_bottom
-            )
-            screen.blit(debug_surface, debug_rect)
+
+            def _build_debug_counts() -> HudBlits:
+                debug_counts = build_zombie_debug_counts_text(
+                    zombie_group=zombie_group,
+                    lineformer_marker_count=lineformer_marker_count,
+                    falling_spawn_carry=falling_spawn_carry,
+                    stage=stage,
+                )
+                if not debug_counts:
+                    return []
+                return _build_status_line_blits(
+                    debug_counts, left=overlay_left, bottom=overlay_bottom
+                )
+
+            _HUD_LAYER.draw(screen, "status_debug", debug_key, _build_debug_counts)
     except pygame.error as e:
         print(f"Error rendering status bar: {e}")
 
 
+def _build_objective_blits(lines: tuple[str, ...]) -> HudBlits:
+    font, font_settings = _hud_font()
+    blits: HudBlits = []
+    y = 8
+    for line in lines:
+        text_surface = render_text_surface(
+            font, line, YELLOW, line_height_scale=font_settings.line_height_scale
+        )
+        text_rect = text_surface.get_rect(topleft=(12, y))
+        blits.append((text_surface, text_rect.topleft))
+        y += text_rect.height + 4
+    return blits
+
+
 def _draw_objective(lines: list[str], *, screen: surface.Surface) -> None:
+    key = (get_language(), tuple(lines))
     try:
-        font_settings = get_font_settings()
-        font = load_font(
-            font_settings.resource, font_settings.scaled_size(GAMEPLAY_FONT_SIZE)
+        _HUD_LAYER.draw(
+            screen, "objective", key, lambda: _build_objective_blits(key[1])
         )
-        y = 8
-        for line in lines:
-            text_surface = render_text_surface(
-                font, line, YELLOW, line_height_scale=font_settings.line_height_scale
-            )
-            text_rect = text_surface.get_rect(topleft=(12, y))
-            screen.blit(text_surface, text_rect)
-            y += text_rect.height + 4
     except pygame.error as e:
         print(f"Error rendering objective: {e}")
 
 
-def _draw_inventory_icons(
-    screen: surface.Surface,
-    assets: RenderAssets,
+def _build_inventory_blits(
+    screen_width: int,
     *,
     has_fuel: bool,
     has_empty_fuel_can: bool,
     flashlight_count: int,
     shoes_count: int,
-    player_in_car: bool = False,
-    buddy_onboard: int = 0,
-    survivors_onboard: int = 0,
-    passenger_capacity: int = 0,
-) -> None:
+    player_in_car: bool,
+    buddy_onboard: int,
+    survivors_onboard: int,
+    passenger_capacity: int,
+) -> HudBlits:
     spacing = 3
     padding = 8
     y = 8
-    right_edge = assets.screen_width - padding
+    right_edge = screen_width - padding
+    blits: HudBlits = []
 
     passenger_icon: surface.Surface | None = None
     passenger_surface: surface.Surface | None = None
     passenger_bottom_pad = 0
     if player_in_car:
         try:
-            font_settings = get_font_settings()
-            font = load_font(
-                font_settings.resource, font_settings.scaled_size(GAMEPLAY_FONT_SIZE)
-            )
+            font, font_settings = _hud_font()
             passenger_text = tr(
                 "hud.passengers_compact",
-                crew=max(0, int(buddy_onboard)),
-                survivors=max(0, int(survivors_onboard)),
-                limit=max(0, int(passenger_capacity)),
+                crew=buddy_onboard,
+                survivors=survivors_onboard,
+                limit=passenger_capacity,
             )
             passenger_surface = render_text_surface(
                 font,
@@ -396,9 +437,9 @@ def _draw_inventory_icons(
         icons.append(_get_hud_icon("fuel"))
     elif has_empty_fuel_can:
         icons.append(_get_hud_icon("empty_fuel"))
-    for _ in range(max(0, int(flashlight_count))):
+    for _ in range(flashlight_count):
         icons.append(_get_hud_icon("flashlight"))
-    for _ in range(max(0, int(shoes_count))):
+    for _ in range(shoes_count):
         icons.append(_get_hud_icon("shoes"))
     if icons:
         total_width = sum(icon.get_width() for icon in icons)
@@ -406,7 +447,7 @@ def _draw_inventory_icons(
         start_x = reserved_right - total_width
         x = max(padding, start_x)
         for icon in icons:
-            screen.blit(icon, (x, y))
+            blits.append((icon, (x, y)))
             x += icon.get_width() + spacing
 
     if passenger_icon is not None and passenger_surface is not None:
@@ -416,8 +457,80 @@ def _draw_inventory_icons(
             top=y,
         )
         text_rect.bottom = icon_rect.bottom + passenger_bottom_pad
-        screen.blit(passenger_icon, icon_rect)
-        screen.blit(passenger_surface, text_rect)
+        blits.append((passenger_icon, icon_rect.topleft))
+        blits.append((passenger_surface, text_rect.topleft))
+    return blits
+
+
+def _draw_inventory_icons(
+    screen: surface.Surface,
+    assets: RenderAssets,
+    *,
+    has_fuel: bool,
+    has_empty_fuel_can: bool,
+    flashlight_count: int,
+    shoes_count: int,
+    player_in_car: bool = False,
+    buddy_onboard: int = 0,
+    survivors_onboard: int = 0,
+    passenger_capacity: int = 0,
+) -> None:
+    inputs = {
+        "has_fuel": bool(has_fuel),
+        "has_empty_fuel_can": bool(has_empty_fuel_can),
+        "flashlight_count": max(0, int(flashlight_count)),
+        "shoes_count": max(0, int(shoes_count)),
+        "player_in_car": bool(player_in_car),
+        "buddy_onboard": max(0, int(buddy_onboard)),
+        "survivors_onboard": max(0, int(survivors_onboard)),
+        "passenger_capacity": max(0, int(passenger_capacity)),
+    }
+    key = (get_language(), assets.screen_width, *inputs.values())
+    _HUD_LAYER.draw(
+        screen,
+        "inventory",
+        key,
+        lambda: _build_inventory_blits(assets.screen_width, **inputs),
+    )
+
+
+def _build_endurance_track_blits(
+    bar_rect: pygame.Rect,
+    progress_width: int,
+    fill_color: tuple[int, int, int, int],
+) -> HudBlits:
+    track_surface = pygame.Surface((bar_rect.width, bar_rect.height), pygame.SRCALPHA)
+    track_surface.fill((0, 0, 0, 140))
+    blits: HudBlits = [(track_surface, bar_rect.topleft)]
+    if progress_width > 0:
+        fill_surface = pygame.Surface(
+            (progress_width, bar_rect.height), pygame.SRCALPHA
+        )
+        fill_surface.fill(fill_color)
+        blits.append((fill_surface, bar_rect.topleft))
+    return blits
+
+
+def _build_endurance_text_blits(
+    bar_rect: pygame.Rect, text_bottom: int, timer_text: str
+) -> HudBlits:
+    font, font_settings = _hud_font()
+    text_surface = render_text_surface(
+        font,
+        timer_text,
+        LIGHT_GRAY,
+        line_height_scale=font_settings.line_height_scale,
+    )
+    text_rect = text_surface.get_rect(left=bar_rect.left, bottom=text_bottom)
+    hint_text = tr("hud.time_accel_hint")
+    hint_surface = render_text_surface(
+        font,
+        hint_text,
+        LIGHT_GRAY,
+        line_height_scale=font_settings.line_height_scale,
+    )
+    hint_rect = hint_surface.get_rect(right=bar_rect.right, bottom=text_bottom)
+    return [(text_surface, text_rect.topleft), (hint_surface, hint_rect.topleft)]
 
 
 def _draw_endurance_timer(
@@ -445,26 +558,17 @@ def _draw_endurance_timer(
         assets.screen_width - padding * 2,
         bar_height,
     )
-    track_surface = pygame.Surface((bar_rect.width, bar_rect.height), pygame.SRCALPHA)
-    track_surface.fill((0, 0, 0, 140))
-    screen.blit(track_surface, bar_rect.topleft)
     progress_ratio = elapsed_ms / goal_ms if goal_ms else 0.0
     progress_width = int(bar_rect.width * max(0.0, min(1.0, progress_ratio)))
-    if progress_width > 0:
-        fill_color = (120, 20, 20, 160)
-        if state.dawn_ready:
-            fill_color = (25, 40, 120, 160)
-        fill_rect = pygame.Rect(
-            bar_rect.left,
-            bar_rect.top,
-            progress_width,
-            bar_rect.height,
-        )
-        fill_surface = pygame.Surface(
-            (progress_width, bar_rect.height), pygame.SRCALPHA
-        )
-        fill_surface.fill(fill_color)
-        screen.blit(fill_surface, fill_rect.topleft)
+    fill_color = (120, 20, 20, 160)
+    if state.dawn_ready:
+        fill_color = (25, 40, 120, 160)
+    _HUD_LAYER.draw(
+        screen,
+        "endurance_track",
+        (tuple(bar_rect), progress_width, fill_color),
+        lambda: _build_endurance_track_blits(bar_rect, progress_width, fill_color),
+    )
     display_ms = int(remaining_ms * SURVIVAL_FAKE_CLOCK_RATIO)
     display_ms = max(0, display_ms)
     display_hours = display_ms // 3_600_000
@@ -472,31 +576,26 @@ def _draw_endurance_timer(
     display_label = f"{int(display_hours):02d}:{int(display_minutes):02d}"
     timer_text = tr("hud.endurance_timer_label", time=display_label)
     try:
-        font_settings = get_font_settings()
-        font = load_font(
-            font_settings.resource, font_settings.scaled_size(GAMEPLAY_FONT_SIZE)
-        )
-        text_surface = render_text_surface(
-            font,
-            timer_text,
-            LIGHT_GRAY,
-            line_height_scale=font_settings.line_height_scale,
-        )
-        text_rect = text_surface.get_rect(left=bar_rect.left, bottom=text_bottom)
-        screen.blit(text_surface, text_rect)
-        hint_text = tr("hud.time_accel_hint")
-        hint_surface = render_text_surface(
-            font,
-            hint_text,
-            LIGHT_GRAY,
-            line_height_scale=font_settings.line_height_scale,
+        _HUD_LAYER.draw(
+            screen,
+            "endurance_text",
+            (get_language(), tuple(bar_rect), text_bottom, timer_text),
+            lambda: _build_endurance_text_blits(bar_rect, text_bottom, timer_text),
         )
-        hint_rect = hint_surface.get_rect(right=bar_rect.right, bottom=text_bottom)
-        screen.blit(hint_surface, hint_rect)
     except pygame.error as e:
         print(f"Error rendering endurance timer: {e}")
 
 
+def _build_time_accel_blits(screen_width: int, bottom: int) -> HudBlits:
+    font, font_settings = _hud_font()
+    text = tr("hud.time_accel_hint")
+    text_surface = render_text_surface(
+        font, text, LIGHT_GRAY, line_height_scale=font_settings.line_height_scale
+    )
+    text_rect = text_surface.get_rect(right=screen_width - 12, bottom=bottom)
+    return [(text_surface, text_rect.topleft)]
+
+
 def _draw_time_accel_indicator(
     screen: surface.Surface,
     assets: RenderAssets,
@@ -505,26 +604,41 @@ def _draw_time_accel_indicator(
 ) -> None:
     if stage and stage.endurance_stage:
         return
+    bottom = assets.screen_height - (assets.status_bar_height + 6)
     try:
-        font_settings = get_font_settings()
-        font = load_font(
-            font_settings.resource, font_settings.scaled_size(GAMEPLAY_FONT_SIZE)
-        )
-        text = tr("hud.time_accel_hint")
-        color = LIGHT_GRAY
-        text_surface = render_text_surface(
-            font, text, color, line_height_scale=font_settings.line_height_scale
-        )
-        bottom_margin = assets.status_bar_height + 6
-        text_rect = text_surface.get_rect(
-            right=assets.screen_width - 12,
-            bottom=assets.screen_height - bottom_margin,
+        _HUD_LAYER.draw(
+            screen,
+            "time_accel",
+            (get_language(), assets.screen_width, bottom),
+            lambda: _build_time_accel_blits(assets.screen_width, bottom),
         )
-        screen.blit(text_surface, text_rect)
     except pygame.error as e:
         print(f"Error rendering acceleration indicator: {e}")
 
 
+def _build_survivor_message_blits(
+    screen_width: int, screen_height: int, texts: tuple[str, ...]
+) -> HudBlits:
+    font_settings = get_font_settings()
+    font_size = font_settings.scaled_size(GAMEPLAY_FONT_SIZE * 2)
+    font = load_font(font_settings.resource, font_size)
+    line_height = int(round(font.get_linesize() * 2))
+    base_y = screen_height // 2 - (line_height * 2)
+    blits: HudBlits = []
+    for idx, text in enumerate(texts):
+        if not text:
+            continue
+        msg_surface = render_text_surface(
+            font, text, ORANGE, line_height_scale=font_settings.line_height_scale
+        )
+        msg_surface.set_alpha(SURVIVOR_MESSAGE_ALPHA)
+        msg_rect = msg_surface.get_rect(
+            center=(screen_width // 2, base_y + idx * line_height)
+        )
+        blits.append((msg_surface, msg_rect.topleft))
+    return blits
+
+
 def _draw_survivor_messages(
     screen: surface.Surface,
     assets: RenderAssets,
@@ -532,28 +646,67 @@ def _draw_survivor_messages(
 ) -> None:
     if not survivor_messages:
         return
+    texts = tuple(message.get("text", "") for message in survivor_messages[:5])
     try:
-        font_settings = get_font_settings()
-        font_size = font_settings.scaled_size(GAMEPLAY_FONT_SIZE * 2)
-        font = load_font(font_settings.resource, font_size)
-        line_height = int(round(font.get_linesize() * 2))
-        base_y = assets.screen_height // 2 - (line_height * 2)
-        for idx, message in enumerate(survivor_messages[:5]):
-            text = message.get("text", "")
-            if not text:
-                continue
-            msg_surface = render_text_surface(
-                font, text, ORANGE, line_height_scale=font_settings.line_height_scale
-            )
-            msg_surface.set_alpha(SURVIVOR_MESSAGE_ALPHA)
-            msg_rect = msg_surface.get_rect(
-                center=(assets.screen_width // 2, base_y + idx * line_height)
-            )
-            screen.blit(msg_surface, msg_rect)
+        _HUD_LAYER.draw(
+            screen,
+            "survivor_messages",
+            (get_language(), assets.screen_width, assets.screen_height, texts),
+            lambda: _build_survivor_message_blits(
+                assets.screen_width, assets.screen_height, texts
+            ),
+        )
     except pygame.error as e:
         print(f"Error rendering survivor message: {e}")
 
 
+def _build_timed_message_blits(
+    screen_width: int,
+    screen_height: int,
+    text: str,
+    text_color: tuple[int, int, int],
+    align: str,
+) -> HudBlits:
+    font_settings = get_font_settings()
+    font_size = font_settings.scaled_size(GAMEPLAY_FONT_SIZE * 2)
+    font = load_font(font_settings.resource, font_size)
+    line_height = int(round(font.get_linesize() * font_settings.line_height_scale))
+    lines = text.splitlines() or [text]
+    rendered_lines = [
+        render_text_surface(
+            font,
+            line,
+            text_color,
+            line_height_scale=font_settings.line_height_scale,
+        )
+        for line in lines
+    ]
+    max_width = max(line_surface.get_width() for line_surface in rendered_lines)
+    total_height = line_height * len(rendered_lines)
+    if align == "left":
+        text_rect = pygame.Rect(
+            TIMED_MESSAGE_LEFT_X, TIMED_MESSAGE_TOP_Y, max_width, total_height
+        )
+    else:
+        text_rect = pygame.Rect(0, 0, max_width, total_height)
+        text_rect.center = (screen_width // 2, screen_height // 2)
+    padding_x = 16
+    padding_y = max(8, int(round(line_height * 0.35)))
+    band_rect = text_rect.inflate(padding_x * 2, padding_y * 2)
+    band_surface = pygame.Surface(band_rect.size, pygame.SRCALPHA)
+    band_surface.fill((0, 0, 0, TIMED_MESSAGE_BAND_ALPHA))
+    blits: HudBlits = [(band_surface, band_rect.topleft)]
+    y = text_rect.top
+    for line_surface in rendered_lines:
+        if align == "left":
+            line_rect = line_surface.get_rect(topleft=(text_rect.left, y))
+        else:
+            line_rect = line_surface.get_rect(centerx=text_rect.centerx, y=y)
+        blits.append((line_surface, line_rect.topleft))
+        y += line_height
+    return blits
+
+
 def _draw_timed_message(
     screen: surface.Surface,
     assets: RenderAssets,
@@ -567,47 +720,28 @@ def _draw_timed_message(
         return
     if elapsed_play_ms > message.expires_at_ms:
         return
+    text_color = tuple(message.color or LIGHT_GRAY)
+    key = (
+        get_language(),
+        assets.screen_width,
+        assets.screen_height,
+        message.text,
+        text_color,
+        message.align,
+    )
     try:
-        font_settings = get_font_settings()
-        font_size = font_settings.scaled_size(GAMEPLAY_FONT_SIZE * 2)
-        font = load_font(font_settings.resource, font_size)
-        text_color = message.color or LIGHT_GRAY
-        line_height = int(round(font.get_linesize() * font_settings.line_height_scale))
-        lines = message.text.splitlines() or [message.text]
-        rendered_lines = [
-            render_text_surface(
-                font,
-                line,
+        _HUD_LAYER.draw(
+            screen,
+            "timed_message",
+            key,
+            lambda: _build_timed_message_blits(
+                assets.screen_width,
+                assets.screen_height,
+                message.text,
                 text_color,
-                line_height_scale=font_settings.line_height_scale,
-            )
-            for line in lines
-        ]
-        max_width = max(surface.get_width() for surface in rendered_lines)
-        total_height = line_height * len(rendered_lines)
-        if message.align == "left":
-            text_rect = pygame.Rect(
-                TIMED_MESSAGE_LEFT_X, TIMED_MESSAGE_TOP_Y, max_width, total_height
-            )
-        else:
-            center_x = assets.screen_width // 2
-            center_y = assets.screen_height // 2
-            text_rect = pygame.Rect(0, 0, max_width, total_height)
-            text_rect.center = (center_x, center_y)
-        padding_x = 16
-        padding_y = max(8, int(round(line_height * 0.35)))
-        band_rect = text_rect.inflate(padding_x * 2, padding_y * 2)
-        band_surface = pygame.Surface(band_rect.size, pygame.SRCALPHA)
-        band_surface.fill((0, 0, 0, TIMED_MESSAGE_BAND_ALPHA))
-        screen.blit(band_surface, band_rect.topleft)
-        y = text_rect.top
-        for surface in rendered_lines:
-            if message.align == "left":
-                line_rect = surface.get_rect(topleft=(text_rect.left, y))
-            else:
-                line_rect = surface.get_rect(centerx=text_rect.centerx, y=y)
-            screen.blit(surface, line_rect)
-            y += line_height
+                message.align,
+            ),
+        )
     except pygame.error as e:
         print(f"Error rendering timed message: {e}")
 
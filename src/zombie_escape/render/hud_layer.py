@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from pygame import surface
+
+HudBlits = list[tuple[surface.Surface, tuple[int, int]]]
+
+
+@dataclass
+class _HudWidget:
+    key: Hashable
+    blits: HudBlits
+
+
+class HudCompositor:
+    """Retained-mode HUD widgets.
+
+    Each widget keeps the surfaces it last rendered together with the key built
+    from its inputs (text, counts, item state, language). Widgets are rebuilt
+    only when that key changes; otherwise the cached surfaces are re-blitted.
+    """
+
+    def __init__(self) -> None:
+        self._widgets: dict[str, _HudWidget] = {}
+        self.rebuild_count = 0
+
+    def draw(
+        self,
+        screen: surface.Surface,
+        name: str,
+        key: Hashable,
+        build: Callable[[], HudBlits],
+    ) -> None:
+        widget = self._widgets.get(name)
+        if widget is None or widget.key != key:
+            widget = _HudWidget(key=key, blits=build())
+            self._widgets[name] = widget
+            self.rebuild_count += 1
+        if widget.blits:
+            screen.blits(widget.blits, doreturn=False)
+
+    def invalidate(self, name: str | None = None) -> None:
+        if name is None:
+            self._widgets.clear()
+            return
+        self._widgets.pop(name, None)
+
+
+__all__ = ["HudBlits", "HudCompositor"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import pygame
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..entities import Camera
+
+__all__ = ["RenderInterpolator"]
+
+
+class RenderInterpolator:
+    """Blend mobile entity positions between the last two simulation ticks.
+
+    `capture` stores rect positions right before the final tick of a frame.
+    `applied` temporarily moves rects (and the camera) to
+    `previous + (current - previous) * alpha` for drawing and restores the
+    simulated positions afterwards. Jumps longer than `snap_distance`
+    (respawns, mounting, teleports) are drawn at the current position.
+    """
+
+    def __init__(self) -> None:
+        self._previous: dict[pygame.sprite.Sprite, tuple[int, int]] = {}
+        self._camera_previous: tuple[int, int] | None = None
+
+    def clear(self) -> None:
+        self._previous.clear()
+        self._camera_previous = None
+
+    def capture(
+        self,
+        entities: Iterable[pygame.sprite.Sprite],
+        camera: Camera | None,
+    ) -> None:
+        self._previous = {entity: entity.rect.topleft for entity in entities}
+        self._camera_previous = camera.camera.topleft if camera is not None else None
+
+    @staticmethod
+    def _blend(
+        previous: tuple[int, int],
+        current: tuple[int, int],
+        alpha: float,
+        snap_distance: float,
+    ) -> tuple[int, int] | None:
+        dx = current[0] - previous[0]
+        dy = current[1] - previous[1]
+        if (dx == 0 and dy == 0) or dx * dx + dy * dy > snap_distance * snap_distance:
+            return None
+        return (
+            int(round(previous[0] + dx * alpha)),
+            int(round(previous[1] + dy * alpha)),
+        )
+
+    @contextmanager
+    def applied(
+        self,
+        entities: Iterable[pygame.sprite.Sprite],
+        camera: Camera | None,
+        *,
+        alpha: float,
+        snap_distance: float,
+    ) -> Iterator[None]:
+        if alpha >= 1.0 or not self._previous:
+            yield
+            return
+        alpha = max(0.0, alpha)
+        moved: list[tuple[pygame.Rect, tuple[int, int]]] = []
+        for entity in entities:
+            previous = self._previous.get(entity)
+            if previous is None:
+                continue
+            rect = entity.rect
+            current = rect.topleft
+            blended = self._blend(previous, current, alpha, snap_distance)
+            if blended is None:
+                continue
+            moved.append((rect, current))
+            rect.topleft = blended
+        camera_rect: pygame.Rect | None = None
+        camera_current: tuple[int, int] | None = None
+        if camera is not None and self._camera_previous is not None:
+            camera_current = camera.camera.topleft
+            blended = self._blend(
+                self._camera_previous, camera_current, alpha, snap_distance
+            )
+            if blended is not None:
+                camera_rect = camera.camera
+                camera_rect.topleft = blended
+        try:
+            yield
+        finally:
+            for rect, current in moved:
+                rect.topleft = current
+            if camera_rect is not None and camera_current is not None:
+                camera_rect.topleft = camera_current
@@ -4,7 +4,7 @@ import pygame
 from pygame import surface
 
 from ..colors import LIGHT_GRAY, WHITE
-from ..font_utils import load_font, render_text_surface
+from ..font_utils import cached_text_layout, load_font, render_text_surface
 from ..localization import get_font_settings
 from ..localization import translate as tr
 from ..render_constants import GAMEPLAY_FONT_SIZE
@@ -27,9 +27,11 @@ def _wrap_long_segment(
     return lines
 
 
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
+def _wrap_text_uncached(
+    text: str, font: pygame.font.Font, max_width: int
+) -> tuple[str, ...]:
     if max_width <= 0:
-        return [text]
+        return (text,)
     paragraphs = text.splitlines() or [text]
     lines: list[str] = []
     for paragraph in paragraphs:
@@ -55,7 +57,43 @@ def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
                 current = ""
         if current:
             lines.append(current)
-    return lines
+    return tuple(lines)
+
+
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> list[str]:
+    lines = cached_text_layout(
+        font,
+        ("wrap", text, max_width),
+        lambda: _wrap_text_uncached(text, font, max_width),
+    )
+    return list(lines)
+
+
+def _wrapped_line_surfaces(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, int, int],
+    max_width: int,
+    line_height_scale: float,
+) -> tuple[tuple[str, surface.Surface], ...]:
+    """Return cached (line, rendered surface) pairs for wrapped text."""
+
+    def _build() -> tuple[tuple[str, surface.Surface], ...]:
+        return tuple(
+            (
+                line,
+                render_text_surface(
+                    font, line, color, line_height_scale=line_height_scale
+                ),
+            )
+            for line in wrap_text(text, font, max_width)
+        )
+
+    return cached_text_layout(
+        font,
+        ("lines", text, max_width, tuple(color), line_height_scale),
+        _build,
+    )
 
 
 def blit_text_wrapped(
@@ -72,14 +110,11 @@ def blit_text_wrapped(
 
     x, y = topleft
     line_height = int(round(font.get_linesize() * line_height_scale))
-    for line in wrap_text(text, font, max_width):
-        if not line:
-            y += line_height
-            continue
-        rendered = render_text_surface(
-            font, line, color, line_height_scale=line_height_scale
-        )
-        target.blit(rendered, (x, y))
+    for line, rendered in _wrapped_line_surfaces(
+        text, font, color, max_width, line_height_scale
+    ):
+        if line:
+            target.blit(rendered, (x, y))
         y += line_height
 
 
@@ -125,13 +160,14 @@ def blit_message_wrapped(
         font_settings = get_font_settings()
         font = load_font(font_settings.resource, font_settings.scaled_size(size))
         line_height_scale = font_settings.line_height_scale
-        lines = wrap_text(text, font, max_width)
-        if not lines:
-            return
         rendered = [
-            render_text_surface(font, line, color, line_height_scale=line_height_scale)
-            for line in lines
+            text_surface
+            for _, text_surface in _wrapped_line_surfaces(
+                text, font, color, max_width, line_height_scale
+            )
         ]
+        if not rendered:
+            return
         max_line_width = max(text_surface.get_width() for text_surface in rendered)
         line_height = int(round(font.get_linesize() * line_height_scale))
         total_height = line_height * len(rendered) + line_spacing * (len(rendered) - 1)
@@ -37,6 +37,7 @@ ELECTRIFIED_FLOOR_OVERLAY_ALPHA = 26
 ELECTRIFIED_FLOOR_BORDER_ALPHA = 140
 
 _PUDDLE_TILE_CACHE: dict[tuple[int, tuple[int, int, int], int], surface.Surface] = {}
+_ELECTRIFIED_TILE_CACHE: dict[int, surface.Surface] = {}
 _METAL_TILE_CACHE: dict[
     tuple[
         int,
@@ -531,6 +532,30 @@ def _get_fire_tile_surface(
     return tile
 
 
+def _get_electrified_tile(cell_size: int) -> surface.Surface:
+    """Return the electrified-floor overlay: a faint fill inside a 1px border."""
+    size = max(1, int(cell_size))
+    cached = _ELECTRIFIED_TILE_CACHE.get(size)
+    if cached is not None:
+        return cached
+    accent = ELECTRIFIED_FLOOR_ACCENT_COLOR
+    tile = pygame.Surface((size, size), pygame.SRCALPHA)
+    inner_rect = tile.get_rect().inflate(-2, -2)
+    if inner_rect.width > 0 and inner_rect.height > 0:
+        tile.fill(
+            (accent[0], accent[1], accent[2], ELECTRIFIED_FLOOR_OVERLAY_ALPHA),
+            inner_rect,
+        )
+    pygame.draw.rect(
+        tile,
+        (accent[0], accent[1], accent[2], ELECTRIFIED_FLOOR_BORDER_ALPHA),
+        tile.get_rect(),
+        width=1,
+    )
+    _ELECTRIFIED_TILE_CACHE[size] = tile
+    return tile
+
+
 def _draw_play_area(
     screen: surface.Surface,
     apply_rect: Callable[[pygame.Rect], pygame.Rect],
@@ -846,45 +871,18 @@ def _draw_play_area(
                     screen.blit(ruin_overlay, sr.topleft)
 
     if cell_size > 0 and electrified_cells:
+        tile = _get_electrified_tile(cell_size)
         for cell_x, cell_y in electrified_cells:
-            world_rect = pygame.Rect(
-                cell_x * cell_size,
-                cell_y * cell_size,
-                cell_size,
-                cell_size,
+            sr = apply_rect(
+                pygame.Rect(
+                    cell_x * cell_size,
+                    cell_y * cell_size,
+                    cell_size,
+                    cell_size,
+                )
             )
-            sr = apply_rect(world_rect)
             if sr.colliderect(screen_rect):
-                inner_rect = sr.inflate(-2, -2)
-                if inner_rect.width > 0 and inner_rect.height > 0:
-                    overlay = pygame.Surface(
-                        (inner_rect.width, inner_rect.height), pygame.SRCALPHA
-                    )
-                    overlay.fill(
-                        (
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[0],
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[1],
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[2],
-                            ELECTRIFIED_FLOOR_OVERLAY_ALPHA,
-                        )
-                    )
-                    screen.blit(overlay, inner_rect.topleft)
-                if sr.width > 0 and sr.height > 0:
-                    border_surface = pygame.Surface(
-                        (sr.width, sr.height), pygame.SRCALPHA
-                    )
-                    pygame.draw.rect(
-                        border_surface,
-                        (
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[0],
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[1],
-                            ELECTRIFIED_FLOOR_ACCENT_COLOR[2],
-                            ELECTRIFIED_FLOOR_BORDER_ALPHA,
-                        ),
-                        border_surface.get_rect(),
-                        width=1,
-                    )
-                    screen.blit(border_surface, sr.topleft)
+                screen.blit(tile, sr.topleft)
 
     return xs, ys, xe, ye, outside_cells
 
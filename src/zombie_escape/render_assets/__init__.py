@@ -2,46 +2,101 @@
 
 from __future__ import annotations
 
-from ..colors import EnvironmentPalette
-from ..render_constants import RenderAssets
-from .common import angle_bin_from_vector
-from .geometry import build_beveled_polygon
-from .characters import (
-    build_patrol_bot_directional_surfaces,
-    build_player_directional_surfaces,
-    build_survivor_directional_surfaces,
-    build_zombie_directional_surfaces,
-    build_zombie_dog_directional_surfaces,
-    draw_humanoid_hand,
-    draw_lightning_marker,
-    draw_lineformer_direction_arm,
-    draw_tracker_nose,
-)
-from .icons import get_character_icon, get_tile_icon
-from .items import (
-    build_empty_fuel_can_surface,
-    build_flashlight_surface,
-    build_fuel_can_surface,
-    build_fuel_station_surface,
-    build_shoes_surface,
-)
-from .vehicle import (
-    build_car_directional_surfaces,
-    build_car_surface,
-    paint_car_surface,
-    resolve_car_color,
-)
-from .walls import (
-    RUBBLE_ROTATION_DEG,
-    build_rubble_wall_surface,
-    paint_steel_beam_surface,
-    paint_wall_damage_overlay,
-    paint_wall_surface,
-    resolve_steel_beam_colors,
-    resolve_wall_colors,
-    resolve_wall_outline_color,
-    rubble_offset_for_size,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from ..colors import EnvironmentPalette
+    from ..render_constants import RenderAssets
+    from .common import angle_bin_from_vector
+    from .geometry import build_beveled_polygon
+    from .characters import (
+        build_patrol_bot_directional_surfaces,
+        build_player_directional_surfaces,
+        build_survivor_directional_surfaces,
+        build_zombie_directional_surfaces,
+        build_zombie_dog_directional_surfaces,
+        draw_humanoid_hand,
+        draw_lightning_marker,
+        draw_lineformer_direction_arm,
+        draw_tracker_nose,
+    )
+    from .icons import get_character_icon, get_tile_icon
+    from .items import (
+        build_empty_fuel_can_surface,
+        build_flashlight_surface,
+        build_fuel_can_surface,
+        build_fuel_station_surface,
+        build_shoes_surface,
+    )
+    from .vehicle import (
+        build_car_directional_surfaces,
+        build_car_surface,
+        paint_car_surface,
+        resolve_car_color,
+    )
+    from .walls import (
+        RUBBLE_ROTATION_DEG,
+        build_rubble_wall_surface,
+        paint_steel_beam_surface,
+        paint_wall_damage_overlay,
+        paint_wall_surface,
+        resolve_steel_beam_colors,
+        resolve_wall_colors,
+        resolve_wall_outline_color,
+        rubble_offset_for_size,
+    )
+
+# Builders are imported on first access; most callers only need one family.
+_LAZY_EXPORTS = {
+    "EnvironmentPalette": "..colors",
+    "RenderAssets": "..render_constants",
+    "angle_bin_from_vector": ".common",
+    "build_beveled_polygon": ".geometry",
+    "build_patrol_bot_directional_surfaces": ".characters",
+    "build_player_directional_surfaces": ".characters",
+    "build_survivor_directional_surfaces": ".characters",
+    "build_zombie_directional_surfaces": ".characters",
+    "build_zombie_dog_directional_surfaces": ".characters",
+    "draw_humanoid_hand": ".characters",
+    "draw_lightning_marker": ".characters",
+    "draw_lineformer_direction_arm": ".characters",
+    "draw_tracker_nose": ".characters",
+    "get_character_icon": ".icons",
+    "get_tile_icon": ".icons",
+    "build_empty_fuel_can_surface": ".items",
+    "build_flashlight_surface": ".items",
+    "build_fuel_can_surface": ".items",
+    "build_fuel_station_surface": ".items",
+    "build_shoes_surface": ".items",
+    "build_car_directional_surfaces": ".vehicle",
+    "build_car_surface": ".vehicle",
+    "paint_car_surface": ".vehicle",
+    "resolve_car_color": ".vehicle",
+    "RUBBLE_ROTATION_DEG": ".walls",
+    "build_rubble_wall_surface": ".walls",
+    "paint_steel_beam_surface": ".walls",
+    "paint_wall_damage_overlay": ".walls",
+    "paint_wall_surface": ".walls",
+    "resolve_steel_beam_colors": ".walls",
+    "resolve_wall_colors": ".walls",
+    "resolve_wall_outline_color": ".walls",
+    "rubble_offset_for_size": ".walls",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "angle_bin_from_vector",
@@ -0,0 +1,209 @@
+"""Persistent on-disk cache for procedurally built render assets."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+import pygame
+from platformdirs import user_cache_dir
+
+from ..config import APP_NAME
+
+try:
+    from ..__about__ import __version__
+except Exception:  # pragma: no cover - fallback version
+    __version__ = "0.0.0-unknown"
+
+# Layout: magic, uint32 index length, JSON index, then RGBA pixel blob.
+# The index records every surface as [width, height, blob offset].
+_ATLAS_MAGIC = b"ZEATLAS1"
+_ATLAS_FORMAT_VERSION = 1
+_ATLAS_INDEX_LENGTH = struct.Struct("<I")
+# Sources whose constants and drawing code feed the cached surfaces.
+_ATLAS_SOURCE_MODULES = ("render_assets", "render_constants.py", "colors.py")
+
+_ATLAS_BLOB: bytes = b""
+_ATLAS_INDEX: dict[str, list[list[int]]] | None = None
+_ATLAS_META: dict[str, Any] = {}
+_ATLAS_PENDING: dict[str, list[pygame.Surface]] = {}
+
+
+def _atlas_cache_dir() -> Path:
+    override = os.environ.get("ZOMBIE_ESCAPE_RENDER_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(user_cache_dir(APP_NAME, APP_NAME)) / "render_assets"
+
+
+def _atlas_path() -> Path:
+    return _atlas_cache_dir() / f"atlas.v{_ATLAS_FORMAT_VERSION}.bin"
+
+
+def _source_fingerprint() -> str:
+    """Hash the asset-building sources so local edits invalidate the atlas."""
+    digest = hashlib.sha1()
+    package_root = resources.files("zombie_escape")
+    for name in _ATLAS_SOURCE_MODULES:
+        target = package_root.joinpath(name)
+        if target.is_dir():
+            entries = sorted(
+                (entry for entry in target.iterdir() if entry.name.endswith(".py")),
+                key=lambda entry: entry.name,
+            )
+        else:
+            entries = [target]
+        for entry in entries:
+            digest.update(entry.name.encode("utf-8"))
+            digest.update(entry.read_bytes())
+    return digest.hexdigest()
+
+
+def _atlas_version() -> str:
+    return f"{__version__}:{_source_fingerprint()}"
+
+
+def _atlas_key(kind: str, key: tuple[Any, ...]) -> str:
+    return repr((kind, key))
+
+
+def load_render_asset_cache() -> bool:
+    """Read the atlas file in one pass; return True when it was usable.
+
+    Enables the cache even when the file is missing or stale, so surfaces
+    built afterwards are recorded for `save_render_asset_cache`. The cache
+    stays disabled when the package sources cannot be read to fingerprint.
+    """
+    global _ATLAS_BLOB, _ATLAS_INDEX, _ATLAS_META
+    _ATLAS_BLOB = b""
+    _ATLAS_INDEX = None
+    _ATLAS_META = {}
+    _ATLAS_PENDING.clear()
+    try:
+        version = _atlas_version()
+    except OSError:
+        return False
+    _ATLAS_INDEX = {}
+    _ATLAS_META = {"version": version}
+    try:
+        data = _atlas_path().read_bytes()
+    except OSError:
+        return False
+    try:
+        if not data.startswith(_ATLAS_MAGIC):
+            return False
+        header_end = len(_ATLAS_MAGIC) + _ATLAS_INDEX_LENGTH.size
+        (index_length,) = _ATLAS_INDEX_LENGTH.unpack(
+            data[len(_ATLAS_MAGIC) : header_end]
+        )
+        header = json.loads(data[header_end : header_end + index_length])
+        if header.get("version") != _ATLAS_META["version"]:
+            return False
+        index = header.get("entries", {})
+        if not isinstance(index, dict):
+            return False
+    except (struct.error, ValueError, UnicodeDecodeError):
+        return False
+    _ATLAS_BLOB = data[header_end + index_length :]
+    _ATLAS_INDEX = index
+    _ATLAS_META.update(header.get("meta", {}))
+    _apply_atlas_meta(_ATLAS_META)
+    return True
+
+
+def _apply_atlas_meta(meta: dict[str, Any]) -> None:
+    from .walls import _adopt_wall_damage_variant_seeds
+
+    seeds = meta.get("wall_damage_seeds")
+    if isinstance(seeds, list):
+        _adopt_wall_damage_variant_seeds(seeds)
+
+
+def cached_surfaces(kind: str, key: tuple[Any, ...]) -> list[pygame.Surface] | None:
+    """Return surfaces stored in the atlas for (kind, key), or None."""
+    if _ATLAS_INDEX is None:
+        return None
+    entry = _ATLAS_INDEX.get(_atlas_key(kind, key))
+    if entry is None:
+        return None
+    surfaces: list[pygame.Surface] = []
+    try:
+        for width, height, offset in entry:
+            size = width * height * 4
+            pixels = _ATLAS_BLOB[offset : offset + size]
+            if len(pixels) != size:
+                return None
+            surfaces.append(pygame.image.frombytes(pixels, (width, height), "RGBA"))
+    except (TypeError, ValueError, pygame.error):
+        return None
+    return surfaces
+
+
+def store_surfaces(
+    kind: str,
+    key: tuple[Any, ...],
+    surfaces: list[pygame.Surface] | tuple[pygame.Surface, ...],
+) -> None:
+    """Record freshly built surfaces so the next save persists them."""
+    if _ATLAS_INDEX is None:
+        return
+    atlas_key = _atlas_key(kind, key)
+    if atlas_key in _ATLAS_INDEX:
+        return
+    _ATLAS_PENDING[atlas_key] = list(surfaces)
+
+
+def save_render_asset_cache() -> Path | None:
+    """Write the atlas when new surfaces were built since the last load/save."""
+    global _ATLAS_BLOB, _ATLAS_INDEX
+    if _ATLAS_INDEX is None or not _ATLAS_PENDING:
+        return None
+    from .walls import _WALL_DAMAGE_VARIANT_SEEDS
+
+    blob = bytearray(_ATLAS_BLOB)
+    index = dict(_ATLAS_INDEX)
+    for atlas_key, surfaces in _ATLAS_PENDING.items():
+        records: list[list[int]] = []
+        for surface in surfaces:
+            width, height = surface.get_size()
+            records.append([width, height, len(blob)])
+            blob.extend(pygame.image.tobytes(surface, "RGBA"))
+        index[atlas_key] = records
+    meta = dict(_ATLAS_META)
+    meta.pop("version", None)
+    meta["wall_damage_seeds"] = list(_WALL_DAMAGE_VARIANT_SEEDS)
+    header = json.dumps(
+        {"version": _ATLAS_META["version"], "meta": meta, "entries": index},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    path = _atlas_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            fh.write(_ATLAS_MAGIC)
+            fh.write(_ATLAS_INDEX_LENGTH.pack(len(header)))
+            fh.write(header)
+            fh.write(blob)
+        tmp_path.replace(path)
+    except OSError as exc:
+        print(f"Failed to save render asset cache ({path}): {exc}")
+        return None
+    _ATLAS_BLOB = bytes(blob)
+    _ATLAS_INDEX = index
+    _ATLAS_PENDING.clear()
+    return path
+
+
+__all__ = [
+    "cached_surfaces",
+    "load_render_asset_cache",
+    "save_render_asset_cache",
+    "store_surfaces",
+]
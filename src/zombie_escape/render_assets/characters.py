@@ -19,6 +19,7 @@ from ..render_constants import (
     ZOMBIE_BODY_COLOR,
     ZOMBIE_OUTLINE_COLOR,
 )
+from .atlas_cache import cached_surfaces, store_surfaces
 from .common import ANGLE_STEP, brighten_color
 
 _PLAYER_UPSCALE_FACTOR = 4
@@ -31,6 +32,17 @@ _ZOMBIE_DOG_DIRECTIONAL_CACHE: dict[tuple[float, float, int], list[pygame.Surfac
 _PATROL_BOT_DIRECTIONAL_CACHE: dict[tuple[int, int], list[pygame.Surface]] = {}
 
 
+def _restore_directional_surfaces(
+    cache: dict, kind: str, cache_key: tuple, bins: int
+) -> list[pygame.Surface] | None:
+    """Fill an in-memory cache miss from the persisted render asset atlas."""
+    surfaces = cached_surfaces(kind, cache_key)
+    if surfaces is None or len(surfaces) != bins:
+        return None
+    cache[cache_key] = surfaces
+    return surfaces
+
+
 def _hand_defaults(radius: int) -> tuple[int, int]:
     hand_radius = max(1, int(radius * 0.5))
     hand_distance = max(hand_radius + 1, int(radius * 1.0))
@@ -143,6 +155,11 @@ def build_player_directional_surfaces(
     cache_key = (radius, bins)
     if cache_key in _PLAYER_DIRECTIONAL_CACHE:
         return _PLAYER_DIRECTIONAL_CACHE[cache_key]
+    restored = _restore_directional_surfaces(
+        _PLAYER_DIRECTIONAL_CACHE, "player", cache_key, bins
+    )
+    if restored is not None:
+        return restored
     surfaces = _build_humanoid_directional_surfaces(
         radius,
         base_color=BLUE,
@@ -151,6 +168,7 @@ def build_player_directional_surfaces(
         outline_color=HUMANOID_OUTLINE_COLOR,
     )
     _PLAYER_DIRECTIONAL_CACHE[cache_key] = surfaces
+    store_surfaces("player", cache_key, surfaces)
     return surfaces
 
 
@@ -262,6 +280,11 @@ def build_survivor_directional_surfaces(
     cache_key = (radius, is_buddy, draw_hands, bins)
     if cache_key in _SURVIVOR_DIRECTIONAL_CACHE:
         return _SURVIVOR_DIRECTIONAL_CACHE[cache_key]
+    restored = _restore_directional_surfaces(
+        _SURVIVOR_DIRECTIONAL_CACHE, "survivor", cache_key, bins
+    )
+    if restored is not None:
+        return restored
     fill_color = BUDDY_COLOR if is_buddy else SURVIVOR_COLOR
     surfaces = _build_humanoid_directional_surfaces(
         radius,
@@ -272,6 +295,7 @@ def build_survivor_directional_surfaces(
         outline_color=HUMANOID_OUTLINE_COLOR,
     )
     _SURVIVOR_DIRECTIONAL_CACHE[cache_key] = surfaces
+    store_surfaces("survivor", cache_key, surfaces)
     return surfaces
 
 
@@ -285,6 +309,11 @@ def build_zombie_directional_surfaces(
     cache_key = (radius, draw_hands, bins, is_trapped)
     if cache_key in _ZOMBIE_DIRECTIONAL_CACHE:
         return _ZOMBIE_DIRECTIONAL_CACHE[cache_key]
+    restored = _restore_directional_surfaces(
+        _ZOMBIE_DIRECTIONAL_CACHE, "zombie", cache_key, bins
+    )
+    if restored is not None:
+        return restored
 
     outline_color = TRAPPED_OUTLINE_COLOR if is_trapped else ZOMBIE_OUTLINE_COLOR
 
@@ -297,6 +326,7 @@ def build_zombie_directional_surfaces(
         outline_color=outline_color,
     )
     _ZOMBIE_DIRECTIONAL_CACHE[cache_key] = surfaces
+    store_surfaces("zombie", cache_key, surfaces)
     return surfaces
 
 
@@ -310,6 +340,11 @@ def build_zombie_dog_directional_surfaces(
     cache_key = (float(long_axis), float(short_axis), bins, is_trapped)
     if cache_key in _ZOMBIE_DOG_DIRECTIONAL_CACHE:
         return _ZOMBIE_DOG_DIRECTIONAL_CACHE[cache_key]
+    restored = _restore_directional_surfaces(
+        _ZOMBIE_DOG_DIRECTIONAL_CACHE, "zombie_dog", cache_key, bins
+    )
+    if restored is not None:
+        return restored
 
     outline_color = TRAPPED_OUTLINE_COLOR if is_trapped else ZOMBIE_OUTLINE_COLOR
     half_long = long_axis * 0.5
@@ -373,6 +408,7 @@ def build_zombie_dog_directional_surfaces(
         surfaces.append(surface)
 
     _ZOMBIE_DOG_DIRECTIONAL_CACHE[cache_key] = surfaces
+    store_surfaces("zombie_dog", cache_key, surfaces)
     return surfaces
 
 
@@ -414,6 +450,11 @@ def build_patrol_bot_directional_surfaces(
     cache_key = (int(size), round(float(arrow_scale), 3), marker_mode, bins)
     if cache_key in _PATROL_BOT_DIRECTIONAL_CACHE:
         return _PATROL_BOT_DIRECTIONAL_CACHE[cache_key]
+    restored = _restore_directional_surfaces(
+        _PATROL_BOT_DIRECTIONAL_CACHE, "patrol_bot", cache_key, bins
+    )
+    if restored is not None:
+        return restored
     base_surface = pygame.Surface((size, size), pygame.SRCALPHA)
     center = (size // 2, size // 2)
     radius = max(1, size // 2)
@@ -447,4 +488,5 @@ def build_patrol_bot_directional_surfaces(
             framed.blit(rotated_marker, rotated_marker.get_rect(center=(eye_x, eye_y)))
         surfaces.append(framed)
     _PATROL_BOT_DIRECTIONAL_CACHE[cache_key] = surfaces
+    store_surfaces("patrol_bot", cache_key, surfaces)
     return surfaces
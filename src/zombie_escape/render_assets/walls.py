@@ -7,6 +7,7 @@ import pygame
 
 from ..colors import STEEL_BEAM_COLOR, STEEL_BEAM_LINE_COLOR, EnvironmentPalette, get_environment_palette
 from ..entities_constants import INTERNAL_WALL_BEVEL_DEPTH
+from .atlas_cache import cached_surfaces, store_surfaces
 from .common import scale_color
 from .geometry import build_beveled_polygon
 from .rubble_relief_table import (
@@ -203,6 +204,20 @@ for _variant_seed in _WALL_DAMAGE_VARIANT_SEEDS:
     _shared_crack_strokes(_variant_seed)
 
 
+def _adopt_wall_damage_variant_seeds(seeds: list[int]) -> None:
+    """Reuse crack seeds from the persisted atlas so cached overlays still match."""
+    global _WALL_DAMAGE_VARIANT_SEEDS
+    if len(seeds) != _WALL_DAMAGE_VARIANT_COUNT:
+        return
+    resolved = tuple(int(seed) for seed in seeds)
+    if resolved == _WALL_DAMAGE_VARIANT_SEEDS:
+        return
+    _WALL_DAMAGE_VARIANT_SEEDS = resolved
+    _WALL_DAMAGE_OVERLAY_CACHE.clear()
+    for seed in resolved:
+        _shared_crack_strokes(seed)
+
+
 def _stroke_count_for_level(*, level: int, steps: int, total_strokes: int) -> int:
     if level <= 0 or steps <= 1 or total_strokes <= 0:
         return 0
@@ -224,6 +239,11 @@ def _get_wall_damage_overlays(
     cached = _WALL_DAMAGE_OVERLAY_CACHE.get(cache_key)
     if cached is not None:
         return cached
+    stored = cached_surfaces("wall_damage", cache_key)
+    if stored is not None and len(stored) == steps:
+        overlays = tuple(stored)
+        _WALL_DAMAGE_OVERLAY_CACHE[cache_key] = overlays
+        return overlays
 
     empty = pygame.Surface((width, height), pygame.SRCALPHA)
     shared_strokes = _shared_crack_strokes(seed)
@@ -279,6 +299,7 @@ def _get_wall_damage_overlays(
 
     overlays = tuple(built)
     _WALL_DAMAGE_OVERLAY_CACHE[cache_key] = overlays
+    store_surfaces("wall_damage", cache_key, overlays)
     return overlays
 
 
@@ -532,6 +553,10 @@ def build_rubble_wall_surface(
     cached = _RUBBLE_SURFACE_CACHE.get(cache_key)
     if cached is not None:
         return cached
+    stored = cached_surfaces("rubble", cache_key)
+    if stored:
+        _RUBBLE_SURFACE_CACHE[cache_key] = stored[0]
+        return stored[0]
 
     top_surface = pygame.Surface((base_size, base_size), pygame.SRCALPHA)
     outline_color = resolve_wall_outline_color(
@@ -600,6 +625,7 @@ def build_rubble_wall_surface(
     final_surface.blit(top_surface, top_rect.topleft)
 
     _RUBBLE_SURFACE_CACHE[cache_key] = final_surface
+    store_surfaces("rubble", cache_key, [final_surface])
     return final_surface
 
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import secrets
 from typing import MutableSequence, Sequence, TypeVar
 
+import numpy as np
+
 T = TypeVar("T")
 
 
@@ -14,7 +17,12 @@ def generate_seed() -> int:
 
 
 class _DeterministicRNG:
-    """Mersenne Twister MT19937 implementation for deterministic runs."""
+    """Mersenne Twister MT19937 implementation for deterministic runs.
+
+    Seeding follows the reference `init_genrand`; twisting and tempering run a
+    whole 624-word block at a time in NumPy's `MT19937` bit generator (the same
+    algorithm), and draws are served from the tempered block in `_buffer`.
+    """
 
     _N = 624
     _M = 397
@@ -23,7 +31,10 @@ class _DeterministicRNG:
     _LOWER_MASK = 0x7FFFFFFF
 
     def __init__(self, seed: int | None = None) -> None:
-        self._state = [0] * self._N
+        # Holds the current block's untempered words with its position at the
+        # end, so the next `random_raw(_N)` twists and tempers the next block.
+        self._bitgen = np.random.MT19937(0)
+        self._buffer: list[int] = []
         self._index = self._N
         self.__seed_value: int | None = None
         self._seed(seed)
@@ -40,19 +51,59 @@ class _DeterministicRNG:
         seed32 = normalized & 0xFFFFFFFF
         if seed32 == 0:
             seed32 = 5489  # default MT seed
-        self._state[0] = seed32
+        words = [0] * self._N
+        words[0] = seed32
         for i in range(1, self._N):
-            prev = self._state[i - 1]
-            self._state[i] = (1812433253 * (prev ^ (prev >> 30)) + i) & 0xFFFFFFFF
+            prev = words[i - 1]
+            words[i] = (1812433253 * (prev ^ (prev >> 30)) + i) & 0xFFFFFFFF
+        self._load_block(words, self._N)
+        self._buffer = []
         self._index = self._N
 
+    def _load_block(self, words: Sequence[int], pos: int) -> None:
+        self._bitgen.state = {
+            "bit_generator": "MT19937",
+            "state": {"key": np.asarray(words, dtype=np.uint32), "pos": pos},
+        }
+
     @property
     def _seed_value(self) -> int | None:
         return self.__seed_value
 
+    def getstate(self) -> tuple[tuple[int, ...], int, int | None]:
+        """Return a snapshot that `setstate` can restore exactly."""
+        words = self._bitgen.state["state"]["key"]
+        return tuple(words.tolist()), self._index, self.__seed_value
+
+    def setstate(self, state: tuple[Sequence[int], int, int | None]) -> None:
+        words, index, seed_value = state
+        if len(words) != self._N or not 0 <= int(index) <= self._N:
+            raise ValueError("Invalid MT19937 state")
+        self._load_block([int(word) & 0xFFFFFFFF for word in words], 0)
+        # Temper the restored block without twisting.
+        self._buffer = self._bitgen.random_raw(self._N).tolist()
+        self._index = int(index)
+        self.__seed_value = None if seed_value is None else int(seed_value)
+
+    def position(self) -> tuple[int, int]:
+        """Return a cheap progress fingerprint derived from `getstate()`.
+
+        Uses the block index and the untempered word before it, so a stream
+        restored with `setstate` reports the same value as the original.
+        """
+        index = self._index
+        if index == 0:
+            return 0, 0
+        return index, int(self._bitgen.state["state"]["key"][index - 1])
+
     def random(self) -> float:
         """Return a float in the range [0.0, 1.0)."""
-        return self._next() / 4294967296.0  # 2**32
+        index = self._index
+        if index >= self._N:
+            self._twist()
+            index = 0
+        self._index = index + 1
+        return self._buffer[index] / 4294967296.0  # 2**32
 
     def randint(self, a: int, b: int) -> int:
         if a > b:
@@ -82,48 +133,89 @@ class _DeterministicRNG:
         # Rejection sampling to avoid bias
         limit = (1 << 32) - ((1 << 32) % bound)
         while True:
-            value = self._next()
+            value = self._extract_number()
             if value < limit:
                 return value % bound
 
     def _extract_number(self) -> int:
-        if self._index >= self._N:
+        index = self._index
+        if index >= self._N:
             self._twist()
-        y = self._state[self._index]
-        self._index += 1
-        y ^= y >> 11
-        y ^= (y << 7) & 0x9D2C5680
-        y ^= (y << 15) & 0xEFC60000
-        y ^= y >> 18
-        return y & 0xFFFFFFFF
+            index = 0
+        self._index = index + 1
+        return self._buffer[index]
 
     def _twist(self) -> None:
-        for i in range(self._N):
-            x = (self._state[i] & self._UPPER_MASK) + (
-                self._state[(i + 1) % self._N] & self._LOWER_MASK
-            )
-            xA = x >> 1
-            if x & 1:
-                xA ^= self._MATRIX_A
-            self._state[i] = self._state[(i + self._M) % self._N] ^ xA
+        """Advance to the next block and temper all of it in one call."""
+        self._buffer = self._bitgen.random_raw(self._N).tolist()
         self._index = 0
 
 
+# Named substreams. "layout" is seeded with the run seed itself (so generated
+# levels match earlier builds); the others are derived from it, so a subsystem
+# drawing more or fewer numbers never shifts another subsystem's sequence.
+RNG_STREAMS = ("layout", "spawn", "ai", "fx")
+
 _GLOBAL_RNG = _DeterministicRNG()
+_STREAMS: dict[str, _DeterministicRNG] = {
+    name: _GLOBAL_RNG if name == "layout" else _DeterministicRNG(1)
+    for name in RNG_STREAMS
+}
+
 
+def _derive_seed(seed: int, stream: str) -> int:
+    digest = hashlib.blake2b(f"{stream}:{seed}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
 
-def get_rng() -> _DeterministicRNG:
-    return _GLOBAL_RNG
 
+def get_rng(stream: str = "layout") -> _DeterministicRNG:
+    """Return the shared generator for `stream` (see `RNG_STREAMS`)."""
+    try:
+        return _STREAMS[stream]
+    except KeyError:
+        raise ValueError(f"Unknown RNG stream: {stream}") from None
 
-def seed_rng(seed: int | None) -> int:
+
+def seed_rng(seed: int | None, *, stream: str | None = None) -> int:
+    """Seed every stream from `seed`, or only `stream`; return the applied seed."""
+    if stream is not None:
+        rng = get_rng(stream)
+        rng._seed(seed)
+        assert rng._seed_value is not None
+        return rng._seed_value
     _GLOBAL_RNG._seed(seed)
-    assert _GLOBAL_RNG._seed_value is not None
-    return _GLOBAL_RNG._seed_value
+    applied = _GLOBAL_RNG._seed_value
+    assert applied is not None
+    for name, rng in _STREAMS.items():
+        if rng is not _GLOBAL_RNG:
+            rng._seed(_derive_seed(applied, name))
+    return applied
+
+
+def get_rng_states() -> dict[str, tuple[tuple[int, ...], int, int | None]]:
+    """Return a checkpoint of every stream, keyed by stream name."""
+    return {name: rng.getstate() for name, rng in _STREAMS.items()}
+
+
+def get_rng_positions() -> dict[str, tuple[int, int]]:
+    """Return `position()` of every stream without copying the full state."""
+    return {name: rng.position() for name, rng in _STREAMS.items()}
+
+
+def set_rng_states(
+    states: dict[str, tuple[Sequence[int], int, int | None]],
+) -> None:
+    """Restore streams from `get_rng_states`; streams not listed are untouched."""
+    for name, state in states.items():
+        get_rng(name).setstate(state)
 
 
 __all__ = [
+    "RNG_STREAMS",
     "generate_seed",
     "get_rng",
+    "get_rng_positions",
+    "get_rng_states",
     "seed_rng",
+    "set_rng_states",
 ]
@@ -43,6 +43,7 @@ class ScreenTransition:
 
 
 __all__ = [
+    "MAX_SEED_DIGITS",
     "ScreenID",
     "ScreenTransition",
     "TITLE_HEADER_Y",
@@ -51,3 +52,4 @@ __all__ = [
 
 TITLE_HEADER_Y = 20
 TITLE_SECTION_TOP = 45
+MAX_SEED_DIGITS = 19
@@ -12,6 +12,7 @@ from ..colors import LIGHT_GRAY, RED, WHITE, YELLOW
 from ..font_utils import load_font, render_text_surface
 from ..gameplay_constants import (
     CAR_HINT_DELAY_MS_DEFAULT,
+    SIMULATION_MAX_STEPS_PER_FRAME,
     SURVIVAL_TIME_ACCEL_SUBSTEPS,
     SURVIVAL_TIME_ACCEL_MAX_SUBSTEP,
     SURVIVAL_TIME_ACCEL_RAMP_MS,
@@ -19,6 +20,7 @@ from ..gameplay_constants import (
 from ..gameplay import (
     MapGenerationError,
     apply_passenger_speed_penalty,
+    bake_ambient_wall_palettes,
     check_interactions,
     cleanup_survivor_messages,
     generate_level_from_blueprint,
@@ -31,6 +33,7 @@ from ..gameplay import (
     place_fuel_can,
     place_fuel_station,
     place_shoes,
+    prepare_ambient_wall_palettes,
     process_player_input,
     setup_player_and_cars,
     spawn_initial_patrol_bots,
@@ -43,6 +46,7 @@ from ..gameplay import (
     update_footprints,
     update_endurance_timer,
 )
+from ..gameplay.digest import StateDigestRecorder
 from ..gameplay.state import frames_to_ms, ms_to_frames
 from ..gameplay.constants import (
     INTRO_MESSAGE_DISPLAY_FRAMES,
@@ -70,6 +74,8 @@ from ..render import (
 )
 from ..render.fog import get_shared_fog_cache, load_shared_fog_cache_from_files
 from ..render.hud import build_time_accel_text
+from ..render.interpolation import RenderInterpolator
+from ..render_assets.atlas_cache import save_render_asset_cache
 from ..render_constants import (
     GAMEPLAY_FONT_SIZE,
     TIMED_MESSAGE_LEFT_X,
@@ -334,6 +340,8 @@ class GameplayScreenRunner:
         show_fps: bool = False,
         profiler: object | None = None,
         profiler_output: Path | None = None,
+        digest_interval: int = 0,
+        digest_output: Path | None = None,
     ) -> None:
         self.screen = screen
         self.clock = clock
@@ -347,6 +355,10 @@ class GameplayScreenRunner:
         self.show_fps = show_fps
         self.profiler = profiler
         self.profiler_output = profiler_output
+        self.digest_interval = digest_interval
+        self.digest_output = digest_output
+        self.digest_recorder: StateDigestRecorder | None = None
+        self.digest_path: Path | None = None
 
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
@@ -373,11 +385,22 @@ class GameplayScreenRunner:
         )
         self.time_accel_hold_ms = 0.0
         self.time_accel_step_carry = 0.0
+        self.sim_step_ms = 1000.0 / max(1, int(fps))
+        self.sim_accumulator_ms = 0.0
+        self.sim_step_index = 0
+        self.render_alpha = 1.0
+        self.render_interpolator = RenderInterpolator()
 
         self.game_data: Any = None
         self.overview_surface: surface.Surface | None = None
 
     def run(self) -> ScreenTransition:
+        try:
+            return self._run_loop()
+        finally:
+            self._close_digest_log()
+
+    def _run_loop(self) -> ScreenTransition:
         transition = self._setup_game()
         if transition is not None:
             return transition
@@ -391,7 +414,6 @@ class GameplayScreenRunner:
                 if self.use_busy_loop
                 else self.clock.tick(self.fps)
             )
-            dt = frame_ms / 1000.0
             current_fps = self.clock.get_fps()
 
             if self._is_game_finished(frame_ms, current_fps):
@@ -414,7 +436,7 @@ class GameplayScreenRunner:
                 continue
             self._set_mouse_hidden(read_mouse_state().focused)
 
-            self._update_world(dt, input_snapshot)
+            self._step_simulation(frame_ms, input_snapshot)
             if self.debug_overview:
                 draw_debug_overview(
                     self.render_assets,
@@ -429,6 +451,8 @@ class GameplayScreenRunner:
                 continue
 
             self._draw_game_frame(current_fps)
+            # Prebake other ambient palettes so a switch does not repaint walls.
+            bake_ambient_wall_palettes(self.game_data)
 
     def _setup_game(self) -> ScreenTransition | None:
         seed_value = self.seed if self.seed is not None else generate_seed()
@@ -492,6 +516,7 @@ class GameplayScreenRunner:
             return self._finalize(ScreenTransition(ScreenID.TITLE))
 
         sync_ambient_palette_with_flashlights(self.game_data, force=True)
+        prepare_ambient_wall_palettes(self.game_data)
         initial_waiting = max(0, self.stage.waiting_car_target_count)
         player, waiting_cars = setup_player_and_cars(
             self.game_data, layout_data, car_count=initial_waiting
@@ -519,8 +544,10 @@ class GameplayScreenRunner:
             self.game_data.spiky_plants[cell] = spiky_plant
 
         update_footprints(self.game_data, self.config)
+        self._open_digest_log()
         level_rect = self.game_data.layout.field_rect
         self.overview_surface = pygame.Surface((level_rect.width, level_rect.height))
+        save_render_asset_cache()
         return None
 
     def _handle_runtime_events(self) -> tuple[ScreenTransition | None, Any]:
@@ -677,7 +704,64 @@ class GameplayScreenRunner:
         self.pause_mouse_ui_guard.end_frame()
         return None, snapshot
 
+    def _next_step_ms(self) -> int:
+        """Return the integer length of the next fixed tick.
+
+        Tick lengths alternate (e.g. 17/17/16 at 60 FPS) so the game clock
+        tracks the exact fixed rate without drifting.
+        """
+        index = self.sim_step_index
+        self.sim_step_index += 1
+        return int(round((index + 1) * self.sim_step_ms)) - int(
+            round(index * self.sim_step_ms)
+        )
+
+    def _step_simulation(self, frame_ms: int, input_snapshot: Any) -> None:
+        """Advance the world in fixed ticks for the elapsed frame time."""
+        assert self.game_data is not None
+        max_backlog_ms = self.sim_step_ms * SIMULATION_MAX_STEPS_PER_FRAME
+        self.sim_accumulator_ms = min(
+            max_backlog_ms, self.sim_accumulator_ms + max(0, frame_ms)
+        )
+        steps = int(self.sim_accumulator_ms // self.sim_step_ms)
+        self.sim_accumulator_ms -= steps * self.sim_step_ms
+        state = self.game_data.state
+        for step in range(steps):
+            if step == steps - 1:
+                self.render_interpolator.capture(
+                    self._collect_mobile_entities(), self.game_data.camera
+                )
+            self._update_world(self._next_step_ms() / 1000.0, input_snapshot)
+            if self.digest_recorder is not None:
+                self.digest_recorder.record(self.sim_step_index, self.game_data)
+            if state.game_over or state.game_won:
+                self.sim_accumulator_ms = 0.0
+                break
+        self.render_alpha = self.sim_accumulator_ms / self.sim_step_ms
+
+    def _collect_mobile_entities(self) -> list[pygame.sprite.Sprite]:
+        assert self.game_data is not None
+        game_data = self.game_data
+        groups = game_data.groups
+        mobile_entities: list[pygame.sprite.Sprite] = []
+        player_ref = game_data.player
+        if player_ref is not None and player_ref.alive():
+            mobile_entities.append(player_ref)
+        car_ref = game_data.car
+        if car_ref and car_ref.alive():
+            mobile_entities.append(car_ref)
+        mobile_entities.extend(
+            [zombie for zombie in groups.zombie_group if zombie.alive()]
+        )
+        mobile_entities.extend(
+            [survivor for survivor in groups.survivor_group if survivor.alive()]
+        )
+        mobile_entities.extend([bot for bot in groups.patrol_bot_group if bot.alive()])
+        mobile_entities.extend([bot for bot in groups.carrier_bot_group if bot.alive()])
+        return mobile_entities
+
     def _update_world(self, dt: float, input_snapshot: Any) -> None:
+        """Run one fixed simulation tick of `dt` seconds."""
         assert self.game_data is not None
         game_data = self.game_data
         state = game_data.state
@@ -767,21 +851,22 @@ class GameplayScreenRunner:
         player_ref = game_data.player
         if player_ref is None:
             return
-        mobile_entities: list[pygame.sprite.Sprite] = []
-        if player_ref.alive():
-            mobile_entities.append(player_ref)
         car_ref = game_data.car
-        if car_ref and car_ref.alive():
-            mobile_entities.append(car_ref)
-        mobile_entities.extend(
-            [zombie for zombie in groups.zombie_group if zombie.alive()]
-        )
-        mobile_entities.extend(
-            [survivor for survivor in groups.survivor_group if survivor.alive()]
+        state.spatial_index.rebuild(self._collect_mobile_entities())
+        mounted_vehicle = player_ref.mounted_vehicle
+        if mounted_vehicle is not None and mounted_vehicle.alive():
+            fov_target = mounted_vehicle
+        elif player_ref.in_car and car_ref and car_ref.alive():
+            # Legacy fallback while call sites migrate from `in_car`.
+            fov_target = car_ref
+        else:
+            fov_target = player_ref
+        state.visibility.rebuild(
+            state.spatial_index,
+            camera=game_data.camera,
+            fov_target=fov_target,
+            flashlight_count=state.flashlight_count,
         )
-        mobile_entities.extend([bot for bot in groups.patrol_bot_group if bot.alive()])
-        mobile_entities.extend([bot for bot in groups.carrier_bot_group if bot.alive()])
-        state.spatial_index.rebuild(mobile_entities)
 
     def _draw_game_frame(self, current_fps: float) -> None:
         assert self.game_data is not None
@@ -802,17 +887,23 @@ class GameplayScreenRunner:
             enabled=contact_hint_enabled,
         )
 
-        draw(
-            self.render_assets,
-            self.screen,
-            game_data,
-            config=self.config,
-            hint_target=hint_target,
-            contact_hint_targets=contact_hint_targets,
-            hint_color=hint_color,
-            fps=current_fps,
-        )
-        self._draw_player_time_accel_indicator()
+        with self.render_interpolator.applied(
+            self._collect_mobile_entities(),
+            game_data.camera,
+            alpha=self.render_alpha,
+            snap_distance=game_data.cell_size,
+        ):
+            draw(
+                self.render_assets,
+                self.screen,
+                game_data,
+                config=self.config,
+                hint_target=hint_target,
+                contact_hint_targets=contact_hint_targets,
+                hint_color=hint_color,
+                fps=current_fps,
+            )
+            self._draw_player_time_accel_indicator()
         self._draw_pause_hotspot_hint()
         self._draw_mouse_steering_overlay()
         if self.profiling_active:
@@ -1298,6 +1389,32 @@ class GameplayScreenRunner:
             stats.print_stats(50)
         print(f"Profile saved to {output_path} and {summary_path}")
 
+    def _open_digest_log(self) -> None:
+        if self.digest_interval <= 0 or self.digest_output is None:
+            return
+        self._close_digest_log()
+        # One log per stage and seed, so playing several stages in a session
+        # keeps each run instead of overwriting the previous one.
+        seed = self.game_data.state.seed
+        output = self.digest_output
+        self.digest_path = output.with_name(
+            f"{output.stem}.{self.stage.id}.{seed}{output.suffix}"
+        )
+        stream = self.digest_path.open("w", encoding="utf-8")
+        self.digest_recorder = StateDigestRecorder(
+            stream, interval=self.digest_interval
+        )
+        self.digest_recorder.write_header(
+            stage=self.stage.id, seed=seed, interval=self.digest_interval
+        )
+
+    def _close_digest_log(self) -> None:
+        if self.digest_recorder is None:
+            return
+        self.digest_recorder.stream.close()
+        self.digest_recorder = None
+        print(f"State digests saved to {self.digest_path}")
+
     def _set_mouse_hidden(self, hidden: bool) -> None:
         if self.mouse_hidden == hidden:
             return
@@ -1325,6 +1442,8 @@ def gameplay_screen(
     show_fps: bool = False,
     profiler: "object | None" = None,
     profiler_output: Path | None = None,
+    digest_interval: int = 0,
+    digest_output: Path | None = None,
 ) -> ScreenTransition:
     runner = GameplayScreenRunner(
         screen=screen,
@@ -1339,5 +1458,7 @@ def gameplay_screen(
         show_fps=show_fps,
         profiler=profiler,
         profiler_output=profiler_output,
+        digest_interval=digest_interval,
+        digest_output=digest_output,
     )
     return runner.run()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import webbrowser
-from typing import Any, Sequence
+from typing import Any
 
 import pygame
 from pygame import surface, time
@@ -19,6 +19,7 @@ from ..render_assets import (
     get_tile_icon,
 )
 from ..rng import generate_seed
+from ..stage_registry import StageRegistry
 from ..input_utils import (
     ClickTarget,
     ClickableMap,
@@ -29,6 +30,7 @@ from ..input_utils import (
     read_mouse_state,
 )
 from ..screens import (
+    MAX_SEED_DIGITS,
     ScreenID,
     ScreenTransition,
     TITLE_HEADER_Y,
@@ -47,7 +49,6 @@ try:  # pragma: no cover - version fallback not critical for tests
 except Exception:  # pragma: no cover - fallback version
     __version__ = "0.0.0-unknown"
 
-MAX_SEED_DIGITS = 19
 _README_URLS: dict[str, str] = {
     "en": "https://github.com/tos-kamiya/zombie-escape/blob/main/README.md",
     "ja": "https://github.com/tos-kamiya/zombie-escape/blob/main/README-ja_JP.md",
@@ -98,13 +99,14 @@ class TitleScreenController:
         clock: time.Clock,
         config: dict[str, Any],
         fps: int,
-        stages: Sequence[Stage],
+        stages: StageRegistry,
         default_stage_id: str,
         screen_size: tuple[int, int],
         seed_text: str | None,
         seed_is_auto: bool,
     ) -> None:
         self.screen = screen
+        self.stages = stages
         self.clock = clock
         self.config = config
         self.fps = fps
@@ -116,10 +118,10 @@ class TitleScreenController:
         self.width = width
         self.height = height
 
+        # Options carry stage ids; a Stage is built only once its page is shown.
         self.stage_options_all: list[dict[str, Any]] = [
-            {"type": "stage", "stage": stage, "available": stage.available}
-            for stage in stages
-            if stage.available
+            {"type": "stage", "stage_id": stage_id, "available": True}
+            for stage_id in stages.ids(available_only=True)
         ]
         self.first_page_size = 5
         self.other_page_size = 10
@@ -152,7 +154,7 @@ class TitleScreenController:
         self.current_page = 0
         if self.stage_options_all:
             for idx, opt in enumerate(self.stage_options_all):
-                if opt["stage"].id == self.default_stage_id:
+                if opt["stage_id"] == self.default_stage_id:
                     target_page = self._page_index_for_stage(idx)
                     if self._page_available(target_page):
                         self.current_page = target_page
@@ -163,7 +165,7 @@ class TitleScreenController:
             (
                 i
                 for i, opt in enumerate(self.options)
-                if opt["type"] == "stage" and opt["stage"].id == self.default_stage_id
+                if opt["type"] == "stage" and opt["stage_id"] == self.default_stage_id
             ),
             0,
         )
@@ -184,6 +186,9 @@ class TitleScreenController:
         pygame.event.clear([pygame.KEYDOWN])
         self.confirm_armed_at = pygame.time.get_ticks() + 300
 
+    def _option_stage(self, option: dict[str, Any]) -> Stage:
+        return self.stages.get(option["stage_id"])
+
     def _create_lettered_zombie(self, letter: str) -> pygame.Surface:
         surf = get_character_icon("zombie", self.icon_radius).copy()
         if not letter:
@@ -356,7 +361,7 @@ class TitleScreenController:
             return False
         prev_page_index = page_index - 1
         clears_on_prev_page = sum(
-            self.stage_progress.get(option["stage"].id, 0) > 0
+            self.stage_progress.get(option["stage_id"], 0) > 0
             for option in self.stage_pages[prev_page_index]
         )
         required_clears = min(5, len(self.stage_pages[prev_page_index]))
@@ -404,7 +409,7 @@ class TitleScreenController:
             seed_value = int(self.current_seed_text) if self.current_seed_text else None
             return ScreenTransition(
                 ScreenID.GAMEPLAY,
-                stage=current["stage"],
+                stage=self._option_stage(current),
                 seed=seed_value,
                 seed_text=self.current_seed_text,
                 seed_is_auto=self.current_seed_auto,
@@ -609,14 +614,14 @@ class TitleScreenController:
                     list_column_x, row_top - 2, full_content_width, row_height
                 )
                 option_targets.append(ClickTarget(idx, highlight_rect.copy()))
-                cleared = self.stage_progress.get(option["stage"].id, 0) > 0
+                cleared = self.stage_progress.get(option["stage_id"], 0) > 0
                 base_color = WHITE if cleared else _UNCLEARED_STAGE_COLOR
                 color = base_color
                 is_selected = idx == self.selected
                 if is_selected:
                     pygame.draw.rect(self.screen, highlight_color, highlight_rect)
                     selected_stage_highlight_rect = highlight_rect.copy()
-                label = option["stage"].name
+                label = self._option_stage(option).name
                 if not option.get("available"):
                     locked_suffix = tr("menu.locked_suffix")
                     label = f"{label} {locked_suffix}"
@@ -642,7 +647,7 @@ class TitleScreenController:
                 )
                 if cleared and option.get("available"):
                     label_width, _, _ = _measure_text(label, stage_option_font, 10_000)
-                    icons = self._get_stage_icons(option["stage"])
+                    icons = self._get_stage_icons(self._option_stage(option))
                     icon_x = list_column_x + 8 + label_width + 6
                     icon_y_center = row_top + row_height // 2
                     icon_bounds: pygame.Rect | None = None
@@ -718,11 +723,10 @@ class TitleScreenController:
                 desc_size = font_settings.scaled_size(11)
                 desc_font = _get_font(desc_size)
                 desc_color = WHITE if current.get("available") else GRAY
-                desc_lines = wrap_text(
-                    current["stage"].description, desc_font, info_column_width
-                )
+                description = self._option_stage(current).description
+                desc_lines = wrap_text(description, desc_font, info_column_width)
                 _, _, desc_line_height = _measure_text(
-                    current["stage"].description, desc_font, info_column_width
+                    description, desc_font, info_column_width
                 )
                 desc_height = max(1, len(desc_lines)) * desc_line_height
                 if selected_stage_highlight_rect is not None:
@@ -755,7 +759,7 @@ class TitleScreenController:
                 self.screen.blit(desc_panel, desc_panel_rect.topleft)
                 blit_text_wrapped(
                     self.screen,
-                    current["stage"].description,
+                    description,
                     desc_font,
                     desc_color,
                     (info_column_x, desc_area_top),
@@ -1022,7 +1026,7 @@ def title_screen(
     config: dict[str, Any],
     fps: int,
     *,
-    stages: Sequence[Stage],
+    stages: StageRegistry,
     default_stage_id: str,
     screen_size: tuple[int, int],
     seed_text: str | None = None,
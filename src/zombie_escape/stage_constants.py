@@ -6,6 +6,7 @@ from .entities_constants import ZOMBIE_DECAY_DURATION_FRAMES
 from .gameplay_constants import SURVIVOR_SPAWN_RATE
 from .level_constants import DEFAULT_GRID_COLS, DEFAULT_GRID_ROWS
 from .models import FuelMode, Stage
+from .stage_registry import StageRegistry
 
 
 def _build_stage18_reinforced_wall_zones(
@@ -362,8 +363,13 @@ def _build_stage40_fall_spawn_zones(
     return zones
 
 
-STAGES: list[Stage] = [
-    Stage(
+# Stages are built (and validated) the first time they are looked up.
+STAGES = StageRegistry()
+
+
+@STAGES.register("stage1")
+def _stage1() -> Stage:
+    return Stage(
         id="stage1",
         name_key="stages.stage1.name",
         description_key="stages.stage1.description",
@@ -371,8 +377,12 @@ STAGES: list[Stage] = [
         exterior_spawn_weight=0.97,
         interior_spawn_weight=0.03,
         zombie_normal_ratio=1.0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage2")
+def _stage2() -> Stage:
+    return Stage(
         id="stage2",
         name_key="stages.stage2.name",
         description_key="stages.stage2.description",
@@ -382,8 +392,12 @@ STAGES: list[Stage] = [
         exterior_spawn_weight=0.97,
         interior_spawn_weight=0.03,
         zombie_normal_ratio=1.0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage3")
+def _stage3() -> Stage:
+    return Stage(
         id="stage3",
         name_key="stages.stage3.name",
         description_key="stages.stage3.description",
@@ -394,8 +408,12 @@ STAGES: list[Stage] = [
         exterior_spawn_weight=0.97,
         interior_spawn_weight=0.03,
         zombie_normal_ratio=1.0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage4")
+def _stage4() -> Stage:
+    return Stage(
         id="stage4",
         name_key="stages.stage4.name",
         description_key="stages.stage4.description",
@@ -405,8 +423,12 @@ STAGES: list[Stage] = [
         initial_interior_spawn_rate=0.007,
         zombie_normal_ratio=1.0,
         survivor_spawn_rate=SURVIVOR_SPAWN_RATE,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage5")
+def _stage5() -> Stage:
+    return Stage(
         id="stage5",
         name_key="stages.stage5.name",
         description_key="stages.stage5.description",
@@ -420,8 +442,12 @@ STAGES: list[Stage] = [
         exterior_spawn_weight=0.15,
         interior_spawn_weight=0.85,
         zombie_normal_ratio=1.0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage6")
+def _stage6() -> Stage:
+    return Stage(
         id="stage6",
         name_key="stages.stage6.name",
         description_key="stages.stage6.description",
@@ -433,8 +459,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.6,
         zombie_normal_ratio=0.4,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage7")
+def _stage7() -> Stage:
+    return Stage(
         id="stage7",
         name_key="stages.stage7.name",
         description_key="stages.stage7.description",
@@ -449,8 +479,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.3,
         zombie_normal_ratio=0.4,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage8")
+def _stage8() -> Stage:
+    return Stage(
         id="stage8",
         name_key="stages.stage8.name",
         description_key="stages.stage8.description",
@@ -465,8 +499,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.7,
         zombie_normal_ratio=0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage9")
+def _stage9() -> Stage:
+    return Stage(
         id="stage9",
         name_key="stages.stage9.name",
         description_key="stages.stage9.description",
@@ -483,8 +521,12 @@ STAGES: list[Stage] = [
         zombie_normal_ratio=0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
         survivor_spawn_rate=SURVIVOR_SPAWN_RATE,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage10")
+def _stage10() -> Stage:
+    return Stage(
         id="stage10",
         name_key="stages.stage10.name",
         description_key="stages.stage10.description",
@@ -502,8 +544,12 @@ STAGES: list[Stage] = [
         zombie_normal_ratio=0.4,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
         survivor_spawn_rate=0.35,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage11")
+def _stage11() -> Stage:
+    return Stage(
         id="stage11",
         name_key="stages.stage11.name",
         description_key="stages.stage11.description",
@@ -519,8 +565,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.5,
         zombie_normal_ratio=0.5,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage12")
+def _stage12() -> Stage:
+    return Stage(
         id="stage12",
         name_key="stages.stage12.name",
         description_key="stages.stage12.description",
@@ -541,8 +591,12 @@ STAGES: list[Stage] = [
         interior_fall_spawn_weight=0.3,
         zombie_normal_ratio=1.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage13")
+def _stage13() -> Stage:
+    return Stage(
         id="stage13",
         name_key="stages.stage13.name",
         description_key="stages.stage13.description",
@@ -566,8 +620,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.3,
         zombie_normal_ratio=0.4,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage14")
+def _stage14() -> Stage:
+    return Stage(
         id="stage14",
         name_key="stages.stage14.name",
         description_key="stages.stage14.description",
@@ -584,8 +642,12 @@ STAGES: list[Stage] = [
         interior_fall_spawn_weight=0.7,
         zombie_normal_ratio=1.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage15")
+def _stage15() -> Stage:
+    return Stage(
         id="stage15",
         name_key="stages.stage15.name",
         description_key="stages.stage15.description",
@@ -609,8 +671,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.5,
         zombie_normal_ratio=0.5,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage16")
+def _stage16() -> Stage:
+    return Stage(
         id="stage16",
         name_key="stages.stage16.name",
         description_key="stages.stage16.description",
@@ -628,8 +694,12 @@ STAGES: list[Stage] = [
         interior_spawn_weight=0.3,
         zombie_normal_ratio=1.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage17")
+def _stage17() -> Stage:
+    return Stage(
         id="stage17",
         name_key="stages.stage17.name",
         description_key="stages.stage17.description",
@@ -647,8 +717,12 @@ STAGES: list[Stage] = [
         interior_spawn_weight=0.5,
         zombie_tracker_ratio=1.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage18")
+def _stage18() -> Stage:
+    return Stage(
         id="stage18",
         name_key="stages.stage18.name",
         description_key="stages.stage18.description",
@@ -679,8 +753,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.5,
         zombie_normal_ratio=0.5,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage19")
+def _stage19() -> Stage:
+    return Stage(
         id="stage19",
         name_key="stages.stage19.name",
         description_key="stages.stage19.description",
@@ -701,8 +779,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.5,
         zombie_normal_ratio=0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage20")
+def _stage20() -> Stage:
+    return Stage(
         id="stage20",
         name_key="stages.stage20.name",
         description_key="stages.stage20.description",
@@ -728,8 +810,12 @@ STAGES: list[Stage] = [
         zombie_wall_hugging_ratio=0.4,
         zombie_normal_ratio=0.2,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage21")
+def _stage21() -> Stage:
+    return Stage(
         id="stage21",
         name_key="stages.stage21.name",
         description_key="stages.stage21.description",
@@ -748,8 +834,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.0,
         zombie_wall_hugging_ratio=0.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage22")
+def _stage22() -> Stage:
+    return Stage(
         id="stage22",
         name_key="stages.stage22.name",
         description_key="stages.stage22.description",
@@ -766,8 +856,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.0,
         zombie_wall_hugging_ratio=0.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage23")
+def _stage23() -> Stage:
+    return Stage(
         id="stage23",
         name_key="stages.stage23.name",
         description_key="stages.stage23.description",
@@ -784,8 +878,12 @@ STAGES: list[Stage] = [
         zombie_tracker_ratio=0.0,
         zombie_wall_hugging_ratio=0.0,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage24")
+def _stage24() -> Stage:
+    return Stage(
         id="stage24",
         name_key="stages.stage24.name",
         description_key="stages.stage24.description",
@@ -811,8 +909,12 @@ STAGES: list[Stage] = [
             "up": [(6, 6, 1, 12)],
         },
         zombie_decay_duration_frames=int(ZOMBIE_DECAY_DURATION_FRAMES * 1.5),
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage25")
+def _stage25() -> Stage:
+    return Stage(
         id="stage25",
         name_key="stages.stage25.name",
         description_key="stages.stage25.description",
@@ -892,8 +994,12 @@ STAGES: list[Stage] = [
         buddy_required_count=1,
         survivor_spawn_rate=0.07,
         exit_sides=["top", "bottom"],
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage26")
+def _stage26() -> Stage:
+    return Stage(
         id="stage26",
         name_key="stages.stage26.name",
         description_key="stages.stage26.description",
@@ -970,8 +1076,12 @@ STAGES: list[Stage] = [
             (23, 4, 2, 2),
             (26, 4, 2, 2),
         ],
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage27")
+def _stage27() -> Stage:
+    return Stage(
         id="stage27",
         name_key="stages.stage27.name",
         description_key="stages.stage27.description",
@@ -995,8 +1105,12 @@ STAGES: list[Stage] = [
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 3,
         zombie_spawn_count_per_interval=4,
         survivor_spawn_rate=0.02,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage28")
+def _stage28() -> Stage:
+    return Stage(
         id="stage28",
         name_key="stages.stage28.name",
         description_key="stages.stage28.description",
@@ -1051,8 +1165,12 @@ STAGES: list[Stage] = [
         puddle_density=0.05,
         exit_sides=["top", "bottom"],
         spiky_plant_density=0.04,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage29")
+def _stage29() -> Stage:
+    return Stage(
         id="stage29",
         name_key="stages.stage29.name",
         description_key="stages.stage29.description",
@@ -1168,8 +1286,12 @@ STAGES: list[Stage] = [
         ],
         puddle_density=0.05,
         wall_rubble_ratio=0.3,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage30")
+def _stage30() -> Stage:
+    return Stage(
         id="stage30",
         name_key="stages.stage30.name",
         description_key="stages.stage30.description",
@@ -1195,8 +1317,12 @@ STAGES: list[Stage] = [
         endurance_goal_ms=900_000,
         fuel_spawn_count=0,
         survivor_spawn_rate=0.05,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage31")
+def _stage31() -> Stage:
+    return Stage(
         id="stage31",
         name_key="stages.stage31.name",
         description_key="stages.stage31.description",
@@ -1218,8 +1344,12 @@ STAGES: list[Stage] = [
         zombie_nimble_dog_ratio=0.7,
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 2,
         patrol_bot_spawn_rate=0.02,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage32")
+def _stage32() -> Stage:
+    return Stage(
         id="stage32",
         name_key="stages.stage32.name",
         description_key="stages.stage32.description",
@@ -1247,8 +1377,12 @@ STAGES: list[Stage] = [
             (3, 41, 14, 1),
         ],
         exit_sides=["top", "bottom"],
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage33")
+def _stage33() -> Stage:
+    return Stage(
         id="stage33",
         name_key="stages.stage33.name",
         description_key="stages.stage33.description",
@@ -1372,8 +1506,12 @@ STAGES: list[Stage] = [
         ],
         exit_sides=["top", "bottom"],
         zombie_decay_duration_frames=ZOMBIE_DECAY_DURATION_FRAMES * 3,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage34")
+def _stage34() -> Stage:
+    return Stage(
         id="stage34",
         name_key="stages.stage34.name",
         description_key="stages.stage34.description",
@@ -1399,8 +1537,12 @@ STAGES: list[Stage] = [
         reinforced_wall_density=0.18,
         fire_floor_density=0.18,
         patrol_bot_spawn_rate=0.02,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage35")
+def _stage35() -> Stage:
+    return Stage(
         id="stage35",
         name_key="stages.stage35.name",
         description_key="stages.stage35.description",
@@ -1455,8 +1597,12 @@ STAGES: list[Stage] = [
         zombie_spawn_count_per_interval=3,
         endurance_stage=True,
         endurance_goal_ms=600_000,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage36")
+def _stage36() -> Stage:
+    return Stage(
         id="stage36",
         name_key="stages.stage36.name",
         description_key="stages.stage36.description",
@@ -1490,8 +1636,12 @@ STAGES: list[Stage] = [
         ),
         flashlight_spawn_count=3,
         shoes_spawn_count=2,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage37")
+def _stage37() -> Stage:
+    return Stage(
         id="stage37",
         name_key="stages.stage37.name",
         description_key="stages.stage37.description",
@@ -1519,8 +1669,12 @@ STAGES: list[Stage] = [
         material_spawn_density=0.11,
         flashlight_spawn_count=3,
         shoes_spawn_count=0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage38")
+def _stage38() -> Stage:
+    return Stage(
         id="stage38",
         name_key="stages.stage38.name",
         description_key="stages.stage38.description",
@@ -1554,8 +1708,12 @@ STAGES: list[Stage] = [
         ],
         flashlight_spawn_count=0,
         shoes_spawn_count=0,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage39")
+def _stage39() -> Stage:
+    return Stage(
         id="stage39",
         name_key="stages.stage39.name",
         description_key="stages.stage39.description",
@@ -1598,8 +1756,12 @@ STAGES: list[Stage] = [
         flashlight_spawn_count=1,
         shoes_spawn_count=1,
         zombie_spawn_count_per_interval=3,
-    ),
-    Stage(
+    )
+
+
+@STAGES.register("stage40")
+def _stage40() -> Stage:
+    return Stage(
         id="stage40",
         name_key="stages.stage40.name",
         description_key="stages.stage40.description",
@@ -1641,8 +1803,9 @@ STAGES: list[Stage] = [
         flashlight_spawn_count=0,
         shoes_spawn_count=2,
         zombie_spawn_count_per_interval=2,
-    ),
-]
+    )
+
+
 DEFAULT_STAGE_ID = "stage1"
 
 
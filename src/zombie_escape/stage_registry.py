@@ -0,0 +1,91 @@
+"""Ordered stage registry that builds each Stage on first lookup."""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator, Sequence, overload
+
+from .models import Stage
+
+StageFactory = Callable[[], Stage]
+
+
+class StageRegistry(Sequence[Stage]):
+    """Sequence of stages whose definitions run (and validate) lazily.
+
+    Stage factories are registered in display order. A `Stage` is constructed,
+    including its `__post_init__` validation, the first time it is looked up by
+    id or index, and the instance is reused afterwards. Listing ids or checking
+    availability never builds a stage.
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[str, StageFactory] = {}
+        self._available: dict[str, bool] = {}
+        self._order: list[str] = []
+        self._resolved: dict[str, Stage] = {}
+
+    def register(
+        self, stage_id: str, *, available: bool = True
+    ) -> Callable[[StageFactory], StageFactory]:
+        def decorator(factory: StageFactory) -> StageFactory:
+            assert stage_id not in self._factories, f"duplicate stage id {stage_id}"
+            self._factories[stage_id] = factory
+            self._available[stage_id] = available
+            self._order.append(stage_id)
+            return factory
+
+        return decorator
+
+    def ids(self, *, available_only: bool = False) -> list[str]:
+        if not available_only:
+            return list(self._order)
+        return [stage_id for stage_id in self._order if self._available[stage_id]]
+
+    def is_available(self, stage_id: str) -> bool:
+        return self._available.get(stage_id, False)
+
+    def is_resolved(self, stage_id: str) -> bool:
+        return stage_id in self._resolved
+
+    def get(self, stage_id: str) -> Stage:
+        stage = self._resolved.get(stage_id)
+        if stage is not None:
+            return stage
+        factory = self._factories.get(stage_id)
+        if factory is None:
+            raise KeyError(stage_id)
+        stage = factory()
+        assert stage.id == stage_id, (
+            f"stage factory for {stage_id} returned {stage.id}"
+        )
+        assert stage.available == self._available[stage_id], (
+            f"Stage {stage_id}: available flag does not match its registration"
+        )
+        self._resolved[stage_id] = stage
+        return stage
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, Stage):
+            item = item.id
+        return item in self._factories
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @overload
+    def __getitem__(self, index: int) -> Stage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Stage]: ...
+
+    def __getitem__(self, index: int | slice) -> Stage | list[Stage]:
+        if isinstance(index, slice):
+            return [self.get(stage_id) for stage_id in self._order[index]]
+        return self.get(self._order[index])
+
+    def __iter__(self) -> Iterator[Stage]:
+        for stage_id in self._order:
+            yield self.get(stage_id)
+
+
+__all__ = ["StageFactory", "StageRegistry"]
@@ -6,7 +6,7 @@ import os
 import sys
 import traceback  # For error reporting
 from pathlib import Path
-from typing import Any, Tuple
+from typing import TYPE_CHECKING, Any, Tuple
 
 import pygame
 
@@ -20,10 +20,11 @@ from .entities_constants import (
     SURVIVOR_MAX_SAFE_PASSENGERS,
     SURVIVOR_MIN_SPEED_FACTOR,
 )
-from .gameplay import calculate_car_speed_for_passengers
 from .level_constants import DEFAULT_CELL_SIZE
-from .localization import set_language
-from .models import Stage
+from .render_assets.atlas_cache import (
+    load_render_asset_cache,
+    save_render_asset_cache,
+)
 from .render_constants import RenderAssets, build_render_assets
 from .screen_constants import (
     DEFAULT_WINDOW_SCALE,
@@ -31,18 +32,17 @@ from .screen_constants import (
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
 )
-from .screens import ScreenID, ScreenTransition
+from .screens import MAX_SEED_DIGITS, ScreenID, ScreenTransition
 from .windowing import (
     adjust_menu_logical_size,
     apply_window_scale,
     prime_scaled_logical_size,
     set_scaled_logical_size,
 )
-from .screens.game_over import game_over_screen
-from .screens.settings import settings_screen
-from .screens.startup_check import startup_check_screen
-from .screens.title import MAX_SEED_DIGITS, title_screen
-from .stage_constants import DEFAULT_STAGE_ID, STAGES
+
+if TYPE_CHECKING:  # pragma: no cover - typing-only imports
+    from .gameplay import calculate_car_speed_for_passengers
+    from .models import Stage
 
 
 def _parse_cli_args(argv: list[str]) -> Tuple[argparse.Namespace, list[str]]:
@@ -78,6 +78,21 @@ def _parse_cli_args(argv: list[str]) -> Tuple[argparse.Namespace, list[str]]:
         dest="build_fog_cache",
         help="Precompute and save fog cache files for all darkness profiles, then exit",
     )
+    parser.add_argument(
+        "--digest-every",
+        type=int,
+        default=0,
+        metavar="TICKS",
+        help="Write a rolling state digest every TICKS simulation ticks",
+    )
+    parser.add_argument(
+        "--digest-output",
+        default="digests.jsonl",
+        help=(
+            "State digest log path; the stage id and seed are added before the "
+            "suffix (default: digests.jsonl)"
+        ),
+    )
     parser.add_argument("--seed")
     return parser.parse_known_args(argv)
 
@@ -92,6 +107,15 @@ def _sanitize_seed_text(raw: str | None) -> tuple[str | None, bool]:
     return stripped[:MAX_SEED_DIGITS], False
 
 
+def __getattr__(name: str) -> Any:
+    # The gameplay package is only loaded once a stage starts.
+    if name == "calculate_car_speed_for_passengers":
+        from .gameplay import calculate_car_speed_for_passengers
+
+        return calculate_car_speed_for_passengers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Re-export the gameplay helpers constants for external callers/tests.
 __all__ = [
     "main",
@@ -104,6 +128,10 @@ __all__ = [
 
 # --- Main Entry Point ---
 def main() -> None:
+    import multiprocessing
+
+    # Blueprint attempts may run in spawned workers; frozen builds need this.
+    multiprocessing.freeze_support()
     args, remaining = _parse_cli_args(sys.argv[1:])
     sys.argv = [sys.argv[0]] + remaining
 
@@ -125,8 +153,6 @@ def main() -> None:
         print(f"Pygame font failed to initialize: {e}")
         # Font errors are often non-fatal, continue without fonts or handle gracefully
 
-    from .screens.gameplay import gameplay_screen
-
     prime_scaled_logical_size((SCREEN_WIDTH, SCREEN_HEIGHT))
     apply_window_scale(DEFAULT_WINDOW_SCALE)
     pygame.mouse.set_visible(True)
@@ -159,10 +185,17 @@ def main() -> None:
         pygame.quit()
         return
 
+    load_render_asset_cache()
+    from .blueprint_cache import enable_blueprint_cache
+
+    enable_blueprint_cache()
+
     config: dict[str, Any]
     config, config_path = load_config()
     if not config_path.exists():
         save_config(config, config_path)
+    from .localization import set_language
+
     set_language(config.get("language"))
 
     def _profiled_gameplay_screen(
@@ -177,9 +210,13 @@ def main() -> None:
         render_assets: RenderAssets,
         debug_mode: bool,
         show_fps: bool,
+        digest_interval: int,
+        digest_output: Path,
     ) -> ScreenTransition:
         import cProfile
 
+        from .screens.gameplay import gameplay_screen
+
         profiler = cProfile.Profile()
         output_path = Path(args.profile_output)
         print("Profile ready. Press F10 in gameplay to start/stop and save.")
@@ -196,6 +233,8 @@ def main() -> None:
             show_fps=show_fps,
             profiler=profiler,
             profiler_output=output_path,
+            digest_interval=digest_interval,
+            digest_output=digest_output,
         )
 
     next_screen = ScreenID.STARTUP_CHECK
@@ -207,6 +246,8 @@ def main() -> None:
         transition = None
 
         if next_screen == ScreenID.STARTUP_CHECK:
+            from .screens.startup_check import startup_check_screen
+
             adjust_menu_logical_size()
             transition = startup_check_screen(
                 menu_screen,
@@ -216,6 +257,9 @@ def main() -> None:
                 screen_size=menu_screen.get_size(),
             )
         elif next_screen == ScreenID.TITLE:
+            from .screens.title import title_screen
+            from .stage_constants import DEFAULT_STAGE_ID, STAGES
+
             adjust_menu_logical_size()
             seed_input = None if title_seed_is_auto else title_seed_text
             transition = title_screen(
@@ -233,6 +277,8 @@ def main() -> None:
                 title_seed_text = transition.seed_text
                 title_seed_is_auto = transition.seed_is_auto
         elif next_screen == ScreenID.SETTINGS:
+            from .screens.settings import settings_screen
+
             adjust_menu_logical_size()
             config = settings_screen(
                 menu_screen,
@@ -245,6 +291,8 @@ def main() -> None:
             set_language(config.get("language"))
             transition = ScreenTransition(ScreenID.TITLE)
         elif next_screen == ScreenID.GAMEPLAY:
+            from .screens.gameplay import gameplay_screen
+
             set_scaled_logical_size((SCREEN_WIDTH, SCREEN_HEIGHT))
             stage = incoming.stage
             seed_value = incoming.seed
@@ -266,6 +314,8 @@ def main() -> None:
                         render_assets=render_assets,
                         debug_mode=debug_mode,
                         show_fps=show_fps,
+                        digest_interval=max(0, args.digest_every),
+                        digest_output=Path(args.digest_output),
                     )
                 except SystemExit:
                     running = False
@@ -276,6 +326,8 @@ def main() -> None:
                     running = False
                     break
         elif next_screen == ScreenID.GAME_OVER:
+            from .screens.game_over import game_over_screen
+
             game_data = incoming.game_data if incoming else None
             stage = incoming.stage if incoming else None
             config_payload = incoming.config if incoming else None
@@ -308,6 +360,11 @@ def main() -> None:
             title_seed_is_auto = cli_seed_is_auto
         next_screen = transition.next_screen
 
+    layout_module = sys.modules.get(f"{__package__}.gameplay.layout")
+    if layout_module is not None:
+        # Stop speculative blueprint workers before the interpreter tears down.
+        layout_module.shutdown_blueprint_pool()
+    save_render_asset_cache()
     pygame.quit()  # Quit pygame only once at the very end of main
     sys.exit()  # Exit the script
 
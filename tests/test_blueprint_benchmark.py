@@ -0,0 +1,48 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "blueprint_benchmark.py"
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location("blueprint_benchmark", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve their module by name
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_reports_attempts_and_timings_in_process() -> None:
+    benchmark = _load_benchmark()
+    reports, wall_time = benchmark.run_benchmark(
+        ["stage1"], seeds=3, first_seed=5, workers=1, chunk_size=2
+    )
+
+    assert wall_time > 0
+    (report,) = reports
+    assert report.seeds == 3
+    assert report.blueprints + report.exhausted == 3
+    assert sum(report.attempt_histogram.values()) == report.blueprints
+    failed = report.generation_errors + report.connectivity_rejections
+    assert report.attempts == report.blueprints + failed
+    assert report.calls["generate_random_blueprint"] == report.attempts
+    assert report.calls["_place_walls_default"] > 0
+    assert report.timings["validate_connectivity"] > 0
+    assert benchmark._format_report(report)[0].startswith("stage1 (default)")
+
+
+def test_benchmark_restores_uninstrumented_generators() -> None:
+    from zombie_escape import level_blueprints
+
+    algorithms = dict(level_blueprints.WALL_ALGORITHMS)
+    validators = {
+        name: getattr(level_blueprints, name)
+        for name in _load_benchmark()._VALIDATOR_NAMES
+    }
+    _load_benchmark().run_benchmark(["stage1"], seeds=1, workers=1)
+
+    assert level_blueprints.WALL_ALGORITHMS == algorithms
+    for name, func in validators.items():
+        assert getattr(level_blueprints, name) is func
@@ -0,0 +1,81 @@
+from zombie_escape import blueprint_cache
+from zombie_escape.gameplay import layout
+from zombie_escape.gameplay.layout import generate_level_from_blueprint
+from zombie_escape.models import Stage
+from zombie_escape.rng import get_rng
+
+
+def _stage() -> Stage:
+    return Stage(
+        id="blueprint_cache",
+        name_key="n",
+        description_key="d",
+        grid_cols=30,
+        grid_rows=15,
+        zombie_normal_ratio=1.0,
+    )
+
+
+def test_known_seed_skips_generation_and_restores_rng(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(blueprint_cache, "_cache_dir", None)
+    blueprint_cache.enable_blueprint_cache(tmp_path)
+
+    first = generate_level_from_blueprint(
+        _stage(), {}, seed=4242, ambient_palette_key=None
+    )[4]
+    rng_after_first = get_rng().getstate()
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def _fail(**_kwargs):
+        raise AssertionError("generation should be skipped on a cache hit")
+
+    monkeypatch.setattr(layout, "generate_random_blueprint", _fail)
+    get_rng().random()  # disturb the RNG; the hit must restore it
+    second = generate_level_from_blueprint(
+        _stage(), {}, seed=4242, ambient_palette_key=None
+    )[4]
+
+    assert second.grid == first.grid
+    assert second.steel_cells == first.steel_cells
+    assert second.car_reachable_cells == first.car_reachable_cells
+    assert get_rng().getstate() == rng_after_first
+
+
+def test_cache_key_tracks_seed_and_parameters(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(blueprint_cache, "_cache_dir", None)
+    assert blueprint_cache.blueprint_cache_key(1, {"cols": 30}) is None
+
+    blueprint_cache.enable_blueprint_cache(tmp_path)
+    base = blueprint_cache.blueprint_cache_key(1, {"cols": 30})
+    assert base == blueprint_cache.blueprint_cache_key(1, {"cols": 30})
+    assert base != blueprint_cache.blueprint_cache_key(2, {"cols": 30})
+    assert base != blueprint_cache.blueprint_cache_key(1, {"cols": 31})
+
+
+def test_speculative_attempts_match_sequential_order(monkeypatch) -> None:
+    stage = _stage()
+    generator_kwargs = {
+        "steel_chance": 0.0,
+        "cols": stage.grid_cols,
+        "rows": stage.grid_rows,
+        "exit_sides": stage.exit_sides,
+        "pitfall_density": 0.2,
+    }
+    validation_kwargs = {"fuel_mode": stage.fuel_mode}
+
+    monkeypatch.setenv("ZOMBIE_ESCAPE_BLUEPRINT_WORKERS", "1")
+    sequential = layout._run_remaining_attempts(
+        77, generator_kwargs, validation_kwargs
+    )
+    monkeypatch.setenv("ZOMBIE_ESCAPE_BLUEPRINT_WORKERS", "2")
+    try:
+        speculative = layout._run_remaining_attempts(
+            77, generator_kwargs, validation_kwargs
+        )
+    finally:
+        layout.shutdown_blueprint_pool()
+
+    assert sequential is not None and speculative is not None
+    assert speculative[0].grid == sequential[0].grid
+    assert speculative[0].car_reachable_cells == sequential[0].car_reachable_cells
+    assert speculative[1] == sequential[1]
@@ -1,7 +1,7 @@
 import pytest
 
 from zombie_escape.entities.carrier_bot import CarrierBot
-from zombie_escape.entities.material import Material
+from zombie_escape.entities.material import Material, MaterialOccupancy
 from zombie_escape.level_constants import (
     DEFAULT_CELL_SIZE,
     DEFAULT_GRID_COLS,
@@ -235,3 +235,46 @@ def test_carrier_bot_pushes_overlapping_targets() -> None:
 
     assert bot.rect.center == (35, 25)
     assert target.rect.centerx > 35
+
+
+def test_material_occupancy_follows_pickup_and_drop_events() -> None:
+    _init_pygame()
+    layout = _make_layout(width=200, height=200)
+    occupancy = MaterialOccupancy(
+        layout.material_cells,
+        cell_size=DEFAULT_CELL_SIZE,
+        grid_cols=layout.grid_cols,
+        grid_rows=layout.grid_rows,
+    )
+    bot = CarrierBot(25, 25, axis="x", direction_sign=1, speed=10.0)
+    material = Material(55, 25)
+    occupancy.track(material)
+    start_cell = (55 // DEFAULT_CELL_SIZE, 25 // DEFAULT_CELL_SIZE)
+    assert layout.material_cells == {start_cell}
+    version = occupancy.version
+
+    for _ in range(2):
+        bot.update(
+            [],
+            layout=layout,
+            cell_size=DEFAULT_CELL_SIZE,
+            pitfall_cells=set(),
+            materials=[material],
+        )
+    assert material.carried_by is bot
+    assert layout.material_cells == set()
+    assert occupancy.version == version + 1
+
+    bot._place_material_here()
+    dropped_cell = (
+        material.rect.centerx // DEFAULT_CELL_SIZE,
+        material.rect.centery // DEFAULT_CELL_SIZE,
+    )
+    assert layout.material_cells == {dropped_cell}
+    version = occupancy.version
+    material.place_at(*material.rect.center)
+    assert occupancy.version == version  # same cell: nothing to invalidate
+
+    material.kill()
+    assert layout.material_cells == set()
+    assert material.occupancy is None
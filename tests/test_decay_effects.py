@@ -3,7 +3,10 @@ import pygame
 from zombie_escape.render.decay_effects import (
     BURNED_DECAY_EFFECT_DURATION_FRAMES,
     DECAY_EFFECT_DURATION_FRAMES,
+    MAX_DECAY_EFFECTS,
     DecayingEntityEffect,
+    spawn_decay_effect,
+    update_decay_effects,
 )
 
 
@@ -41,3 +44,39 @@ def test_burned_tone_default_duration_is_extended() -> None:
 
     assert gray.duration_frames == DECAY_EFFECT_DURATION_FRAMES
     assert burned.duration_frames == BURNED_DECAY_EFFECT_DURATION_FRAMES
+
+
+def test_decay_erasure_follows_mask_rank_order() -> None:
+    _init_pygame()
+    src = pygame.Surface((6, 5), pygame.SRCALPHA)
+    src.fill((120, 120, 120, 255))
+
+    effect = DecayingEntityEffect(src, (3, 3), duration_frames=4)
+    effect.update(frames=2)
+
+    ranks = effect.mask.ranks[:6, :5]
+    alpha = pygame.surfarray.array_alpha(effect.surface)
+    assert 0 < effect.mask_index < effect.mask.pixel_count
+    assert ((alpha == 0) == (ranks < effect.mask_index)).all()
+
+    assert not effect.update(frames=2)
+    assert not pygame.surfarray.array_alpha(effect.surface).any()
+
+
+def test_spawn_decay_effect_caps_active_effects() -> None:
+    _init_pygame()
+    src = pygame.Surface((4, 4), pygame.SRCALPHA)
+    src.fill((120, 120, 120, 255))
+
+    effects: list[DecayingEntityEffect] = []
+    for idx in range(MAX_DECAY_EFFECTS + 5):
+        spawn_decay_effect(effects, src, (idx, idx))
+    assert len(effects) == MAX_DECAY_EFFECTS
+    assert effects[-1].rect.center == (MAX_DECAY_EFFECTS + 4, MAX_DECAY_EFFECTS + 4)
+
+    update_decay_effects(effects, frames=DECAY_EFFECT_DURATION_FRAMES)
+    assert effects == []
+    reused = spawn_decay_effect(effects, src, (1, 1), tone="burned")
+    assert reused.frames_elapsed == 0
+    assert reused.mask_index == 0
+    assert pygame.surfarray.array_alpha(reused.surface).all()
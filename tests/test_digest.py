@@ -0,0 +1,118 @@
+import io
+from types import SimpleNamespace
+
+import pygame
+
+from zombie_escape.gameplay.digest import (
+    DIGEST_SUBSYSTEMS,
+    StateDigestRecorder,
+    compute_state_digests,
+    find_first_divergence,
+    read_digest_log,
+)
+from zombie_escape.gameplay.layout import generate_level_from_blueprint
+from zombie_escape.gameplay.snapshot import restore_game_data, snapshot_game_data
+from zombie_escape.gameplay.spawn import setup_player_and_cars, spawn_initial_zombies
+from zombie_escape.gameplay.state import initialize_game_state
+from zombie_escape.models import GameData
+from zombie_escape.rng import get_rng, seed_rng
+from zombie_escape.screens.gameplay import GameplayScreenRunner
+from zombie_escape.stage_constants import STAGES
+
+
+def _build_game(stage_id: str) -> GameData:
+    pygame.init()
+    stage = STAGES.get(stage_id)
+    seed_rng(4242)
+    game_data = initialize_game_state(stage)
+    layout, layout_data, wall_group, all_sprites, blueprint = (
+        generate_level_from_blueprint(stage, {}, seed=4242, ambient_palette_key=None)
+    )
+    game_data.layout = layout
+    game_data.blueprint = blueprint
+    game_data.groups.wall_group = wall_group
+    game_data.groups.all_sprites = all_sprites
+    player, waiting_cars = setup_player_and_cars(
+        game_data, layout_data, car_count=max(1, stage.waiting_car_target_count)
+    )
+    game_data.player = player
+    game_data.waiting_cars = waiting_cars
+    spawn_initial_zombies(game_data, player, layout_data, {})
+    return game_data
+
+
+def test_state_digests_track_each_subsystem() -> None:
+    game_data = _build_game("stage37")
+    baseline = compute_state_digests(game_data)
+    assert set(baseline) == set(DIGEST_SUBSYSTEMS)
+    assert compute_state_digests(game_data) == baseline
+
+    zombie = next(iter(game_data.groups.zombie_group))
+    zombie.x += 0.05  # below the quantization step
+    assert compute_state_digests(game_data) == baseline
+    zombie.x += 1.0
+    moved = compute_state_digests(game_data)
+    assert [name for name in DIGEST_SUBSYSTEMS if moved[name] != baseline[name]] == [
+        "zombies"
+    ]
+
+    cell = next(iter(game_data.layout.wall_grid._wall_views))
+    game_data.layout.wall_grid.damage_wall(cell, 1)
+    get_rng("ai").random()
+    changed = compute_state_digests(game_data)
+    assert changed["walls"] != moved["walls"]
+    assert changed["rng"] != moved["rng"]
+
+    restored = restore_game_data(snapshot_game_data(game_data))
+    assert compute_state_digests(restored) == compute_state_digests(game_data)
+
+
+def test_recorder_logs_rolling_digests_and_finds_divergence(tmp_path) -> None:
+    game_data = _build_game("stage1")
+    logs = []
+    for run in range(2):
+        stream = io.StringIO()
+        recorder = StateDigestRecorder(stream, interval=2)
+        recorder.write_header(stage="stage1", seed=4242)
+        for frame in range(1, 7):
+            if run == 1 and frame == 4:
+                game_data.player.x += 3.0
+            assert recorder.record(frame, game_data) == (frame % 2 == 0)
+        path = tmp_path / f"run{run}.jsonl"
+        path.write_text(stream.getvalue(), encoding="utf-8")
+        logs.append(read_digest_log(path))
+        game_data.player.x -= 3.0 * run
+
+    (header_a, first), (header_b, second) = logs
+    assert header_a == header_b and header_a["stage"] == "stage1"
+    assert sorted(first) == [2, 4, 6]
+    assert find_first_divergence(first, first) is None
+    divergence = find_first_divergence(first, second)
+    assert divergence is not None
+    assert divergence.frame == 4 and divergence.subsystems == ("player",)
+    # Rolling digests keep every later checkpoint marked as well.
+    assert first[6]["player"] != second[6]["player"]
+    assert first[6]["zombies"] == second[6]["zombies"]
+
+
+def test_gameplay_keeps_one_digest_log_per_stage(tmp_path) -> None:
+    runner = GameplayScreenRunner.__new__(GameplayScreenRunner)
+    runner.digest_interval = 5
+    runner.digest_output = tmp_path / "digests.jsonl"
+    runner.digest_recorder = None
+    runner.digest_path = None
+    for stage_id in ("stage1", "stage2"):
+        runner.stage = STAGES.get(stage_id)
+        runner.game_data = SimpleNamespace(state=SimpleNamespace(seed=4242))
+        runner._open_digest_log()
+    runner._close_digest_log()
+
+    paths = sorted(tmp_path.iterdir())
+    assert [path.name for path in paths] == [
+        "digests.stage1.4242.jsonl",
+        "digests.stage2.4242.jsonl",
+    ]
+    assert [read_digest_log(path)[0]["stage"] for path in paths] == [
+        "stage1",
+        "stage2",
+    ]
@@ -0,0 +1,74 @@
+import pygame
+
+from zombie_escape.entities import Camera
+from zombie_escape.gameplay_constants import SIMULATION_MAX_STEPS_PER_FRAME
+from zombie_escape.render.interpolation import RenderInterpolator
+from zombie_escape.screens.gameplay import GameplayScreenRunner
+
+
+class _StubState:
+    game_over = False
+    game_won = False
+
+
+class _StubGameData:
+    def __init__(self) -> None:
+        self.state = _StubState()
+        self.camera = None
+        self.player = None
+        self.car = None
+        self.groups = None
+
+
+def _make_runner(fps: int, ticks: list[float]) -> GameplayScreenRunner:
+    runner = GameplayScreenRunner.__new__(GameplayScreenRunner)
+    runner.sim_step_ms = 1000.0 / fps
+    runner.sim_accumulator_ms = 0.0
+    runner.sim_step_index = 0
+    runner.render_alpha = 1.0
+    runner.render_interpolator = RenderInterpolator()
+    runner.digest_recorder = None
+    runner.game_data = _StubGameData()
+    runner._collect_mobile_entities = lambda: []  # type: ignore[method-assign]
+    runner._update_world = lambda dt, _snapshot: ticks.append(dt)  # type: ignore[method-assign]
+    return runner
+
+
+def test_fixed_steps_are_independent_of_frame_times() -> None:
+    ticks: list[float] = []
+    runner = _make_runner(60, ticks)
+    for frame_ms in [5, 5, 5, 40, 16, 17, 1, 33] * 30:
+        runner._step_simulation(frame_ms, None)
+        assert 0.0 <= runner.render_alpha < 1.0
+
+    total_ms = sum(round(dt * 1000) for dt in ticks)
+    assert {round(dt * 1000) for dt in ticks} <= {16, 17}
+    assert total_ms == round(len(ticks) * 1000 / 60)
+    assert abs(total_ms + runner.sim_accumulator_ms - 122 * 30) < 1e-6
+
+
+def test_long_frames_cap_catch_up_steps() -> None:
+    ticks: list[float] = []
+    runner = _make_runner(60, ticks)
+    runner._step_simulation(5000, None)
+    assert len(ticks) == SIMULATION_MAX_STEPS_PER_FRAME
+
+
+def test_render_interpolator_blends_and_restores() -> None:
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(0, 0, 10, 10)
+    teleported = pygame.sprite.Sprite()
+    teleported.rect = pygame.Rect(0, 0, 10, 10)
+    camera = Camera(1000, 1000)
+    interpolator = RenderInterpolator()
+
+    interpolator.capture([sprite, teleported], camera)
+    sprite.rect.topleft = (10, 4)
+    teleported.rect.topleft = (500, 500)
+
+    with interpolator.applied(
+        [sprite, teleported], camera, alpha=0.5, snap_distance=50
+    ):
+        assert sprite.rect.topleft == (5, 2)
+        assert teleported.rect.topleft == (500, 500)
+    assert sprite.rect.topleft == (10, 4)
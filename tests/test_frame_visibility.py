@@ -0,0 +1,83 @@
+import pygame
+
+from zombie_escape.entities import Camera
+from zombie_escape.gameplay.spatial_index import SpatialIndex, SpatialKind
+from zombie_escape.gameplay.utils import is_entity_in_fov, rect_visible_on_screen
+from zombie_escape.gameplay.visibility import FrameVisibility
+from zombie_escape.screen_constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def _make_sprite(center: tuple[int, int], size: int = 12) -> pygame.sprite.Sprite:
+    spr = pygame.sprite.Sprite()
+    spr.rect = pygame.Rect(0, 0, size, size)
+    spr.rect.center = center
+    return spr
+
+
+def _build(
+    sprites: list[pygame.sprite.Sprite],
+    camera: Camera,
+    fov_target: pygame.sprite.Sprite,
+) -> FrameVisibility:
+    index = SpatialIndex(cell_size=32)
+    for spr in sprites:
+        index.insert(spr, SpatialKind.ZOMBIE)
+    visibility = FrameVisibility()
+    visibility.rebuild(
+        index,
+        camera=camera,
+        fov_target=fov_target,
+        flashlight_count=0,
+    )
+    return visibility
+
+
+def test_frame_visibility_matches_direct_checks() -> None:
+    camera = Camera(SCREEN_WIDTH * 3, SCREEN_HEIGHT * 3)
+    target = _make_sprite((SCREEN_WIDTH * 1.5, SCREEN_HEIGHT * 1.5))
+    camera.update(target)
+    view_left = -camera.camera.x
+    view_top = -camera.camera.y
+    sprites = [
+        target,
+        _make_sprite((view_left + 20, view_top + 20)),
+        # Center just outside the view, rect still overlapping it.
+        _make_sprite((view_left - 5, view_top + 40)),
+        _make_sprite((view_left + SCREEN_WIDTH + 4, view_top + SCREEN_HEIGHT + 4)),
+        _make_sprite((view_left - 80, view_top - 80)),
+        _make_sprite((target.rect.centerx + 30, target.rect.centery)),
+    ]
+    visibility = _build(sprites, camera, target)
+
+    for spr in sprites:
+        assert visibility.is_on_screen(spr, camera) == rect_visible_on_screen(
+            camera, spr.rect
+        )
+        assert visibility.is_in_fov(
+            spr, fov_target=target, flashlight_count=0
+        ) == is_entity_in_fov(spr.rect, fov_target=target, flashlight_count=0)
+
+
+def test_frame_visibility_falls_back_for_unindexed_entities() -> None:
+    camera = Camera(SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2)
+    target = _make_sprite((100, 100))
+    camera.update(target)
+    visibility = _build([target], camera, target)
+
+    late_spawn = _make_sprite((110, 100))
+    far_spawn = _make_sprite((SCREEN_WIDTH * 2 - 10, SCREEN_HEIGHT * 2 - 10))
+    assert visibility.is_on_screen(late_spawn, camera)
+    assert visibility.may_be_on_screen(far_spawn)
+    assert not visibility.is_on_screen(far_spawn, camera)
+    assert visibility.is_in_fov(late_spawn, fov_target=target, flashlight_count=0)
+
+
+def test_frame_visibility_culls_indexed_offscreen_entities() -> None:
+    camera = Camera(SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2)
+    target = _make_sprite((100, 100))
+    camera.update(target)
+    offscreen = _make_sprite((SCREEN_WIDTH * 2 - 10, SCREEN_HEIGHT * 2 - 10))
+    visibility = _build([target, offscreen], camera, target)
+
+    assert visibility.may_be_on_screen(target)
+    assert not visibility.may_be_on_screen(offscreen)
@@ -0,0 +1,93 @@
+import dataclasses
+
+import numpy as np
+import pygame
+
+from zombie_escape.entities.material import Material, MaterialOccupancy
+from zombie_escape.entities_constants import MovingFloorDirection
+from zombie_escape.hazard_grid import (
+    HAZARD_ELECTRIFIED,
+    HAZARD_FIRE_FLOOR,
+    HAZARD_MATERIAL,
+    HAZARD_PITFALL,
+    HAZARD_PUDDLE,
+    HazardGrid,
+    moving_floor_direction,
+    surface_flags_at,
+)
+from zombie_escape.models import LevelLayout
+
+CELL = 10
+
+
+def _layout() -> LevelLayout:
+    return LevelLayout(
+        field_rect=pygame.Rect(0, 0, 5 * CELL, 4 * CELL),
+        grid_cols=5,
+        grid_rows=4,
+        outside_cells=set(),
+        walkable_cells=[],
+        outer_wall_cells=set(),
+        wall_cells=set(),
+        steel_beam_cells=set(),
+        pitfall_cells={(0, 0)},
+        car_walkable_cells=set(),
+        car_spawn_cells=[],
+        fall_spawn_cells=set(),
+        spiky_plant_cells=set(),
+        fire_floor_cells={(1, 0)},
+        puddle_cells={(2, 3), (4, 3)},
+        bevel_corners={},
+        moving_floor_cells={(3, 1): MovingFloorDirection.LEFT},
+    )
+
+
+def test_hazard_grid_matches_layout_cell_sets() -> None:
+    layout = _layout()
+    hazards = HazardGrid.from_layout(layout, cell_size=CELL)
+    with_grid = dataclasses.replace(layout, hazard_grid=hazards)
+    for y in range(-1, 5):
+        for x in range(-1, 6):
+            px, py = x * CELL + 5, y * CELL + 5
+            assert surface_flags_at(with_grid, px, py, cell_size=CELL) == (
+                surface_flags_at(layout, px, py, cell_size=CELL)
+            )
+    assert hazards.flags_at(5, 5) == HAZARD_PITFALL
+    assert hazards.grid[0, 1] == HAZARD_FIRE_FLOOR
+    assert hazards.cell_id((2, 3)) == 17
+    assert hazards.cell_id((5, 0)) == -1
+    assert hazards.moving_floor_at(35, 15) == MovingFloorDirection.LEFT
+    assert moving_floor_direction(hazards.flags_at(25, 15)) is None
+
+
+def test_hazard_grid_batch_query_matches_scalar_lookups() -> None:
+    hazards = HazardGrid.from_layout(_layout(), cell_size=CELL)
+    xs = np.array([5.0, 15.0, 25.0, 45.0, -3.0, 60.0])
+    ys = np.array([5.0, 9.9, 35.0, 39.0, 5.0, 5.0])
+    batch = hazards.flags_at_points(xs, ys).tolist()
+    assert batch == [hazards.flags_at(x, y) for x, y in zip(xs, ys)]
+    assert batch[3] == HAZARD_PUDDLE
+    assert batch[4:] == [0, 0]
+
+
+def test_hazard_grid_tracks_runtime_flags() -> None:
+    pygame.init()
+    hazards = HazardGrid.from_layout(_layout(), cell_size=CELL)
+    version = hazards.version
+    hazards.replace_cells({(1, 1), (2, 1)}, HAZARD_ELECTRIFIED)
+    assert hazards.cells_with(HAZARD_ELECTRIFIED) == {(1, 1), (2, 1)}
+    hazards.replace_cells({(2, 1)}, HAZARD_ELECTRIFIED)
+    assert hazards.cells_with(HAZARD_ELECTRIFIED) == {(2, 1)}
+    assert hazards.version > version
+
+    occupancy = MaterialOccupancy(
+        cell_size=CELL, grid_cols=5, grid_rows=4, hazards=hazards
+    )
+    material = Material(15, 25)
+    occupancy.track(material)
+    assert hazards.flags_at(15, 25) & HAZARD_MATERIAL
+    material.place_at(35, 25)
+    assert not hazards.flags_at(15, 25) & HAZARD_MATERIAL
+    assert hazards.flags_at(35, 25) & HAZARD_MATERIAL
+    material.kill()
+    assert hazards.cells_with(HAZARD_MATERIAL) == set()
@@ -0,0 +1,51 @@
+import pygame
+
+from zombie_escape.level_constants import DEFAULT_CELL_SIZE
+from zombie_escape.render import hud
+from zombie_escape.render.hud_layer import HudCompositor
+from zombie_escape.render_constants import build_render_assets
+
+
+def _init_pygame() -> None:
+    if not pygame.get_init():
+        pygame.init()
+
+
+def test_hud_compositor_rebuilds_only_on_key_change() -> None:
+    _init_pygame()
+    screen = pygame.Surface((32, 32), pygame.SRCALPHA)
+    layer = HudCompositor()
+    builds: list[str] = []
+
+    def _build(label: str):
+        def _inner():
+            builds.append(label)
+            tile = pygame.Surface((4, 4), pygame.SRCALPHA)
+            tile.fill((255, 0, 0, 255))
+            return [(tile, (2, 2))]
+
+        return _inner
+
+    layer.draw(screen, "w", ("en", 1), _build("a"))
+    layer.draw(screen, "w", ("en", 1), _build("b"))
+    layer.draw(screen, "w", ("ja", 1), _build("c"))
+    layer.draw(screen, "other", ("ja", 1), _build("d"))
+
+    assert builds == ["a", "c", "d"]
+    assert screen.get_at((3, 3)) == pygame.Color(255, 0, 0, 255)
+
+
+def test_inventory_icons_reuse_cached_widget() -> None:
+    _init_pygame()
+    assets = build_render_assets(DEFAULT_CELL_SIZE)
+    screen = pygame.Surface((assets.screen_width, assets.screen_height))
+    hud._HUD_LAYER.invalidate()
+    start = hud._HUD_LAYER.rebuild_count
+    kwargs = dict(has_fuel=True, has_empty_fuel_can=False, shoes_count=1)
+
+    hud._draw_inventory_icons(screen, assets, flashlight_count=1, **kwargs)
+    hud._draw_inventory_icons(screen, assets, flashlight_count=1, **kwargs)
+    assert hud._HUD_LAYER.rebuild_count == start + 1
+
+    hud._draw_inventory_icons(screen, assets, flashlight_count=2, **kwargs)
+    assert hud._HUD_LAYER.rebuild_count == start + 2
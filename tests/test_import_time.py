@@ -0,0 +1,25 @@
+import importlib.util
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "check_import_time.py"
+
+
+def _load_checker():
+    spec = importlib.util.spec_from_file_location("check_import_time", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cold_start_does_not_import_deferred_modules() -> None:
+    checker = _load_checker()
+    timings = checker.measure_imports("zombie_escape.zombie_escape")
+    assert "zombie_escape.zombie_escape" in timings
+    assert checker.deferred_modules_loaded(timings) == []
+
+
+def test_package_import_does_not_load_entry_point() -> None:
+    checker = _load_checker()
+    timings = checker.measure_imports("zombie_escape")
+    assert "zombie_escape.zombie_escape" not in timings
@@ -99,6 +99,48 @@ def test_validate_connectivity_requires_reachable_fuel_when_enabled() -> None:
     assert validate_connectivity(grid, fuel_mode=FuelMode.FUEL_CAN) is None
 
 
+def test_validate_connectivity_fuel_can_needs_a_fuel_that_leads_back_to_car() -> None:
+    # The right-hand fuel is reachable, but '>' refuses the step back toward the car.
+    one_way = [
+        "BBBBBBBBB",
+        "BP.C>.f.B",
+        "B...B...B",
+        "BBBBBBBBB",
+    ]
+    assert validate_connectivity(one_way, fuel_mode=FuelMode.FUEL_CAN) is None
+
+    with_return_fuel = [
+        "BBBBBBBBB",
+        "BP.C>.f.B",
+        "Bf..B...B",
+        "BBBBBBBBB",
+    ]
+    assert validate_connectivity(with_return_fuel, fuel_mode=FuelMode.FUEL_CAN)
+
+
+def test_validate_car_connectivity_returns_exact_reachable_cells() -> None:
+    grid = [
+        "BBBBBB",
+        "BC.xEB",
+        "B.B..B",
+        "B^...B",
+        "BBBBBB",
+    ]
+
+    assert validate_car_connectivity(grid) == {
+        (1, 1),
+        (2, 1),
+        (1, 2),
+        (1, 3),
+        (2, 3),
+        (3, 3),
+        (4, 3),
+        (3, 2),
+        (4, 2),
+        (4, 1),
+    }
+
+
 def test_validate_connectivity_non_fuel_treats_player_as_fuel_start() -> None:
     grid = [
         "BBBBBBB",
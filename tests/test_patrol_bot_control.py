@@ -1,6 +1,8 @@
 import pytest
 
 from zombie_escape.entities import PatrolBot, Player
+from zombie_escape.entities.patrol_bot import ElectrifiedFloor
+from zombie_escape.hazard_grid import HAZARD_ELECTRIFIED, HazardGrid
 from zombie_escape.level_constants import (
     DEFAULT_CELL_SIZE,
     DEFAULT_GRID_COLS,
@@ -110,3 +112,41 @@ def test_patrol_bot_does_not_enter_puddle_cell() -> None:
     )
 
     assert (int(bot.x // cell_size), int(bot.y // cell_size)) != (6, 5)
+
+
+def test_electrified_floor_changes_only_when_bots_cross_cells() -> None:
+    _init_pygame()
+    cell_size = DEFAULT_CELL_SIZE
+    layout = _make_layout()
+    hazards = HazardGrid.from_layout(layout, cell_size=cell_size)
+    floor = ElectrifiedFloor(
+        cell_size=cell_size,
+        grid_cols=DEFAULT_GRID_COLS,
+        grid_rows=DEFAULT_GRID_ROWS,
+        hazards=hazards,
+    )
+    group = pygame.sprite.Group()
+    center = 5 * cell_size + cell_size // 2
+    first = PatrolBot(center, center)
+    second = PatrolBot(center, center)
+    group.add(first, second)
+    floor.track(first)
+    floor.track(second)
+    assert floor.cells == {(5, 5)}
+    assert floor.counts[5, 5] == 2
+    version = floor.version
+
+    first.direction = (1, 0)
+    first.update([], cell_size=cell_size, pitfall_cells=set(), layout=layout, now_ms=0)
+    assert (int(first.x // cell_size), int(first.y // cell_size)) == (5, 5)
+    assert floor.version == version
+
+    first.rect.center = (6 * cell_size + 2, center)
+    first.on_pushed()
+    assert floor.cells == {(5, 5), (6, 5)}
+    assert hazards.cells_with(HAZARD_ELECTRIFIED) == {(5, 5), (6, 5)}
+
+    second.kill()
+    assert floor.counts[5, 5] == 0
+    assert floor.cells == {(6, 5)}
+    assert hazards.cells_with(HAZARD_ELECTRIFIED) == {(6, 5)}
@@ -0,0 +1,67 @@
+import pygame
+
+from zombie_escape.render_assets import atlas_cache, characters
+
+
+def _init_pygame() -> None:
+    if not pygame.get_init():
+        pygame.init()
+
+
+def test_atlas_round_trips_built_surfaces(tmp_path, monkeypatch) -> None:
+    _init_pygame()
+    monkeypatch.setenv("ZOMBIE_ESCAPE_RENDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(atlas_cache, "_ATLAS_INDEX", None)
+    monkeypatch.setattr(characters, "_PLAYER_DIRECTIONAL_CACHE", {})
+
+    assert not atlas_cache.load_render_asset_cache()
+    built = characters.build_player_directional_surfaces(7, bins=4)
+    saved = atlas_cache.save_render_asset_cache()
+    assert saved is not None and saved.exists()
+    assert atlas_cache.save_render_asset_cache() is None
+
+    monkeypatch.setattr(characters, "_PLAYER_DIRECTIONAL_CACHE", {})
+    assert atlas_cache.load_render_asset_cache()
+    restored = atlas_cache.cached_surfaces("player", (7, 4))
+    assert restored is not None and len(restored) == 4
+    for original, loaded in zip(built, restored):
+        assert loaded.get_size() == original.get_size()
+        assert pygame.image.tobytes(loaded, "RGBA") == pygame.image.tobytes(
+            original, "RGBA"
+        )
+    assert characters.build_player_directional_surfaces(7, bins=4)[0].get_size() == (
+        built[0].get_size()
+    )
+
+
+def test_atlas_is_discarded_when_version_changes(tmp_path, monkeypatch) -> None:
+    _init_pygame()
+    monkeypatch.setenv("ZOMBIE_ESCAPE_RENDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(atlas_cache, "_ATLAS_INDEX", None)
+    monkeypatch.setattr(characters, "_PLAYER_DIRECTIONAL_CACHE", {})
+
+    atlas_cache.load_render_asset_cache()
+    characters.build_player_directional_surfaces(5, bins=2)
+    assert atlas_cache.save_render_asset_cache() is not None
+
+    monkeypatch.setattr(atlas_cache, "__version__", "0.0.0-other")
+    assert not atlas_cache.load_render_asset_cache()
+    assert atlas_cache.cached_surfaces("player", (5, 2)) is None
+
+
+def test_atlas_stays_disabled_when_sources_are_unreadable(
+    tmp_path, monkeypatch
+) -> None:
+    _init_pygame()
+    monkeypatch.setenv("ZOMBIE_ESCAPE_RENDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(atlas_cache, "_ATLAS_INDEX", None)
+    monkeypatch.setattr(characters, "_PLAYER_DIRECTIONAL_CACHE", {})
+
+    def _unreadable() -> str:
+        raise PermissionError("sources not readable")
+
+    monkeypatch.setattr(atlas_cache, "_source_fingerprint", _unreadable)
+    assert not atlas_cache.load_render_asset_cache()
+    characters.build_player_directional_surfaces(5, bins=2)
+    assert atlas_cache.cached_surfaces("player", (5, 2)) is None
+    assert atlas_cache.save_render_asset_cache() is None
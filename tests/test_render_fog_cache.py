@@ -1,11 +1,21 @@
+import threading
+
 import numpy as np
 import pygame
 import pygame.surfarray as pg_surfarray
 
 from zombie_escape.level_constants import DEFAULT_CELL_SIZE
+from zombie_escape.render import fog as fog_module
 from zombie_escape.render.fog import (
     _FogProfile,
+    _fog_cache_filename,
     _get_fog_overlay_surfaces,
+    _load_alpha_from_raw,
+    _load_cached_overlay_entry,
+    _overlay_canvas_size,
+    _save_alpha_to_png,
+    _save_alpha_to_raw,
+    prefetch_fog_profile,
     save_fog_cache_profile,
 )
 from zombie_escape.render_constants import build_render_assets
@@ -23,17 +33,153 @@ def test_fog_cache_save_and_load_for_all_profiles(tmp_path, monkeypatch) -> None
 
     for profile in _FogProfile:
         cache_paths = save_fog_cache_profile(assets, profile)
-        assert len(cache_paths) == 1
+        assert len(cache_paths) == 2
+        assert {path.suffix for path in cache_paths} == {".png", ".alpha"}
         for cache_path in cache_paths:
             assert cache_path.exists()
-            assert cache_path.suffix == ".png"
-            assert ".v1.png" in cache_path.name
+            assert ".v1." in cache_path.name
 
         fog_data: dict[str, object] = {"hatch_patterns": {}, "overlays": {}}
         loaded = _get_fog_overlay_surfaces(fog_data, assets, profile)
 
-        combined_path = next(path for path in cache_paths if "_combined." in path.name)
+        combined_path = next(path for path in cache_paths if path.suffix == ".png")
         combined_alpha = pg_surfarray.array_alpha(pygame.image.load(str(combined_path))).T
         loaded_combined_alpha = pg_surfarray.array_alpha(loaded["combined"]).T
 
         assert np.array_equal(loaded_combined_alpha, combined_alpha)
+
+
+def test_fog_raw_alpha_cache_round_trip_and_rejects_mismatch(tmp_path) -> None:
+    alpha = np.arange(6 * 4, dtype=np.uint8).reshape(4, 6)
+    raw_path = tmp_path / "fog_test.alpha"
+    _save_alpha_to_raw(alpha, raw_path)
+
+    mapped = _load_alpha_from_raw(raw_path, expected_size=(6, 4))
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(mapped, alpha)
+    assert _load_alpha_from_raw(raw_path, expected_size=(4, 6)) is None
+
+    raw_path.write_bytes(raw_path.read_bytes()[:-1])
+    assert _load_alpha_from_raw(raw_path, expected_size=(6, 4)) is None
+
+
+def test_fog_png_fallback_writes_raw_user_cache(tmp_path, monkeypatch) -> None:
+    _init_pygame()
+    monkeypatch.setenv("ZOMBIE_ESCAPE_FOG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(fog_module, "_fog_resource_cache_path", lambda *a, **k: None)
+    assets = build_render_assets(DEFAULT_CELL_SIZE)
+    profile = _FogProfile.DARK0
+    size = _overlay_canvas_size(assets, profile)
+    alpha = np.zeros((size[1], size[0]), dtype=np.uint8)
+    alpha[::7, ::5] = 200
+    _save_alpha_to_png(
+        alpha, tmp_path / _fog_cache_filename(profile, "combined"), color=profile.color
+    )
+
+    entry = _load_cached_overlay_entry(assets, profile, expected_size=size)
+    assert entry is not None
+    assert np.array_equal(entry["alpha"], alpha)
+    raw_path = tmp_path / _fog_cache_filename(profile, "combined", extension="alpha")
+    assert raw_path.exists()
+
+    entry = _load_cached_overlay_entry(assets, profile, expected_size=size)
+    assert isinstance(entry["alpha"], np.memmap)
+    fog_data = {"hatch_patterns": {}, "overlays": {profile: entry}}
+    combined = _get_fog_overlay_surfaces(fog_data, assets, profile)["combined"]
+    assert np.array_equal(pg_surfarray.array_alpha(combined).T, alpha)
+
+
+def _lazy_fog_data(size: tuple[int, int]) -> dict[str, object]:
+    overlays = {
+        profile: {"alpha": np.full((size[1], size[0]), profile.flashlight_count, np.uint8)}
+        for profile in _FogProfile
+    }
+    return {"hatch_patterns": {}, "overlays": overlays}
+
+
+def test_fog_overlays_evict_under_memory_budget(monkeypatch) -> None:
+    _init_pygame()
+    assets = build_render_assets(DEFAULT_CELL_SIZE)
+    size = _overlay_canvas_size(assets, _FogProfile.DARK0)
+    surface_mb = size[0] * size[1] * 4 / (1024 * 1024)
+    monkeypatch.setenv("ZOMBIE_ESCAPE_FOG_MEMORY_BUDGET_MB", str(surface_mb * 2.5))
+    fog_data = _lazy_fog_data(size)
+    overlays = fog_data["overlays"]
+
+    for profile in (_FogProfile.DARK0, _FogProfile.DARK1, _FogProfile.DARK2):
+        _get_fog_overlay_surfaces(fog_data, assets, profile)
+
+    assert "combined" not in overlays[_FogProfile.DARK0]
+    assert "combined" in overlays[_FogProfile.DARK1]
+    assert "combined" in overlays[_FogProfile.DARK2]
+    assert "combined" not in overlays[_FogProfile.DARK3]
+
+    rebuilt = _get_fog_overlay_surfaces(fog_data, assets, _FogProfile.DARK0)
+    assert np.all(pg_surfarray.array_alpha(rebuilt["combined"]) == 0)
+    assert "combined" not in overlays[_FogProfile.DARK1]
+
+
+def test_prefetch_fog_profile_builds_overlay_in_background() -> None:
+    _init_pygame()
+    assets = build_render_assets(DEFAULT_CELL_SIZE)
+    size = _overlay_canvas_size(assets, _FogProfile.DARK0)
+    fog_data = _lazy_fog_data(size)
+
+    prefetch_fog_profile(fog_data, 2)
+    for thread in threading.enumerate():
+        if thread.name.startswith("fog-prefetch-"):
+            thread.join(timeout=5)
+
+    entry = fog_data["overlays"][_FogProfile.DARK2]
+    assert "combined" in entry
+    assert np.all(pg_surfarray.array_alpha(entry["combined"]) == 2)
+    assert "combined" not in fog_data["overlays"][_FogProfile.DARK1]
+
+
+def test_prefetch_never_evicts_the_profile_being_drawn(monkeypatch) -> None:
+    _init_pygame()
+    assets = build_render_assets(DEFAULT_CELL_SIZE)
+    size = _overlay_canvas_size(assets, _FogProfile.DARK0)
+    surface_mb = size[0] * size[1] * 4 / (1024 * 1024)
+    monkeypatch.setenv("ZOMBIE_ESCAPE_FOG_MEMORY_BUDGET_MB", str(surface_mb * 1.5))
+    fog_data = _lazy_fog_data(size)
+    overlays = fog_data["overlays"]
+
+    drawn = _get_fog_overlay_surfaces(fog_data, assets, _FogProfile.DARK1)
+    prefetch_fog_profile(fog_data, 2)
+    for thread in threading.enumerate():
+        if thread.name.startswith("fog-prefetch-"):
+            thread.join(timeout=5)
+
+    assert "combined" in overlays[_FogProfile.DARK1]
+    assert "combined" in overlays[_FogProfile.DARK2]
+    # The caller's copy keeps its surface even after a later eviction.
+    _get_fog_overlay_surfaces(fog_data, assets, _FogProfile.DARK3)
+    assert "combined" not in overlays[_FogProfile.DARK1]
+    assert drawn["combined"].get_size() == size
+
+
+def test_fog_row_tiles_match_single_pass(monkeypatch) -> None:
+    _init_pygame()
+    size = (97, 83)
+    center = (40, 45)
+
+    def _alphas() -> list[np.ndarray]:
+        return [
+            pg_surfarray.array_alpha(surface)
+            for surface in (
+                fog_module._build_edge_feather_surface(size, center, 30, 6),
+                fog_module._build_flashlight_fade_surface(size, center, 30),
+                fog_module._build_continuous_hatch_surface(
+                    size, center, (0, 0, 0, 255), 30, [(0.2, 0.5), (0.6, 1.0)]
+                ),
+            )
+        ]
+
+    monkeypatch.setattr(fog_module, "_FOG_TILE_ROWS", 1000)
+    monkeypatch.setattr(fog_module, "_fog_tile_workers", 1)
+    expected = _alphas()
+    monkeypatch.setattr(fog_module, "_FOG_TILE_ROWS", 16)
+    monkeypatch.setattr(fog_module, "_fog_tile_workers", 3)
+    for tiled, single in zip(_alphas(), expected):
+        assert np.array_equal(tiled, single)
@@ -0,0 +1,94 @@
+import hashlib
+
+import pytest
+
+from zombie_escape.rng import (
+    RNG_STREAMS,
+    _DeterministicRNG,
+    get_rng,
+    get_rng_states,
+    seed_rng,
+    set_rng_states,
+)
+
+# First 5000 raw words per seed, recorded from the reference pure-Python MT19937.
+GOLDEN_STREAMS = {
+    0: "197d15da0af820883d41b8f5475606ca2ca40d9a",  # falls back to seed 5489
+    4242: "16f9a66a9aa741b42748a6283b55dbff04da1aef",
+    2**32 + 7: "f4c05a74cfbb5548ac185f807f2a534357e0013a",  # masked to 32 bits
+    -1: "b68823acac89d537068e5599d444eecd15e33795",
+}
+
+
+@pytest.mark.parametrize("seed", sorted(GOLDEN_STREAMS))
+def test_rng_reproduces_golden_stream(seed: int) -> None:
+    rng = _DeterministicRNG(seed)
+    digest = hashlib.sha1()
+    for _ in range(5000):
+        digest.update(rng._next().to_bytes(4, "little"))
+    assert digest.hexdigest() == GOLDEN_STREAMS[seed]
+
+
+def test_rng_helpers_match_reference_sequence() -> None:
+    rng = _DeterministicRNG(4242)
+    assert [rng._next() for _ in range(3)] == [1395647406, 3472777710, 4039049869]
+    assert rng.randint(1, 6) == 4
+    assert rng.uniform(-1, 1) == 0.8280158890411258
+    assert rng.choice("abcdef") == "e"
+    values = list(range(10))
+    rng.shuffle(values)
+    assert values == [9, 4, 5, 0, 1, 7, 6, 3, 8, 2]
+    assert rng.random() == 0.6639659204520285
+
+
+def test_rng_state_round_trips_mid_block() -> None:
+    rng = _DeterministicRNG(99)
+    for _ in range(700):
+        rng.random()
+    state = rng.getstate()
+    words, index, seed_value = state
+    assert len(words) == 624 and index == 700 - 624 and seed_value == 99
+    expected = [rng._next() for _ in range(1000)]
+
+    restored = _DeterministicRNG(1)
+    restored.setstate(state)
+    assert restored.getstate() == state
+    assert [restored._next() for _ in range(1000)] == expected
+
+
+def test_rng_streams_are_independent_and_checkpointable() -> None:
+    assert seed_rng(42) == 42
+    # Layout keeps the plain seed so generated levels match earlier builds.
+    assert get_rng("layout").getstate() == _DeterministicRNG(42).getstate()
+    spawn_expected = [get_rng("spawn").random() for _ in range(5)]
+    streams = {name: get_rng(name)._next() for name in RNG_STREAMS}
+    assert len(set(streams.values())) == len(RNG_STREAMS)
+
+    seed_rng(42)
+    for _ in range(1000):
+        get_rng("ai").random()
+    assert [get_rng("spawn").random() for _ in range(5)] == spawn_expected
+
+    states = get_rng_states()
+    ai_next = get_rng("ai")._next()
+    fx_before = get_rng("fx").getstate()
+    get_rng("fx").random()
+    set_rng_states({"ai": states["ai"]})
+    assert get_rng("ai")._next() == ai_next
+    assert get_rng("fx").getstate() != fx_before
+
+    with pytest.raises(ValueError):
+        get_rng("render")
+
+
+def test_rng_position_survives_state_round_trip() -> None:
+    fresh = _DeterministicRNG(4242)
+    restored = _DeterministicRNG(1)
+    restored.setstate(fresh.getstate())
+    assert restored.position() == fresh.position()
+
+    fresh.random()
+    assert fresh.position() != restored.position()
+    restored.setstate(fresh.getstate())
+    assert restored.position() == fresh.position()
+    assert restored.random() == fresh.random()
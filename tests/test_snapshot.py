@@ -0,0 +1,90 @@
+import numpy as np
+import pygame
+import pytest
+
+from zombie_escape.gameplay.layout import generate_level_from_blueprint
+from zombie_escape.gameplay.snapshot import (
+    SnapshotError,
+    restore_game_data,
+    snapshot_game_data,
+)
+from zombie_escape.gameplay.spawn import (
+    setup_player_and_cars,
+    spawn_initial_carrier_bots_and_materials,
+    spawn_initial_patrol_bots,
+    spawn_initial_zombies,
+)
+from zombie_escape.gameplay.state import initialize_game_state
+from zombie_escape.models import GameData
+from zombie_escape.rng import get_rng, seed_rng
+from zombie_escape.stage_constants import STAGES
+
+
+def _build_game(stage_id: str) -> GameData:
+    pygame.init()
+    stage = STAGES.get(stage_id)
+    seed_rng(4242)
+    game_data = initialize_game_state(stage)
+    layout, layout_data, wall_group, all_sprites, blueprint = (
+        generate_level_from_blueprint(stage, {}, seed=4242, ambient_palette_key=None)
+    )
+    game_data.layout = layout
+    game_data.blueprint = blueprint
+    game_data.groups.wall_group = wall_group
+    game_data.groups.all_sprites = all_sprites
+    player, waiting_cars = setup_player_and_cars(
+        game_data, layout_data, car_count=max(1, stage.waiting_car_target_count)
+    )
+    game_data.player = player
+    game_data.waiting_cars = waiting_cars
+    spawn_initial_zombies(game_data, player, layout_data, {})
+    spawn_initial_patrol_bots(game_data, player, layout_data)
+    spawn_initial_carrier_bots_and_materials(game_data)
+    return game_data
+
+
+def test_snapshot_restores_entities_layout_and_rng() -> None:
+    game_data = _build_game("stage37")
+    wall_grid = game_data.layout.wall_grid
+    cell = next(iter(wall_grid._wall_views))
+    wall_grid.damage_wall(cell, 1)
+    zombie = next(iter(game_data.groups.zombie_group))
+    zombie.take_damage(10, now_ms=0)
+    game_data.state.clock.elapsed_ms = 12345
+
+    blob = snapshot_game_data(game_data)
+    expected_draws = [get_rng(name).random() for name in ("spawn", "ai")]
+    restored = restore_game_data(blob)
+
+    assert [get_rng(name).random() for name in ("spawn", "ai")] == expected_draws
+    assert restored.state.clock.elapsed_ms == 12345
+    original_sprites = list(game_data.groups.all_sprites)
+    restored_sprites = list(restored.groups.all_sprites)
+    assert [(type(s), s.rect) for s in restored_sprites] == [
+        (type(s), s.rect) for s in original_sprites
+    ]
+    for before, after in zip(original_sprites, restored_sprites):
+        assert after.image is not None
+        assert after.image.get_size() == before.image.get_size()
+    assert restored.player in restored.groups.all_sprites
+    assert restored.player is not game_data.player
+    assert restored.groups.patrol_bot_group and restored.groups.material_group
+    restored_zombie = next(
+        z for z in restored.groups.zombie_group if z.rect == zombie.rect
+    )
+    assert restored_zombie.health == zombie.health
+
+    restored_grid = restored.layout.wall_grid
+    assert np.array_equal(restored_grid.health, wall_grid.health)
+    assert restored_grid.wall_at(cell).grid is restored_grid
+    hazards = restored.layout.hazard_grid
+    assert np.shares_memory(hazards.grid, hazards.flags)
+    assert restored.layout.material_occupancy.hazards is hazards
+
+
+def test_snapshot_rejects_foreign_bytes() -> None:
+    with pytest.raises(SnapshotError):
+        restore_game_data(b"not a snapshot")
+    blob = snapshot_game_data(_build_game("stage1"))
+    with pytest.raises(SnapshotError):
+        restore_game_data(blob[:-40])
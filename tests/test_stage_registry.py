@@ -0,0 +1,67 @@
+import pytest
+
+from zombie_escape.models import Stage
+from zombie_escape.stage_constants import DEFAULT_STAGE_ID, STAGES
+from zombie_escape.stage_registry import StageRegistry
+
+
+def _make_registry(calls: list[str]) -> StageRegistry:
+    registry = StageRegistry()
+    for stage_id in ("alpha", "beta"):
+
+        def factory(stage_id: str = stage_id) -> Stage:
+            calls.append(stage_id)
+            return Stage(
+                id=stage_id,
+                name_key="n",
+                description_key="d",
+                zombie_normal_ratio=1.0,
+            )
+
+        registry.register(stage_id)(factory)
+    return registry
+
+
+def test_registry_builds_stages_on_first_lookup_only() -> None:
+    calls: list[str] = []
+    registry = _make_registry(calls)
+
+    assert registry.ids() == ["alpha", "beta"]
+    assert len(registry) == 2
+    assert "beta" in registry
+    assert calls == []
+
+    first = registry.get("beta")
+    assert registry.get("beta") is first
+    assert registry[1] is first
+    assert calls == ["beta"]
+    assert not registry.is_resolved("alpha")
+
+    assert [stage.id for stage in registry] == ["alpha", "beta"]
+    assert calls == ["beta", "alpha"]
+    with pytest.raises(KeyError):
+        registry.get("gamma")
+
+
+def test_stage_table_ids_match_definitions() -> None:
+    ids = STAGES.ids()
+    assert len(ids) == len(set(ids))
+    assert DEFAULT_STAGE_ID in STAGES
+    for stage_id in ids:
+        assert STAGES.get(stage_id).id == stage_id
+
+
+def test_zone_cells_are_expanded_once_per_stage() -> None:
+    stage = Stage(
+        id="zones",
+        name_key="n",
+        description_key="d",
+        pitfall_zones=[(1, 1, 2, 2)],
+        moving_floor_zones={"up": [(5, 5, 1, 2)]},
+        zombie_normal_ratio=1.0,
+    )
+    cells = stage.zone_cells
+    assert stage.zone_cells is cells
+    assert cells["pitfall"] == {(1, 1), (2, 1), (1, 2), (2, 2)}
+    assert cells["moving_floor"] == {(5, 5), (5, 6)}
+    assert cells["puddle"] == frozenset()
@@ -0,0 +1,45 @@
+import pygame
+
+from zombie_escape import font_utils
+from zombie_escape.font_utils import clear_font_cache, load_font
+from zombie_escape.render.text_overlay import blit_text_wrapped, wrap_text
+
+
+def _init_pygame() -> None:
+    if not pygame.get_init():
+        pygame.init()
+
+
+def test_wrap_text_is_memoized_and_cleared_with_font_cache() -> None:
+    _init_pygame()
+    clear_font_cache()
+    font = load_font(None, 16)
+    text = "the quick brown fox jumps over the lazy dog"
+
+    first = wrap_text(text, font, 80)
+    assert len(first) > 1
+    assert all(font.size(line)[0] <= 80 for line in first)
+    first.append("caller mutation")
+    assert wrap_text(text, font, 80) == first[:-1]
+    assert len(font_utils._TEXT_LAYOUT_CACHE) == 1
+
+    target = pygame.Surface((120, 200))
+    blit_text_wrapped(target, text, font, (255, 255, 255), (0, 0), 80)
+    blit_text_wrapped(target, text, font, (255, 255, 255), (0, 0), 80)
+    assert len(font_utils._TEXT_LAYOUT_CACHE) == 2
+
+    clear_font_cache()
+    assert not font_utils._TEXT_LAYOUT_CACHE
+
+
+def test_text_layout_cache_is_bounded(monkeypatch) -> None:
+    _init_pygame()
+    clear_font_cache()
+    monkeypatch.setattr(font_utils, "TEXT_LAYOUT_CACHE_LIMIT", 4)
+    font = load_font(None, 16)
+
+    for idx in range(10):
+        wrap_text(f"line {idx}", font, 200)
+
+    assert len(font_utils._TEXT_LAYOUT_CACHE) == 4
+    assert wrap_text("line 9", font, 200) == ["line 9"]
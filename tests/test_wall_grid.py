@@ -0,0 +1,132 @@
+import pygame
+
+from zombie_escape.colors import get_environment_palette
+from zombie_escape.entities import SteelBeam, Wall, WallGrid, WallKind
+from zombie_escape.entities.wall_grid import WALL_DAMAGE_LEVELS, WallSurfacePool
+
+
+def _init_pygame() -> None:
+    if not pygame.get_init():
+        pygame.init()
+
+
+def _grid(
+    pool: WallSurfacePool | None = None,
+) -> tuple[WallGrid, pygame.sprite.Group, pygame.sprite.LayeredUpdates]:
+    _init_pygame()
+    grid = WallGrid(cols=4, rows=2, cell_size=20, palette=None, pool=pool)
+    grid.add_wall(0, 0, WallKind.INNER, health=40)
+    grid.add_wall(1, 0, WallKind.INNER, health=40)
+    grid.add_beam(2, 0, health=30)
+    grid.add_wall(2, 0, WallKind.INNER, health=40)
+    grid.add_beam(3, 1, health=30)
+    wall_group = pygame.sprite.Group()
+    all_sprites = pygame.sprite.LayeredUpdates()
+    grid.populate(wall_group, all_sprites, layer=1)
+    return grid, wall_group, all_sprites
+
+
+def test_wall_grid_views_share_surfaces_by_look() -> None:
+    grid, wall_group, _ = _grid()
+    left, right = grid.wall_at((0, 0)), grid.wall_at((1, 0))
+    assert isinstance(left, Wall) and isinstance(right, Wall)
+    assert isinstance(grid.beam_at((3, 1)), SteelBeam)
+    assert grid.beam_at((2, 0)) is None  # hidden under the wall
+    assert len(wall_group) == 4
+    assert left.image is right.image
+    assert left.rect == pygame.Rect(0, 0, 20, 20)
+
+
+def test_wall_grid_damage_tracks_exact_health_and_quantized_look() -> None:
+    grid, _, _ = _grid()
+    wall = grid.wall_at((0, 0))
+    neighbour = grid.wall_at((1, 0))
+    assert wall is not None and neighbour is not None
+    wall._take_damage(amount=1)
+    assert wall.health == 39
+    assert grid.damage_level[0, 0] == WALL_DAMAGE_LEVELS - 1
+    assert wall.image is not neighbour.image
+    neighbour._take_damage(amount=1)
+    assert neighbour.health == 39
+
+
+def test_wall_grid_destroyed_wall_exposes_beam() -> None:
+    grid, wall_group, all_sprites = _grid()
+    destroyed: list[tuple[tuple[int, int], bool]] = []
+    grid.on_wall_destroyed = lambda cell, beam: destroyed.append((cell, beam))
+    wall = grid.wall_at((2, 0))
+    assert wall is not None
+    wall._take_damage(amount=40)
+    assert destroyed == [((2, 0), True)]
+    assert not wall.alive()
+    assert grid.wall_at((2, 0)) is None
+    beam = grid.beam_at((2, 0))
+    assert beam is not None and beam in wall_group and beam in all_sprites
+    beam._take_damage(amount=30)
+    assert not beam.alive()
+    assert grid.beam_at((2, 0)) is None
+
+
+def test_wall_grid_set_palette_swaps_surfaces() -> None:
+    grid, _, _ = _grid()
+    wall = grid.wall_at((0, 0))
+    assert wall is not None
+    before = wall.image
+    wall.set_palette(None)
+    assert wall.image is before  # same palette: nothing to repaint
+    dawn = get_environment_palette("dawn")
+    grid.set_palette(dawn)
+    assert grid.palette is dawn
+    assert wall.image is not before
+    assert grid.wall_key((0, 0))[3] is dawn
+
+
+def test_wall_surface_pool_shares_and_refcounts_across_grids() -> None:
+    pool = WallSurfacePool(idle_limit=8)
+    first, first_walls, _ = _grid(pool)
+    second, second_walls, _ = _grid(pool)
+    for view in [*first_walls, *second_walls]:
+        assert view.image is not None  # views acquire lazily
+    wall = first.wall_at((0, 0))
+    other = second.wall_at((0, 0))
+    assert wall is not None and other is not None
+    assert wall.image is other.image
+    key = first.wall_key((0, 0))
+    assert pool.refcount(key) == 6  # three identical inner walls per grid
+
+    wall._take_damage(amount=40)
+    assert pool.refcount(key) == 5
+    first.set_palette(get_environment_palette("dawn"))
+    assert pool.refcount(key) == 3
+
+    painted = len(pool)
+    pool.release(key, 3)
+    assert pool.refcount(key) == 0
+    assert len(pool) == painted  # idle, not dropped
+    pool.clear_idle()
+    assert len(pool) < painted
+
+
+def test_wall_grid_palette_switch_reuses_prebaked_surfaces(monkeypatch) -> None:
+    pool = WallSurfacePool()
+    grid, wall_group, _ = _grid(pool)
+    for view in wall_group:
+        assert view.image is not None
+    dawn = get_environment_palette("dawn")
+    queued = grid.prepare_palettes([None, dawn])
+    assert queued == 4  # inner wall + beam looks, per palette
+    assert grid.prepare_palettes([dawn]) == 0
+    assert grid.bake_pending(limit=1) == 3
+    assert grid.bake_pending(limit=8) == 0
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("palette switch repainted a prebaked surface")
+
+    monkeypatch.setattr(grid, "_paint_wall", _fail)
+    monkeypatch.setattr(grid, "_paint_beam", _fail)
+    wall = grid.wall_at((0, 0))
+    assert wall is not None
+    grid.set_palette(dawn)
+    assert wall._surface is not None
+    assert wall.image is grid.wall_at((1, 0)).image
+    assert pool.refcount(grid.wall_key((0, 0))) == 4  # 3 views + prebake